@@ -271,6 +271,23 @@
   }
 
   function loadPuzzleTokens() {
+    // Precompiled by scripts/compile_tokens.py: UTF-16 offsets + error token indices
+    if (Array.isArray(currentPuzzle.tokens) && Array.isArray(currentPuzzle.error_tokens)) {
+      const text = currentPuzzle.text;
+      tokens = currentPuzzle.tokens.map(([start, wordStart, wordEnd, end], i) => ({
+        index: i,
+        prefix: text.slice(start, wordStart),
+        word: text.slice(wordStart, wordEnd),
+        suffix: text.slice(wordEnd, end),
+        raw: text.slice(start, end),
+      }));
+      errorMap = {};
+      currentPuzzle.error_tokens.forEach((tokenIdx, i) => {
+        if (tokenIdx !== null) errorMap[tokenIdx] = currentPuzzle.errors[i];
+      });
+      return;
+    }
+
     tokens = tokenize(currentPuzzle.text);
     errorMap = {};
     // Match each error's wrong word to its token index
@@ -297,6 +314,8 @@
 
   // ─── Token Parsing ────────────────────────────────────────────
 
+  // Mirrored by tokenize_spans() in scripts/validate.py — run
+  // scripts/compile_tokens.py --check-only after changing either.
   function tokenize(text) {
     return text.split(/\s+/).map((raw, i) => {
       const match = raw.match(/^([^a-zA-Z''\u2019-]*)(.+?)([^a-zA-Z''\u2019-]*)$/);
@@ -439,7 +458,7 @@
       if (isCorrect) {
         // FOUND IT
         activeGame.found.push(selectedWordIdx);
-        activeGame.clickOrder.push({ idx: selectedWordIdx, correct: true });
+        activeGame.clickOrder.push({ idx: selectedWordIdx, correct: true, guess });
 
         const wordEl = document.querySelector(`#passage .word[data-index="${selectedWordIdx}"]`);
         if (wordEl) {
@@ -476,7 +495,7 @@
       // MISS — costs a take
       activeGame.misses.push(selectedWordIdx);
       activeGame.takesLeft--;
-      activeGame.clickOrder.push({ idx: selectedWordIdx, correct: false });
+      activeGame.clickOrder.push({ idx: selectedWordIdx, correct: false, guess });
 
       const wordEl = document.querySelector(`#passage .word[data-index="${selectedWordIdx}"]`);
       if (wordEl) {
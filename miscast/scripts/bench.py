@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+MISCAST Validator Benchmarks
+Synthesizes vaults of N days with realistic passages and times the validator.
+
+Passages follow the lengths in GENERATION_PROMPT.md (easy ~40-60 words,
+medium ~80-120, hard ~140-200), always within DIFFICULTY_RULES. Errors are drawn
+from the homophone lexicon, so every synthetic day is valid. The same seed
+always produces the same vault.
+
+Phases per vault size:
+  tokenize         tokenize() over every passage (in memory)
+  validate_puzzle  validate_puzzle() over every passage (in memory)
+  validate_day     validate_day() for every date (reads each file)
+  all_cold         `validate.py --all --no-cache` end to end, in a subprocess
+  all_warm         `validate.py --all` end to end with a primed result cache
+
+Usage:
+  python bench.py                              # 1k, 10k and 100k days
+  python bench.py --sizes 1000 --out results.json
+  python bench.py --sizes 1000,10000 --baseline results.json --threshold 0.2
+"""
+
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from lexicon import get_lexicon
+from validate import DIFFICULTY_RULES, VALIDATOR_VERSION, tokenize, validate_day, validate_puzzle
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+# Target passage lengths from GENERATION_PROMPT.md
+PASSAGE_WORDS = {"easy": (40, 60), "medium": (80, 120), "hard": (140, 200)}
+
+FILLER = (
+    "podcast episode listener audience host guest interview microphone studio story "
+    "season format feedback editing recording schedule growth creative thoughtful "
+    "conversation community download sponsor network platform segment topic series "
+    "producer voice sound quality honest careful simple steady every most often "
+    "always really still never between across during after before around because "
+    "while although people show work time ideas craft habit moment question answer "
+    "sharing building finding making keeping learning starting telling listening "
+    "and but or so the a an of in on with from into about than that this"
+).split()
+
+
+def synthesize_day(rng, date_str, lexicon_sets):
+    """Build one valid vault day for date_str."""
+    day = {"date": date_str}
+    used = set()
+    for difficulty, rules in DIFFICULTY_RULES.items():
+        lo, hi = PASSAGE_WORDS[difficulty]
+        lo, hi = max(lo, rules["min_words"]), min(hi, rules["max_words"])
+        n_words = rng.randint(lo, hi)
+        n_errors = rules["min_errors"]
+
+        pairs = []
+        for members in rng.sample(lexicon_sets, len(lexicon_sets)):
+            if members[0] not in used and len(members) > 1:
+                pairs.append(members)
+                used.update(members)
+            if len(pairs) == n_errors:
+                break
+
+        words = [rng.choice(FILLER) for _ in range(n_words - n_errors)]
+        for members in pairs:
+            words.insert(rng.randrange(len(words) + 1), members[0])
+        for i in range(rng.randint(8, 14), len(words), rng.randint(8, 14)):
+            words[i - 1] += "."
+        words[0] = words[0].capitalize()
+        text = " ".join(words).rstrip(".") + "."
+
+        day[difficulty] = {
+            "id": f"{difficulty[0]}1-{date_str.replace('-', '')}",
+            "theme": f"{rng.choice(FILLER).title()} {rng.choice(FILLER).title()}",
+            "text": text,
+            "errors": [{"wrong": m[0], "right": [m[1]]} for m in pairs],
+        }
+    return day
+
+
+def synthesize_vault(vault_dir, days, seed=0):
+    """Write `days` synthetic vault files into vault_dir. Returns the list of day dicts."""
+    rng = random.Random(seed)
+    # Skip sets whose members appear in the filler text, so each wrong word stays unique
+    filler = set(FILLER)
+    lexicon_sets = [s for s in get_lexicon().sets if not filler.intersection(s)]
+    start = date(2030, 1, 1)
+    out = []
+    for i in range(days):
+        date_str = (start + timedelta(days=i)).isoformat()
+        day = synthesize_day(rng, date_str, lexicon_sets)
+        with open(vault_dir / f"{date_str}.json", "w") as f:
+            json.dump(day, f, indent=2)
+        out.append(day)
+    return out
+
+
+def _peak_rss_mb(who=resource.RUSAGE_SELF):
+    return round(resource.getrusage(who).ru_maxrss / 1024, 1)  # ru_maxrss is KiB on Linux
+
+
+def _record(size, phase, items, seconds, peak_rss_mb):
+    result = {
+        "size": size,
+        "phase": phase,
+        "items": items,
+        "seconds": round(seconds, 4),
+        "per_sec": round(items / seconds, 1) if seconds else None,
+        "peak_rss_mb": peak_rss_mb,
+    }
+    print(f"  {phase:<16} {items:>8} items  {seconds:>9.3f}s  "
+          f"{result['per_sec'] or 0:>12,.0f}/s  peak RSS {peak_rss_mb} MB")
+    return result
+
+
+def _run_all(vault, extra, cache_file):
+    """Time `validate.py --all` in a child process. Returns (seconds, child peak RSS MB)."""
+    cmd = [sys.executable, str(SCRIPT_DIR / "validate.py"), "--all", "--vault-dir", str(vault),
+           "--cache-file", str(cache_file), *extra]
+    # stderr goes to a file, not a pipe: nothing reads a pipe during wait4, so a chatty child would block
+    with tempfile.TemporaryFile() as stderr:
+        started = time.perf_counter()
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr)
+        _, status, usage = os.wait4(proc.pid, 0)
+        seconds = time.perf_counter() - started
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        if proc.returncode not in (0, 1):
+            stderr.seek(0)
+            raise RuntimeError(f"validate.py --all exited {proc.returncode}: {stderr.read().decode()[:500]}")
+    return seconds, round(usage.ru_maxrss / 1024, 1)
+
+
+def bench_size(size, seed=0):
+    """Run every phase against a fresh synthetic vault of `size` days."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="miscast-bench-") as tmp:
+        vault = Path(tmp) / "vault"
+        vault.mkdir()
+        cache_file = Path(tmp) / "validate-results.json"
+
+        started = time.perf_counter()
+        days = synthesize_vault(vault, size, seed)
+        print(f"\n{size:,} days (synthesized in {time.perf_counter() - started:.1f}s)")
+
+        passages = [(day[d], d) for day in days for d in DIFFICULTY_RULES]
+
+        started = time.perf_counter()
+        for puzzle, _ in passages:
+            tokenize(puzzle["text"])
+        results.append(_record(size, "tokenize", len(passages), time.perf_counter() - started, _peak_rss_mb()))
+
+        started = time.perf_counter()
+        invalid = sum(bool(validate_puzzle(puzzle, d)) for puzzle, d in passages)
+        results.append(_record(size, "validate_puzzle", len(passages), time.perf_counter() - started, _peak_rss_mb()))
+        if invalid:
+            raise RuntimeError(f"{invalid} synthetic passages failed validation — synthesizer is broken")
+
+        started = time.perf_counter()
+        for day in days:
+            validate_day(day["date"], vault)
+        results.append(_record(size, "validate_day", size, time.perf_counter() - started, _peak_rss_mb()))
+
+        seconds, rss = _run_all(vault, ["--no-cache"], cache_file)
+        results.append(_record(size, "all_cold", size, seconds, rss))
+
+        _run_all(vault, [], cache_file)  # prime the cache
+        seconds, rss = _run_all(vault, [], cache_file)
+        results.append(_record(size, "all_warm", size, seconds, rss))
+    return results
+
+
+def check_regressions(results, baseline, threshold):
+    """Return messages for phases whose throughput fell more than `threshold` below baseline."""
+    base = {(r["size"], r["phase"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        b = base.get((r["size"], r["phase"]))
+        if not b or not b.get("per_sec") or not r.get("per_sec"):
+            continue
+        change = r["per_sec"] / b["per_sec"] - 1
+        if change < -threshold:
+            regressions.append(
+                f"{r['phase']} @ {r['size']:,} days: {r['per_sec']:,.0f}/s vs baseline "
+                f"{b['per_sec']:,.0f}/s ({change:+.0%})"
+            )
+    return regressions
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark the MISCAST validator on synthetic vaults")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated vault sizes in days (default: 1000,10000,100000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic vault")
+    parser.add_argument("--out", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed throughput drop vs baseline before failing (default: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = []
+    for size in sizes:
+        results.extend(bench_size(size, args.seed))
+
+    report = {
+        "meta": {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "validator_version": VALIDATOR_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = check_regressions(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for r in regressions:
+                print(f"   {r}")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+MISCAST Token Stream Compiler
+Precomputes the token stream for every vault puzzle so the client can skip
+tokenizing and the validator checks exactly the tokens players see.
+
+For each day it writes a copy of the vault JSON where every difficulty also has:
+  "tokens":       [[start, word_start, word_end, end], ...]  UTF-16 offsets into "text"
+  "error_tokens": [token index or null, ...]                  one per entry in "errors"
+
+Offsets are UTF-16 code units because that is how game.js slices strings.
+The output is a superset of the vault schema, so it can be served in place of
+vault/ at deploy time; game.js uses the precomputed tokens when present.
+
+Before compiling, the Python tokenizer (validate.tokenize_spans) is checked
+against tokenize() in game.js over tokenizer_corpus.json plus every vault
+passage. Any divergence fails the build. The check needs `node` on PATH.
+
+Usage:
+  python compile_tokens.py [--vault-dir /path/to/vault] [--out-dir /path/to/out]
+  python compile_tokens.py --check-only
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from validate import VAULT_DIR, tokenize_spans
+
+GAME_JS = Path(__file__).parent.parent / "game.js"
+CORPUS_FILE = Path(__file__).parent / "tokenizer_corpus.json"
+OUT_DIR = Path(__file__).parent.parent / "compiled"
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+# Runs the client's own tokenize() over each text and returns its tokens,
+# plus the prefix/word/suffix obtained by slicing with the Python offsets.
+_NODE_HARNESS = """
+const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+%s
+process.stdout.write(JSON.stringify(input.map(({ text, spans }) => ({
+  tokens: tokenize(text).map(t => [t.prefix, t.word, t.suffix]),
+  sliced: spans.map(([s, ws, we, e]) => [text.slice(s, ws), text.slice(ws, we), text.slice(we, e)]),
+}))));
+"""
+
+
+class ConformanceError(Exception):
+    pass
+
+
+def _utf16_offsets(text):
+    """Map each code point index in text (plus len) to its UTF-16 offset."""
+    if text.isascii():
+        return range(len(text) + 1)
+    offsets = [0]
+    n = 0
+    for ch in text:
+        n += 2 if ord(ch) > 0xFFFF else 1
+        offsets.append(n)
+    return offsets
+
+
+def compile_puzzle(puzzle):
+    """Return (tokens, error_tokens) for one puzzle, mirroring loadPuzzleTokens() in game.js."""
+    text = puzzle["text"]
+    spans = tokenize_spans(text)
+    u16 = _utf16_offsets(text)
+    tokens = [[u16[s], u16[ws], u16[we], u16[e]] for s, ws, we, e in spans]
+
+    # First not-yet-claimed token whose word matches, same as the client
+    positions = {}
+    for i, (_, ws, we, _) in enumerate(spans):
+        positions.setdefault(text[ws:we].lower(), []).append(i)
+    claimed = set()
+    error_tokens = []
+    for err in puzzle.get("errors", []):
+        match = None
+        for i in positions.get(str(err.get("wrong", "")).lower(), ()):
+            if i not in claimed:
+                match = i
+                claimed.add(i)
+                break
+        error_tokens.append(match)
+    return tokens, error_tokens
+
+
+def compile_day(data):
+    """Return a copy of a vault day with token streams added to each difficulty."""
+    out = dict(data)
+    for difficulty in DIFFICULTIES:
+        puzzle = data.get(difficulty)
+        if not isinstance(puzzle, dict) or "text" not in puzzle:
+            continue
+        tokens, error_tokens = compile_puzzle(puzzle)
+        out[difficulty] = {**puzzle, "tokens": tokens, "error_tokens": error_tokens}
+    return out
+
+
+def _extract_js_function(source, name):
+    """Pull `function name(...) { ... }` out of a JS source file by brace matching."""
+    m = re.search(rf"function {re.escape(name)}\s*\(", source)
+    if not m:
+        raise ConformanceError(f"function {name}() not found in {GAME_JS}")
+    depth = 0
+    for i in range(source.index("{", m.end()), len(source)):
+        if source[i] == "{":
+            depth += 1
+        elif source[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return source[m.start():i + 1]
+    raise ConformanceError(f"Unbalanced braces in {name}() in {GAME_JS}")
+
+
+def check_conformance(texts):
+    """Raise ConformanceError if the Python and game.js tokenizers disagree on any text."""
+    node = shutil.which("node")
+    if not node:
+        raise ConformanceError("node is required to check tokenizer conformance (or pass --skip-conformance)")
+
+    tokenize_js = _extract_js_function(GAME_JS.read_text(), "tokenize")
+    payload = []
+    for text in texts:
+        u16 = _utf16_offsets(text)
+        spans = [[u16[s], u16[ws], u16[we], u16[e]] for s, ws, we, e in tokenize_spans(text)]
+        payload.append({"text": text, "spans": spans})
+
+    proc = subprocess.run(
+        [node, "-e", _NODE_HARNESS % tokenize_js],
+        input=json.dumps(payload), capture_output=True, text=True, timeout=60,
+    )
+    if proc.returncode != 0:
+        raise ConformanceError(f"node harness failed: {proc.stderr.strip()[:500]}")
+
+    failures = []
+    for item, result in zip(payload, json.loads(proc.stdout)):
+        text = item["text"]
+        expected = [[text[s:ws], text[ws:we], text[we:e]] for s, ws, we, e in tokenize_spans(text)]
+        if result["tokens"] != expected:
+            failures.append(f"tokens differ for {text[:60]!r}: js={result['tokens'][:8]} py={expected[:8]}")
+        elif result["sliced"] != result["tokens"]:
+            failures.append(f"offsets misalign for {text[:60]!r}")
+    if failures:
+        raise ConformanceError("\n   ".join([f"{len(failures)} tokenizer divergence(s):"] + failures))
+
+
+def _vault_texts(vault):
+    for f in sorted(vault.glob("*.json")):
+        try:
+            data = json.loads(f.read_bytes())
+        except json.JSONDecodeError:
+            continue
+        for difficulty in DIFFICULTIES:
+            puzzle = data.get(difficulty)
+            if isinstance(puzzle, dict) and isinstance(puzzle.get("text"), str):
+                yield puzzle["text"]
+
+
+def compile_vault(vault_dir=None, out_dir=None):
+    """Write a compiled copy of every vault day to out_dir. Returns (compiled, unresolved) counts."""
+    vault = Path(vault_dir) if vault_dir else VAULT_DIR
+    out = Path(out_dir) if out_dir else OUT_DIR
+    out.mkdir(parents=True, exist_ok=True)
+
+    compiled = 0
+    unresolved = 0
+    for f in sorted(vault.glob("*.json")):
+        try:
+            data = json.loads(f.read_bytes())
+        except json.JSONDecodeError as e:
+            print(f"❌ {f.stem}: Invalid JSON: {e}")
+            unresolved += 1
+            continue
+
+        day = compile_day(data)
+        for difficulty in DIFFICULTIES:
+            missing = [i for i, t in enumerate(day.get(difficulty, {}).get("error_tokens", [])) if t is None]
+            if missing:
+                unresolved += 1
+                print(f"⚠️  {f.stem} {difficulty}: error(s) {missing} not found in text")
+
+        tmp = out / f"{f.name}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump(day, fh, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, out / f.name)
+        compiled += 1
+    return compiled, unresolved
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Compile MISCAST vault puzzles into token streams")
+    parser.add_argument("--vault-dir", help="Override vault directory path")
+    parser.add_argument("--out-dir", help=f"Output directory (default: {OUT_DIR})")
+    parser.add_argument("--check-only", action="store_true", help="Only run the tokenizer conformance check")
+    parser.add_argument("--skip-conformance", action="store_true", help="Compile without the node conformance check")
+    args = parser.parse_args()
+
+    vault = Path(args.vault_dir) if args.vault_dir else VAULT_DIR
+
+    if not args.skip_conformance:
+        texts = json.loads(CORPUS_FILE.read_text()) + list(_vault_texts(vault))
+        try:
+            check_conformance(texts)
+        except ConformanceError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✅ Tokenizers agree on {len(texts)} text(s)")
+
+    if args.check_only:
+        sys.exit(0)
+
+    compiled, unresolved = compile_vault(vault, args.out_dir)
+    print(f"✅ Compiled {compiled} day(s) into {args.out_dir or OUT_DIR}")
+    sys.exit(1 if unresolved else 0)
+
+
+if __name__ == "__main__":
+    main()
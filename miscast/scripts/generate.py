@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+MISCAST Daily Puzzle Generator
+Generates a day's easy/medium/hard MISCAST puzzles using the DoneCast AI
+infrastructure (Gemini/Vertex AI) and writes them to the vault.
+
+The three difficulties are generated concurrently. Each is validated with
+validate.validate_puzzle as soon as it arrives, and only a failing difficulty
+is retried, with the validator's issues fed back into its prompt. The day file
+is written atomically once all three pass.
+
+Usage:
+  cd /path/to/donecast/backend
+  PYTHONPATH=. python3 ../miscast/scripts/generate.py
+  PYTHONPATH=. python3 ../miscast/scripts/generate.py --date 2026-03-01
+  PYTHONPATH=. python3 ../miscast/scripts/generate.py --dry-run
+  PYTHONPATH=. python3 ../miscast/scripts/generate.py --force  # overwrite existing
+
+Exit codes:
+  0 = success (day generated and saved)
+  1 = failure
+  2 = already exists (no-op, success)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+# Allow running from donecast/backend or miscast/scripts
+_BACKEND_PATH = None
+for _candidate in [
+    os.path.join(os.path.dirname(__file__), '..', '..', 'donecast', 'backend'),
+    os.path.join(os.path.dirname(__file__), '..', 'backend'),
+    os.getcwd(),
+]:
+    _abs = os.path.abspath(_candidate)
+    if os.path.exists(os.path.join(_abs, 'api', 'core', 'database.py')):
+        _BACKEND_PATH = _abs
+        sys.path.insert(0, _abs)
+        break
+
+if not _BACKEND_PATH:
+    print("ERROR: Cannot find DoneCast backend. Run from donecast/backend/ with PYTHONPATH=.", file=sys.stderr)
+    sys.exit(1)
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from validate import DIFFICULTY_RULES, VAULT_DIR, validate_data, validate_puzzle  # noqa: E402
+from reuse_index import day_entries, open_index  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+)
+log = logging.getLogger("miscast.generate")
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+
+# ─── Prompts ─────────────────────────────────────────────────────────────────
+
+SYSTEM_PROMPT = """\
+You are a puzzle writer for MISCAST, a daily podcast-themed word puzzle game.
+Players read a passage where some words have been replaced with similar-sounding
+imposters (homophones) and must find and correct the "miscast" words.
+
+Critical rules:
+1. Each "wrong" word must be a REAL English word (not a typo)
+2. Each wrong word must appear EXACTLY ONCE in the passage
+3. Each wrong word must SOUND SIMILAR to the correct word (homophone or near-homophone)
+4. The passage must read naturally — not forced or awkward
+
+Always return valid JSON matching the exact schema provided.
+"""
+
+DIFFICULTY_BRIEFS = {
+    "easy": (
+        "Short, easily digestible passage. OBVIOUS homophones (their/there, to/too, "
+        "your/you're, know/no, weak/week). The wrong word should clearly NOT fit the "
+        "context. Topics: everyday life, simple advice, casual tone."
+    ),
+    "medium": (
+        "Moderate length, interesting topic. MIX of common and less common homophones "
+        "(altar/alter, manor/manner, cord/chord, patients/patience). Some errors should "
+        "require a second read. Topics: podcasting, creativity, business, technology."
+    ),
+    "hard": (
+        "Longer, dense passage. TRICKY homophones (affect/effect, complement/compliment, "
+        "principal/principle, discrete/discreet). Errors should almost work in context. "
+        "Topics: industry analysis, science, philosophy, media criticism."
+    ),
+}
+
+
+def build_prompt(
+    target_date: date,
+    difficulty: str,
+    recent_themes: list[str],
+    avoid_pairs: Optional[list[str]] = None,
+) -> str:
+    rules = DIFFICULTY_RULES[difficulty]
+    themes = ", ".join(recent_themes[-20:]) if recent_themes else "none"
+    pairs = ", ".join(avoid_pairs) if avoid_pairs else "none"
+    return f"""\
+Generate the {difficulty.upper()} MISCAST puzzle for {target_date.isoformat()}.
+
+{DIFFICULTY_BRIEFS[difficulty]}
+
+Requirements:
+1. Exactly {rules['min_errors']} errors
+2. Passage length {rules['min_words']}-{rules['max_words']} words
+3. Each "wrong" word appears exactly once in "text"; "right" lists the accepted corrections
+4. Recent themes (DO NOT repeat): {themes}
+5. Homophone pairs already used today (DO NOT reuse): {pairs}
+
+Return ONLY valid JSON matching this exact schema (no markdown, no explanation):
+{{
+  "theme": "Short Theme Title",
+  "text": "The full passage text with errors included...",
+  "errors": [
+    {{"wrong": "kneed", "right": ["need"]}}
+  ]
+}}
+"""
+
+
+# ─── AI Generation ────────────────────────────────────────────────────────────
+
+def call_ai(prompt: str, model: Optional[str] = None, attempt: int = 0) -> str:
+    """Call the DoneCast Gemini client and return the raw text response."""
+    from api.services.ai_content.client_gemini import generate
+
+    model_name = model or os.getenv("MISCAST_AI_MODEL") or os.getenv("DEFAULT_AI_MODEL") or "gemini-2.5-flash"
+
+    return generate(
+        prompt,
+        model=model_name,
+        temperature=0.8 + (attempt * 0.1),  # Slightly increase temp on retries for variety
+        max_tokens=2000,
+        system_instruction=SYSTEM_PROMPT,
+    )
+
+
+def extract_json(raw: str) -> dict:
+    """Extract and parse JSON from an AI response (strips markdown fences if present)."""
+    text = raw.strip()
+    if text.startswith("```"):
+        lines = [l for l in text.split("\n") if not l.startswith("```")]
+        text = "\n".join(lines).strip()
+
+    start = text.find("{")
+    end = text.rfind("}") + 1
+    if start == -1 or end == 0:
+        raise ValueError(f"No JSON object found in response. Got: {text[:200]!r}")
+    return json.loads(text[start:end])
+
+
+# ─── Core Generate Loop ───────────────────────────────────────────────────────
+
+MAX_ATTEMPTS = 4
+
+
+def generate_difficulty(
+    target_date: date,
+    difficulty: str,
+    recent_themes: list[str],
+    model: Optional[str] = None,
+    avoid_pairs: Optional[list[str]] = None,
+) -> dict:
+    """
+    Generate and validate one difficulty, retrying with the validator's issues fed back.
+    Returns the puzzle dict. Raises RuntimeError after MAX_ATTEMPTS.
+    """
+    base_prompt = build_prompt(target_date, difficulty, recent_themes, avoid_pairs)
+    prompt = base_prompt
+    last_error = None
+
+    for attempt in range(MAX_ATTEMPTS):
+        if attempt > 0:
+            wait = 2 ** attempt  # exponential backoff: 2, 4, 8 seconds
+            log.info(f"[{difficulty}] Retrying in {wait}s... (attempt {attempt + 1}/{MAX_ATTEMPTS})")
+            time.sleep(wait)
+
+        raw = ""
+        try:
+            log.info(f"[{difficulty}] Calling AI (attempt {attempt + 1})...")
+            raw = call_ai(prompt, model=model, attempt=attempt)
+            puzzle = extract_json(raw)
+            issues = validate_puzzle(puzzle, difficulty)
+            if not issues:
+                log.info(f"[{difficulty}] Validation passed ✅ theme={puzzle['theme']!r}")
+                return puzzle
+
+            last_error = "; ".join(issues)
+            log.warning(f"[{difficulty}] Attempt {attempt + 1} failed (validation): {last_error}")
+            issue_list = "\n".join(f"- {i}" for i in issues)
+            prompt = base_prompt + (
+                f"\n\nIMPORTANT: Your previous attempt had these problems:\n{issue_list}\n"
+                f"Fix all of them in your new response."
+            )
+
+        except (json.JSONDecodeError, ValueError) as e:
+            last_error = f"JSON parse error: {e}. Response: {raw[:300]!r}"
+            log.warning(f"[{difficulty}] Attempt {attempt + 1} failed (JSON): {last_error}")
+
+        except Exception as e:
+            last_error = f"Unexpected error: {e}"
+            log.error(f"[{difficulty}] Attempt {attempt + 1} failed (unexpected): {e}", exc_info=True)
+
+    raise RuntimeError(
+        f"Failed to generate a valid {difficulty} puzzle after {MAX_ATTEMPTS} attempts. "
+        f"Last error: {last_error}"
+    )
+
+
+def recent_themes_from_vault(target_date: date, vault_dir: Path, days: int = 30) -> list[str]:
+    """Return normalized themes used within `days` of target_date, oldest first."""
+    index = open_index(vault_dir)
+    lo = (target_date - timedelta(days=days)).isoformat()
+    hi = (target_date + timedelta(days=days)).isoformat()
+    themes = []
+    for date_str in sorted(d for d in index.days if lo <= d <= hi and d != target_date.isoformat()):
+        themes.extend(key for kind, key, _ in index.days[date_str]["entries"] if kind == "theme")
+    return themes
+
+
+def _same_day_pairs(puzzles: dict) -> dict[str, set[str]]:
+    """Return {difficulty: pairs also used by another difficulty of the same day}."""
+    entries = day_entries(puzzles)
+    by_diff = {d: {key for kind, key, diff in entries if kind == "pair" and diff == d} for d in puzzles}
+    return {
+        d: pairs & set().union(*(p for other, p in by_diff.items() if other != d))
+        for d, pairs in by_diff.items()
+    }
+
+
+def write_day(path: Path, day: dict) -> None:
+    """Write a vault day atomically: readers see the old file or the new one, never half."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(day, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def generate_day(
+    target_date: date,
+    dry_run: bool = False,
+    force: bool = False,
+    model: Optional[str] = None,
+    vault_dir: Optional[Path] = None,
+) -> dict:
+    """
+    Generate all three difficulties concurrently, validate, and save the day.
+    Returns the day dict on success, {} if it already exists.
+    Raises RuntimeError if any difficulty fails after MAX_ATTEMPTS.
+    """
+    vault = Path(vault_dir) if vault_dir else VAULT_DIR
+    path = vault / f"{target_date.isoformat()}.json"
+    if path.exists() and not force:
+        log.info(f"Puzzle for {target_date} already exists. Use --force to overwrite.")
+        return {}
+
+    recent_themes = recent_themes_from_vault(target_date, vault)
+    log.info(f"Generating MISCAST puzzles for {target_date} (avoiding {len(recent_themes)} recent themes)")
+
+    puzzles = {}
+    failures = []
+    with ThreadPoolExecutor(max_workers=len(DIFFICULTIES)) as pool:
+        futures = {
+            d: pool.submit(generate_difficulty, target_date, d, recent_themes, model)
+            for d in DIFFICULTIES
+        }
+        for difficulty, future in futures.items():
+            try:
+                puzzles[difficulty] = future.result()
+            except RuntimeError as e:
+                failures.append(str(e))
+    if failures:
+        raise RuntimeError(" | ".join(failures))
+
+    # GENERATION_PROMPT.md rule 5: no homophone pair reused across difficulties on one day.
+    # Concurrent prompts can't see each other, so regenerate the hardest clashing one.
+    for difficulty in reversed(DIFFICULTIES):
+        clashes = _same_day_pairs(puzzles)[difficulty]
+        if not clashes:
+            continue
+        log.warning(f"[{difficulty}] Reuses same-day pair(s) {sorted(clashes)} — regenerating")
+        others = sorted(set().union(*(
+            {key for kind, key, d in day_entries({o: puzzles[o]}) if kind == "pair"}
+            for o in DIFFICULTIES if o != difficulty
+        )))
+        puzzles[difficulty] = generate_difficulty(target_date, difficulty, recent_themes, model, avoid_pairs=others)
+
+    if any(_same_day_pairs(puzzles).values()):
+        raise RuntimeError(f"Could not remove same-day homophone pair reuse for {target_date}")
+
+    stamp = target_date.strftime("%Y%m%d")
+    day = {"date": target_date.isoformat()}
+    for difficulty in DIFFICULTIES:
+        day[difficulty] = {"id": f"{difficulty[0]}1-{stamp}", **puzzles[difficulty]}
+
+    results = validate_data(day)
+    if not results["valid"]:
+        raise RuntimeError(f"Assembled day failed validation: {json.dumps(results['details'])}")
+
+    if dry_run:
+        log.info("[DRY RUN] Would write:")
+        log.info(json.dumps(day, indent=2, ensure_ascii=False))
+        return day
+
+    write_day(path, day)
+    log.info(f"✅ MISCAST puzzles for {target_date} saved to {path}")
+    return day
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────────
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate a day of MISCAST puzzles using AI",
+        epilog="Run from donecast/backend/ with PYTHONPATH=.",
+    )
+    parser.add_argument("--date", default=None, help="Target date YYYY-MM-DD (default: tomorrow)")
+    parser.add_argument("--vault-dir", default=None, help="Override vault directory path")
+    parser.add_argument("--dry-run", action="store_true", help="Generate but don't write the vault file")
+    parser.add_argument("--force", action="store_true", help="Overwrite an existing vault file for this date")
+    parser.add_argument("--model", default=None, help="Override AI model name")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show debug logging")
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    if args.date:
+        try:
+            target_date = date.fromisoformat(args.date)
+        except ValueError:
+            log.error(f"Invalid date: {args.date!r}. Use YYYY-MM-DD.")
+            return 1
+    else:
+        target_date = date.today() + timedelta(days=1)
+
+    start = time.time()
+    try:
+        result = generate_day(
+            target_date,
+            dry_run=args.dry_run,
+            force=args.force,
+            model=args.model,
+            vault_dir=args.vault_dir,
+        )
+    except Exception as e:
+        log.error(f"❌ Generation failed: {e}", exc_info=not isinstance(e, RuntimeError))
+        return 1
+
+    if not result:
+        return 2
+    log.info(f"Done in {time.time() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+MISCAST Server-side Grader
+Replays submitted correction logs against the vault so leaderboard scores can
+be verified without trusting the client.
+
+Each day is compiled once into a lookup structure per difficulty:
+  token index -> error index           (resolved exactly as game.js does)
+  normalized candidate -> error index  (exact matches, one dict lookup)
+  candidate trie                       (walked by a bounded edit-distance
+                                        automaton when --max-edits > 0)
+
+Compiled days are kept in an LRU cache (--cache-days), so a long-running
+process grades any number of submissions for a day without re-reading or
+re-tokenizing it, however many distinct dates clients submit.
+
+Submissions are untrusted: a malformed one (bad date, wrong click shape, not
+an object, not JSON) gets an "invalid" result of its own instead of aborting
+the batch.
+
+A submission is the score payload game.js sends to /game/score:
+  {"puzzle_date": "YYYY-MM-DD", "difficulty": "easy", "found": 3,
+   "takes_remaining": 2, "won": true, "total_errors": 3,
+   "click_order": [{"idx": 12, "correct": true, "guess": "need"}, ...]}
+"guess" is optional; without it only the click positions are verified.
+
+Usage:
+  python grade.py submissions.ndjson [--vault-dir DIR] [--bundle FILE] [--max-edits 1]
+"""
+
+import json
+import re
+import sys
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+
+from compile_tokens import compile_puzzle
+from validate import VAULT_DIR
+
+# Mirrors DIFFICULTY_CONFIG.takes in puzzles.js
+TAKES = {"easy": 4, "medium": 5, "hard": 5}
+
+_END = "\0"
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+CACHE_DAYS = 64
+
+
+def normalize(guess):
+    """Normalize a correction the way submitCorrection() does: trim + lowercase."""
+    return guess.strip().lower()
+
+
+class LevenshteinAutomaton:
+    """
+    Automaton accepting strings within max_edits of `word`.
+    States are rows of the edit-distance table, capped at max_edits + 1.
+    """
+
+    def __init__(self, word, max_edits):
+        self.word = word
+        self.max_edits = max_edits
+
+    def start(self):
+        return tuple(min(i, self.max_edits + 1) for i in range(len(self.word) + 1))
+
+    def step(self, state, ch):
+        cap = self.max_edits + 1
+        row = [min(state[0] + 1, cap)]
+        for i, wc in enumerate(self.word):
+            cost = 0 if wc == ch else 1
+            row.append(min(row[i] + 1, state[i + 1] + 1, state[i] + cost, cap))
+        return tuple(row)
+
+    def is_match(self, state):
+        return state[-1] <= self.max_edits
+
+    def can_match(self, state):
+        return min(state) <= self.max_edits
+
+
+class CompiledPuzzle:
+    def __init__(self, puzzle, difficulty):
+        _, error_tokens = compile_puzzle(puzzle)
+        self.difficulty = difficulty
+        self.total_errors = len(puzzle.get("errors", []))
+        self.takes = TAKES.get(difficulty, 5)
+        self.error_at = {tok: i for i, tok in enumerate(error_tokens) if tok is not None}
+
+        self.candidates = {}
+        self.trie = {}
+        for i, err in enumerate(puzzle.get("errors", [])):
+            for right in err.get("right") or []:
+                key = normalize(right)
+                self.candidates.setdefault(key, set()).add(i)
+                node = self.trie
+                for ch in key:
+                    node = node.setdefault(ch, {})
+                node.setdefault(_END, set()).add(i)
+
+    def matching_errors(self, guess, max_edits=0):
+        """Return the error indices whose corrections match guess (within max_edits)."""
+        key = normalize(guess)
+        if max_edits <= 0:
+            return self.candidates.get(key, set())
+
+        automaton = LevenshteinAutomaton(key, max_edits)
+        found = set()
+        stack = [(self.trie, automaton.start())]
+        while stack:
+            node, state = stack.pop()
+            if _END in node and automaton.is_match(state):
+                found |= node[_END]
+            for ch, child in node.items():
+                if ch == _END:
+                    continue
+                nxt = automaton.step(state, ch)
+                if automaton.can_match(nxt):
+                    stack.append((child, nxt))
+        return found
+
+
+def compile_day(data):
+    """Return {difficulty: CompiledPuzzle} for one parsed vault day."""
+    return {
+        difficulty: CompiledPuzzle(data[difficulty], difficulty)
+        for difficulty in TAKES
+        if isinstance(data.get(difficulty), dict)
+    }
+
+
+def _is_date(value):
+    if not isinstance(value, str) or not DATE_RE.match(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def invalid_result(*issues):
+    """Result for a submission too malformed to replay."""
+    return {"valid": False, "invalid": True, "issues": list(issues)}
+
+
+def click_issues(click_order):
+    """Shape problems in a click_order: it must be a list of {"idx": int, "guess": str (optional)}."""
+    if click_order is None:
+        return []
+    if not isinstance(click_order, list):
+        return [f"click_order must be a list, got {type(click_order).__name__}"]
+    issues = []
+    for n, click in enumerate(click_order):
+        if not isinstance(click, dict):
+            issues.append(f"Click {n}: must be an object, got {type(click).__name__}")
+            continue
+        idx = click.get("idx")
+        if isinstance(idx, bool) or not isinstance(idx, int):
+            issues.append(f"Click {n}: idx must be an integer, got {idx!r}")
+        guess = click.get("guess")
+        if guess is not None and not isinstance(guess, str):
+            issues.append(f"Click {n}: guess must be a string, got {type(guess).__name__}")
+    return issues
+
+
+def grade_submission(puzzle, submission, max_edits=0):
+    """Replay one submission's click_order against a CompiledPuzzle. Returns a result dict."""
+    malformed = click_issues(submission.get("click_order"))
+    if malformed:
+        return invalid_result(*malformed)
+
+    issues = []
+    found = set()
+    takes = puzzle.takes
+    over = False
+
+    for n, click in enumerate(submission.get("click_order") or []):
+        if over:
+            issues.append(f"Click {n}: recorded after the game ended")
+            break
+        idx = click.get("idx")
+        error = puzzle.error_at.get(idx)
+
+        if error is None:
+            if click.get("correct"):
+                issues.append(f"Click {n}: token {idx} is not a miscast word")
+            takes -= 1
+        else:
+            if not click.get("correct"):
+                issues.append(f"Click {n}: token {idx} is miscast but recorded as a miss")
+            guess = click.get("guess")
+            if guess is not None and error not in puzzle.matching_errors(guess, max_edits):
+                issues.append(f"Click {n}: correction {guess!r} does not fix token {idx}")
+            if idx in found:
+                issues.append(f"Click {n}: token {idx} found twice")
+            found.add(idx)
+
+        over = takes <= 0 or len(found) == puzzle.total_errors
+
+    won = len(found) == puzzle.total_errors
+    claimed = {
+        "found": len(found),
+        "takes_remaining": takes,
+        "won": won,
+        "total_errors": puzzle.total_errors,
+    }
+    for field, actual in claimed.items():
+        if field in submission and submission[field] != actual:
+            issues.append(f"Claimed {field}={submission[field]!r}, replay gives {actual!r}")
+
+    return {"valid": not issues, **claimed, "issues": issues}
+
+
+class Grader:
+    """Grades submissions, compiling each vault day at most once."""
+
+    def __init__(self, vault_dir=None, bundle=None, max_edits=0, cache_days=CACHE_DAYS):
+        self.vault = Path(vault_dir) if vault_dir else VAULT_DIR
+        self.bundle = bundle
+        self.max_edits = max_edits
+        self.cache_days = max(1, cache_days)
+        self._days = OrderedDict()  # date_str -> compiled day, least recently used first
+
+    def day(self, date_str):
+        """Compiled day for a YYYY-MM-DD date (None if the vault has none). Raises ValueError for other strings."""
+        if not _is_date(date_str):
+            raise ValueError(f"puzzle_date must be a YYYY-MM-DD date, got {date_str!r}")
+        if date_str in self._days:
+            self._days.move_to_end(date_str)
+            return self._days[date_str]
+        if self.bundle is not None:
+            data = self.bundle.load(date_str)
+        else:
+            path = self.vault / f"{date_str}.json"
+            data = json.loads(path.read_bytes()) if path.exists() else None
+        self._days[date_str] = compile_day(data) if isinstance(data, dict) else None
+        if len(self._days) > self.cache_days:
+            self._days.popitem(last=False)
+        return self._days[date_str]
+
+    def grade(self, submission):
+        """Result dict for one submission; malformed input gives an invalid result, never an exception."""
+        if not isinstance(submission, dict):
+            return invalid_result(f"Submission must be an object, got {type(submission).__name__}")
+        date_str = submission.get("puzzle_date")
+        difficulty = submission.get("difficulty")
+        if not _is_date(date_str):
+            return invalid_result(f"puzzle_date must be a YYYY-MM-DD date, got {date_str!r}")
+        if not isinstance(difficulty, str):
+            return invalid_result(f"difficulty must be a string, got {difficulty!r}")
+        try:
+            day = self.day(date_str)
+        except (ValueError, TypeError) as e:
+            return {"valid": False, "issues": [f"Cannot load puzzle for {date_str}: {e}"]}
+        if not day:
+            return {"valid": False, "issues": [f"No puzzle for {date_str}"]}
+        if difficulty not in day:
+            return {"valid": False, "issues": [f"No {difficulty} puzzle for {date_str}"]}
+        return grade_submission(day[difficulty], submission, self.max_edits)
+
+    def grade_batch(self, submissions):
+        """Grade an iterable of submissions, yielding (submission, result) pairs."""
+        for submission in submissions:
+            yield submission, self.grade(submission)
+
+
+def _read_ndjson(path):
+    """Yield (line number, parsed value or None, error or None) for each non-blank line."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield lineno, json.loads(line), None
+            except json.JSONDecodeError as e:
+                yield lineno, None, f"Line {lineno}: invalid JSON: {e}"
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Verify MISCAST score submissions against the vault")
+    parser.add_argument("submissions", help="NDJSON file of score submissions ('-' for stdin)")
+    parser.add_argument("--vault-dir", help="Override vault directory path")
+    parser.add_argument("--bundle", help="Read days from a packed vault bundle (see vault_bundle.py)")
+    parser.add_argument("--max-edits", type=int, default=0,
+                        help="Accept corrections within N typos (default: 0, exact like the client)")
+    parser.add_argument("--cache-days", type=int, default=CACHE_DAYS,
+                        help=f"Compiled days kept in memory (default: {CACHE_DAYS})")
+    args = parser.parse_args()
+
+    bundle = None
+    if args.bundle:
+        from vault_bundle import open_bundle
+        vault = Path(args.vault_dir) if args.vault_dir else VAULT_DIR
+        bundle, problem = open_bundle(args.bundle, vault)
+        if problem:
+            if not any(vault.glob("*.json")):
+                print(f"❌ {problem}", file=sys.stderr)
+                sys.exit(2)
+            print(f"⚠️  {problem} — reading {vault} instead", file=sys.stderr)
+
+    grader = Grader(args.vault_dir, bundle=bundle, max_edits=args.max_edits, cache_days=args.cache_days)
+
+    all_valid = True
+    for lineno, submission, error in _read_ndjson("/dev/stdin" if args.submissions == "-" else args.submissions):
+        result = invalid_result(error) if error else grader.grade(submission)
+        fields = submission if isinstance(submission, dict) else {}
+        all_valid &= result["valid"]
+        print(json.dumps({
+            "line": lineno,
+            "puzzle_date": fields.get("puzzle_date"),
+            "difficulty": fields.get("difficulty"),
+            "user_id": fields.get("user_id"),
+            **result,
+        }, ensure_ascii=False, default=str))
+    sys.exit(0 if all_valid else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+MISCAST Homophone Lexicon
+Loads homophones.txt into a word -> homophone-set ID hash index.
+
+The file is the compact on-disk form: one set per non-comment line, and the
+line's position is the set ID. Loading is a single pass, and the loaded
+lexicon is cached per process so `validate.py --all` and watch mode pay for
+it once.
+
+Usage:
+  python lexicon.py WORD [WORD ...]   # show each word's homophone set
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+
+LEXICON_FILE = Path(__file__).parent / "homophones.txt"
+
+
+class LexiconError(Exception):
+    pass
+
+
+class Lexicon:
+    """Word -> homophone-set ID index. Words are stored lowercase."""
+
+    def __init__(self, sets, digest=""):
+        self.sets = [tuple(s) for s in sets]
+        self.digest = digest
+        self._index = {}
+        for set_id, words in enumerate(self.sets):
+            for word in words:
+                if word in self._index:
+                    raise LexiconError(f"'{word}' is listed in more than one homophone set")
+                self._index[word] = set_id
+
+    def set_id(self, word):
+        """Return the homophone-set ID for a word (case-insensitive), or None."""
+        return self._index.get(word.lower())
+
+    def homophones(self, word):
+        """Return the other members of a word's homophone set (empty if unknown)."""
+        set_id = self.set_id(word)
+        if set_id is None:
+            return ()
+        return tuple(w for w in self.sets[set_id] if w != word.lower())
+
+    def __contains__(self, word):
+        return word.lower() in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+
+def load_lexicon(path=None):
+    """Parse a homophone lexicon file into a Lexicon."""
+    path = Path(path) if path else LEXICON_FILE
+    raw = path.read_bytes()
+    sets = []
+    for line in raw.decode("utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        sets.append(line.lower().split())
+    return Lexicon(sets, digest=hashlib.sha256(raw).hexdigest())
+
+
+_lexicon = None
+
+def get_lexicon():
+    """Return the process-wide lexicon, loading it on first use."""
+    global _lexicon
+    if _lexicon is None:
+        _lexicon = load_lexicon()
+    return _lexicon
+
+
+def main():
+    words = sys.argv[1:]
+    if not words:
+        print(__doc__.strip())
+        sys.exit(1)
+    lexicon = get_lexicon()
+    for word in words:
+        others = lexicon.homophones(word)
+        print(f"{word}: {', '.join(others) if others else '(not in lexicon)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+MISCAST Reuse Index
+Inverted index over the vault for the GENERATION_PROMPT.md reuse rules:
+
+  homophone pair (wrong/right, unordered) -> [(day ordinal, difficulty), ...]
+  normalized theme                        -> [(day ordinal, difficulty), ...]
+
+Posting lists are kept sorted by day, so checking a day against a +/- N day
+window is a bisect per pair/theme rather than a rescan of the vault. The index
+is persisted in .cache/ and updated incrementally: only days whose file
+mtime/size changed are re-read.
+
+Usage:
+  python reuse_index.py --date YYYY-MM-DD --window 30
+  python validate.py --all --reuse-window 30
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from pathlib import Path
+
+VAULT_DIR = Path(__file__).parent.parent / "vault"
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+INDEX_VERSION = 1
+DIFFICULTIES = ["easy", "medium", "hard"]
+THEME_STOPWORDS = {"a", "an", "and", "the", "of", "for", "in", "on", "to", "your", "with"}
+
+
+def pair_key(wrong, right):
+    """Order-independent key for a homophone pair: 'their/there' == 'there/their'."""
+    return "/".join(sorted((wrong.lower(), right.lower())))
+
+
+def theme_key(theme):
+    """Normalize a theme for comparison: lowercase, punctuation and filler words dropped."""
+    words = re.findall(r"[a-z0-9]+", theme.lower())
+    return " ".join(w for w in words if w not in THEME_STOPWORDS) or theme.lower().strip()
+
+
+def day_entries(data):
+    """Return [(kind, key, difficulty), ...] for one parsed vault day."""
+    entries = []
+    for difficulty in DIFFICULTIES:
+        puzzle = data.get(difficulty)
+        if not isinstance(puzzle, dict):
+            continue
+        if isinstance(puzzle.get("theme"), str):
+            entries.append(("theme", theme_key(puzzle["theme"]), difficulty))
+        pairs = set()
+        for err in puzzle.get("errors") or []:
+            wrong = err.get("wrong")
+            for right in err.get("right") or []:
+                if isinstance(wrong, str) and isinstance(right, str):
+                    pairs.add(pair_key(wrong, right))
+        entries.extend(("pair", key, difficulty) for key in sorted(pairs))
+    return entries
+
+
+class ReuseIndex:
+    def __init__(self, vault_dir=None):
+        self.vault = Path(vault_dir).resolve() if vault_dir else VAULT_DIR.resolve()
+        self.days = {}  # date_str -> {"fp": [mtime_ns, size], "entries": [[kind, key, difficulty], ...]}
+        self.postings = {"pair": {}, "theme": {}}  # kind -> key -> sorted [[ordinal, difficulty], ...]
+
+    # ─── Persistence ─────────────────────────────────────────────
+
+    @property
+    def path(self):
+        """Where this vault's index is persisted (one file per vault directory)."""
+        tag = hashlib.sha1(str(self.vault).encode()).hexdigest()[:10]
+        return CACHE_DIR / f"reuse-index-{tag}.json"
+
+    @classmethod
+    def load(cls, vault_dir=None):
+        """Load the persisted index for this vault, or an empty one if missing/stale."""
+        index = cls(vault_dir)
+        try:
+            with open(index.path) as f:
+                saved = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return index
+        if saved.get("version") != INDEX_VERSION or saved.get("vault") != str(index.vault):
+            return index
+        index.days = saved["days"]
+        index.postings = saved["postings"]
+        return index
+
+    def save(self):
+        path = self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "vault": str(self.vault),
+                "days": self.days,
+                "postings": self.postings,
+            }, f)
+        os.replace(tmp, path)
+
+    # ─── Maintenance ─────────────────────────────────────────────
+
+    def _remove_day(self, date_str):
+        day = self.days.pop(date_str, None)
+        if not day:
+            return
+        ordinal = date.fromisoformat(date_str).toordinal()
+        for kind, key, difficulty in day["entries"]:
+            postings = self.postings[kind].get(key, [])
+            try:
+                postings.remove([ordinal, difficulty])
+            except ValueError:
+                pass
+            if not postings:
+                self.postings[kind].pop(key, None)
+
+    def _add_day(self, date_str, fp, entries):
+        ordinal = date.fromisoformat(date_str).toordinal()
+        self.days[date_str] = {"fp": fp, "entries": [list(e) for e in entries]}
+        for kind, key, difficulty in entries:
+            insort(self.postings[kind].setdefault(key, []), [ordinal, difficulty])
+
+    def update_day(self, path):
+        """Re-index one vault file (or drop it if it no longer exists). Returns True if changed."""
+        path = Path(path)
+        date_str = path.stem
+        try:
+            date.fromisoformat(date_str)
+        except ValueError:
+            return False
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            existed = date_str in self.days
+            self._remove_day(date_str)
+            return existed
+
+        fp = [st.st_mtime_ns, st.st_size]
+        if self.days.get(date_str, {}).get("fp") == fp:
+            return False
+
+        try:
+            data = json.loads(path.read_bytes())
+            entries = day_entries(data) if isinstance(data, dict) else []
+        except json.JSONDecodeError:
+            entries = []
+        self._remove_day(date_str)
+        self._add_day(date_str, fp, entries)
+        return True
+
+    def update(self):
+        """Bring the index up to date with the vault. Returns the number of days re-indexed."""
+        changed = 0
+        present = set()
+        for f in self.vault.glob("*.json"):
+            present.add(f.stem)
+            changed += self.update_day(f)
+        for date_str in list(self.days):
+            if date_str not in present:
+                self._remove_day(date_str)
+                changed += 1
+        return changed
+
+    # ─── Queries ─────────────────────────────────────────────────
+
+    def _nearby(self, kind, key, ordinal, window):
+        postings = self.postings[kind].get(key, [])
+        lo = bisect_left(postings, [ordinal - window, ""])
+        hi = bisect_right(postings, [ordinal + window, "~"])
+        return postings[lo:hi]
+
+    def check(self, date_str, window):
+        """
+        Return ({difficulty: [issue, ...]}, {difficulty: [warning, ...]}) for reuse on date_str.
+
+        A pair reused across difficulties on the same day is an issue; a pair or
+        theme also used on another day within `window` days is only a warning.
+        """
+        ordinal = date.fromisoformat(date_str).toordinal()
+        day = self.days.get(date_str)
+        issues, warnings = {}, {}
+        if not day:
+            return issues, warnings
+
+        for kind, key, difficulty in day["entries"]:
+            label = "Homophone pair" if kind == "pair" else "Theme"
+            same_day = []
+            nearby = []
+            for other_ordinal, other_diff in self._nearby(kind, key, ordinal, window):
+                if other_ordinal == ordinal:
+                    if other_diff != difficulty:
+                        same_day.append(other_diff)
+                else:
+                    nearby.append(f"{date.fromordinal(other_ordinal).isoformat()} {other_diff}")
+
+            if same_day and kind == "pair":
+                issues.setdefault(difficulty, []).append(
+                    f"{label} '{key}' reused on the same day ({', '.join(same_day)})")
+            if nearby:
+                shown = ", ".join(nearby[:3]) + (f" +{len(nearby) - 3} more" if len(nearby) > 3 else "")
+                warnings.setdefault(difficulty, []).append(f"{label} '{key}' used within {window} days ({shown})")
+        return issues, warnings
+
+
+def open_index(vault_dir=None):
+    """Load, refresh and persist the reuse index for a vault."""
+    index = ReuseIndex.load(vault_dir)
+    if index.update():
+        index.save()
+    return index
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Check MISCAST homophone-pair and theme reuse")
+    parser.add_argument("--date", required=True, help="Date to check (YYYY-MM-DD)")
+    parser.add_argument("--window", type=int, default=30, help="Days either side to check (default: 30)")
+    parser.add_argument("--vault-dir", help="Override vault directory path")
+    args = parser.parse_args()
+
+    index = open_index(args.vault_dir)
+    issues, warnings = index.check(args.date, args.window)
+    if not issues and not warnings:
+        print(f"✅ {args.date}: no reuse within {args.window} days")
+        sys.exit(0)
+    print(f"{'❌' if issues else '⚠️'} {args.date}")
+    for difficulty, found in issues.items():
+        for issue in found:
+            print(f"   {difficulty}: {issue}")
+    for difficulty, found in warnings.items():
+        for warning in found:
+            print(f"   ⚠️  {difficulty}: {warning}")
+    sys.exit(1 if issues else 0)
+
+
+if __name__ == "__main__":
+    main()
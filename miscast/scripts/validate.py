@@ -6,16 +6,30 @@ Validates puzzle JSON files for correctness.
 Usage:
   python validate.py [--date YYYY-MM-DD] [--vault-dir /path/to/vault]
   python validate.py --all  # validate all vault files
+  python validate.py --all --jobs 8 --no-cache
+  python validate.py --date YYYY-MM-DD --bundle /path/to/vault.bundle
+  python validate.py --all --reuse-window 30  # also check pair/theme reuse
+  python validate.py --watch [--reuse-window 30]  # revalidate edits as NDJSON
 """
 
+import hashlib
 import json
 import sys
 import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from lexicon import get_lexicon
+
 VAULT_DIR = Path(__file__).parent.parent / "vault"
+CACHE_DIR = Path(__file__).parent / ".cache"
+RESULT_CACHE_FILE = CACHE_DIR / "validate-results.json"
+
+# Bump whenever validation rules change so cached --all results are discarded.
+VALIDATOR_VERSION = 3
 
 DIFFICULTY_RULES = {
     "easy":   {"min_errors": 3, "max_errors": 3, "min_words": 25, "max_words": 80},
@@ -23,50 +37,72 @@ DIFFICULTY_RULES = {
     "hard":   {"min_errors": 7, "max_errors": 7, "min_words": 100, "max_words": 300},
 }
 
+# Mirrors tokenize() in game.js exactly: text.split(/\s+/), then this regex on
+# each piece. The whitespace set is JavaScript's \s, which differs from
+# Python's str.split() (e.g. U+FEFF, U+001C-U+001F). Keep the two in sync --
+# compile_tokens.py checks them against tokenizer_corpus.json.
+JS_WHITESPACE = "\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff"
+_SPLIT_RE = re.compile(f"[{JS_WHITESPACE}]+")
+_WORD_RE = re.compile(r"^([^a-zA-Z''\u2019-]*)(.+?)([^a-zA-Z''\u2019-]*)$")
+
+def _token_span(text, start, end):
+    m = _WORD_RE.match(text[start:end])
+    if not m:
+        return (start, start, end, end)
+    return (start, start + m.end(1), start + m.start(3), end)
+
+def tokenize_spans(text):
+    """
+    Split text into tokens exactly as the game client does.
+    Returns a list of (start, word_start, word_end, end) character offsets;
+    text[start:word_start] is the prefix, text[word_start:word_end] the word.
+    """
+    spans = []
+    pos = 0
+    for sep in _SPLIT_RE.finditer(text):
+        spans.append(_token_span(text, pos, sep.start()))
+        pos = sep.end()
+    spans.append(_token_span(text, pos, len(text)))
+    return spans
+
 def tokenize(text):
     """Split text into word tokens, stripping punctuation for matching."""
-    tokens = text.split()
-    result = []
-    for raw in tokens:
-        m = re.match(r"^([^a-zA-Z''\u2019-]*)(.+?)([^a-zA-Z''\u2019-]*)$", raw)
-        word = m.group(2) if m else raw
-        result.append(word)
-    return result
-
-def validate_puzzle(puzzle, difficulty):
-    """Validate a single puzzle. Returns list of error strings (empty = valid)."""
-    issues = []
-    rules = DIFFICULTY_RULES.get(difficulty)
-    if not rules:
-        issues.append(f"Unknown difficulty: {difficulty}")
-        return issues
+    return [text[ws:we] for _, ws, we, _ in tokenize_spans(text)]
 
-    # Required fields
-    for field in ["theme", "text", "errors"]:
-        if field not in puzzle:
-            issues.append(f"Missing field: {field}")
-    if issues:
-        return issues
+def index_tokens(tokens):
+    """Build a case-folded word -> [token positions] index in a single pass."""
+    index = {}
+    for i, token in enumerate(tokens):
+        index.setdefault(token.lower(), []).append(i)
+    return index
 
-    text = puzzle["text"]
-    errors = puzzle["errors"]
-    tokens = tokenize(text)
-    word_count = len(tokens)
+# ─── Puzzle Rules ────────────────────────────────────────────────
+# Each rule takes (puzzle, rules, tokens, index) and returns a list of issue
+# strings. The passage is tokenized and indexed once per puzzle; rules look
+# words up in the index instead of rescanning the text.
 
-    # Word count check
+def check_word_count(puzzle, rules, tokens, index):
+    issues = []
+    word_count = len(tokens)
     if word_count < rules["min_words"]:
         issues.append(f"Too short: {word_count} words (min {rules['min_words']})")
     if word_count > rules["max_words"]:
         issues.append(f"Too long: {word_count} words (max {rules['max_words']})")
+    return issues
 
-    # Error count check
+def check_error_count(puzzle, rules, tokens, index):
+    issues = []
+    errors = puzzle["errors"]
     if len(errors) < rules["min_errors"]:
         issues.append(f"Too few errors: {len(errors)} (need {rules['min_errors']})")
     if len(errors) > rules["max_errors"]:
         issues.append(f"Too many errors: {len(errors)} (max {rules['max_errors']})")
+    return issues
 
-    # Each error must have wrong + right fields
-    for i, err in enumerate(errors):
+def check_error_entries(puzzle, rules, tokens, index):
+    """Each error needs wrong + right, and its wrong word must appear exactly once."""
+    issues = []
+    for i, err in enumerate(puzzle["errors"]):
         if "wrong" not in err:
             issues.append(f"Error {i}: missing 'wrong' field")
             continue
@@ -75,38 +111,107 @@ def validate_puzzle(puzzle, difficulty):
             continue
 
         wrong_word = err["wrong"]
-
-        # Wrong word must appear exactly once in text
-        tokens_lower = [t.lower() for t in tokens]
-        wrong_lower = wrong_word.lower()
-        occurrences = tokens_lower.count(wrong_lower)
+        occurrences = len(index.get(wrong_word.lower(), ()))
 
         if occurrences == 0:
             issues.append(f"Error {i}: '{wrong_word}' not found in text")
         elif occurrences > 1:
             issues.append(f"Error {i}: '{wrong_word}' appears {occurrences} times (must be unique)")
+    return issues
 
-    # Check for duplicate wrong words
-    wrong_words = [e.get("wrong", "").lower() for e in errors]
+def check_duplicate_wrong_words(puzzle, rules, tokens, index):
+    wrong_words = [e.get("wrong", "").lower() for e in puzzle["errors"]]
     if len(wrong_words) != len(set(wrong_words)):
-        issues.append("Duplicate wrong words found")
+        return ["Duplicate wrong words found"]
+    return []
 
-    return issues
+PUZZLE_RULES = [
+    check_word_count,
+    check_error_count,
+    check_error_entries,
+    check_duplicate_wrong_words,
+]
 
-def validate_day(date_str, vault_dir=None):
-    """Validate all puzzles for a given date. Returns dict of results."""
-    vault = Path(vault_dir) if vault_dir else VAULT_DIR
-    filepath = vault / f"{date_str}.json"
+# ─── Lexicon Warnings ────────────────────────────────────────────
+# Same signature as the rules above, but their findings are warnings: they
+# flag likely problems for an editor without failing validation.
 
-    if not filepath.exists():
-        return {"valid": False, "error": f"File not found: {filepath}", "details": {}}
+def _as_words(value):
+    """An error's "wrong"/"right" field, which may be a string or a list, as a list of strings."""
+    return [w for w in (value if isinstance(value, list) else [value]) if isinstance(w, str)]
 
-    try:
-        with open(filepath) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        return {"valid": False, "error": f"Invalid JSON: {e}", "details": {}}
+def _error_words(puzzle, key):
+    words = set()
+    for err in puzzle["errors"]:
+        words.update(word.lower() for word in _as_words(err.get(key)))
+    return words
+
+def warn_right_word_in_text(puzzle, rules, tokens, index):
+    """A correction that already appears in the passage makes the puzzle ambiguous."""
+    warnings = []
+    for i, err in enumerate(puzzle["errors"]):
+        for right in _as_words(err.get("right")):
+            if right.lower() in index:
+                warnings.append(f"Error {i}: correct word '{right}' already appears in text")
+    return warnings
+
+def warn_unlisted_homophones(puzzle, rules, tokens, index):
+    """Flag unlisted tokens from the same homophone set as a listed error -- likely extra errors."""
+    lexicon = get_lexicon()
+    listed = _error_words(puzzle, "wrong") | _error_words(puzzle, "right")
+    error_sets = {lexicon.set_id(w) for w in listed} - {None}
+    if not error_sets:
+        return []
+
+    warnings = []
+    flagged = set()
+    for token in tokens:
+        word = token.lower()
+        if word in listed or word in flagged:
+            continue
+        set_id = lexicon.set_id(word)
+        if set_id in error_sets:
+            flagged.add(word)
+            warnings.append(
+                f"Unlisted homophone '{token}' ({'/'.join(lexicon.sets[set_id])}) may be an extra error"
+            )
+    return warnings
 
+PUZZLE_WARNINGS = [
+    warn_right_word_in_text,
+    warn_unlisted_homophones,
+]
+
+def validate_puzzle(puzzle, difficulty, warnings=None):
+    """
+    Validate a single puzzle. Returns list of error strings (empty = valid).
+    Lexicon warnings are appended to `warnings` when a list is passed.
+    """
+    issues = []
+    rules = DIFFICULTY_RULES.get(difficulty)
+    if not rules:
+        issues.append(f"Unknown difficulty: {difficulty}")
+        return issues
+
+    # Required fields
+    for field in ["theme", "text", "errors"]:
+        if field not in puzzle:
+            issues.append(f"Missing field: {field}")
+    if issues:
+        return issues
+
+    tokens = tokenize(puzzle["text"])
+    index = index_tokens(tokens)
+    for rule in PUZZLE_RULES:
+        issues.extend(rule(puzzle, rules, tokens, index))
+    if warnings is not None:
+        for rule in PUZZLE_WARNINGS:
+            warnings.extend(rule(puzzle, rules, tokens, index))
+
+    return issues
+
+def validate_data(data):
+    """Validate the parsed contents of one vault day. Returns dict of results."""
     results = {"valid": True, "details": {}}
 
     for difficulty in ["easy", "medium", "hard"]:
@@ -115,14 +220,203 @@ def validate_day(date_str, vault_dir=None):
             results["valid"] = False
             continue
 
-        issues = validate_puzzle(data[difficulty], difficulty)
+        warnings = []
+        issues = validate_puzzle(data[difficulty], difficulty, warnings)
         is_valid = len(issues) == 0
-        results["details"][difficulty] = {"valid": is_valid, "issues": issues}
+        results["details"][difficulty] = {"valid": is_valid, "issues": issues, "warnings": warnings}
         if not is_valid:
             results["valid"] = False
 
     return results
 
+def validate_raw(raw):
+    """Validate the raw bytes of one vault file. Returns dict of results."""
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as e:
+        return {"valid": False, "error": f"Invalid JSON: {e}", "details": {}}
+    return validate_data(data)
+
+def validate_day(date_str, vault_dir=None, bundle=None):
+    """
+    Validate all puzzles for a given date. Returns dict of results.
+    Reads from `bundle` (an open vault_bundle.VaultBundle) when given, else from the vault directory.
+    """
+    if bundle is not None:
+        raw = bundle.raw(date_str)
+        if raw is None:
+            return {"valid": False, "error": f"Not in bundle: {date_str}", "details": {}}
+        return validate_raw(raw)
+
+    vault = Path(vault_dir) if vault_dir else VAULT_DIR
+    filepath = vault / f"{date_str}.json"
+
+    if not filepath.exists():
+        return {"valid": False, "error": f"File not found: {filepath}", "details": {}}
+
+    return validate_raw(filepath.read_bytes())
+
+# ─── Vault-wide Validation ───────────────────────────────────────
+
+def _cache_key(raw):
+    lexicon = get_lexicon().digest[:12]
+    return f"v{VALIDATOR_VERSION}:{lexicon}:{hashlib.sha256(raw).hexdigest()}"
+
+def load_result_cache(path=RESULT_CACHE_FILE):
+    """Load the content-hash -> results cache. Missing or corrupt = empty."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def save_result_cache(cache, path=RESULT_CACHE_FILE):
+    """Write the cache atomically so an interrupted run never corrupts it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(cache, f)
+    os.replace(tmp, path)
+
+def _iter_vault_raw(vault_dir=None, bundle=None):
+    """Yield (date_str, raw bytes) for every vault day, in date order."""
+    if bundle is not None:
+        for date_str in bundle.dates():
+            yield date_str, bundle.raw(date_str)
+        return
+    vault = Path(vault_dir) if vault_dir else VAULT_DIR
+    for f in sorted(vault.glob("*.json")):
+        yield f.stem, f.read_bytes()
+
+def validate_vault(vault_dir=None, jobs=None, use_cache=True, bundle=None, cache_file=None):
+    """
+    Validate every day in the vault (or bundle). Returns list of (date_str, results), sorted by date.
+
+    Days whose content hash is already in the result cache are skipped; the
+    rest are validated across a process pool of `jobs` workers.
+    """
+    cache_file = Path(cache_file) if cache_file else RESULT_CACHE_FILE
+    cache = load_result_cache(cache_file) if use_cache else {}
+
+    results = {}
+    keys = {}
+    pending = []
+    for date_str, raw in _iter_vault_raw(vault_dir, bundle):
+        key = _cache_key(raw)
+        keys[date_str] = key
+        if key in cache:
+            results[date_str] = cache[key]
+        else:
+            pending.append((date_str, raw))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(pending) > 1:
+        chunksize = max(1, len(pending) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            fresh = pool.map(validate_raw, [raw for _, raw in pending], chunksize=chunksize)
+            for (date_str, _), res in zip(pending, fresh):
+                results[date_str] = res
+    else:
+        for date_str, raw in pending:
+            results[date_str] = validate_raw(raw)
+
+    if use_cache and (pending or len(cache) != len(keys)):
+        # Keep only entries for files currently in the vault
+        save_result_cache({keys[d]: results[d] for d in keys}, cache_file)
+
+    return [(date_str, results[date_str]) for date_str in keys]
+
+def apply_reuse_checks(results, date_str, index, window):
+    """
+    Merge reuse_index findings for date_str into a validate_day-style results dict:
+    same-day pair reuse fails the difficulty, reuse on nearby days is a warning.
+    """
+    issues, warnings = index.check(date_str, window)
+    for difficulty, found in warnings.items():
+        detail = results["details"].setdefault(difficulty, {"valid": True, "issues": [], "warnings": []})
+        detail.setdefault("warnings", []).extend(found)
+    for difficulty, found in issues.items():
+        detail = results["details"].setdefault(difficulty, {"valid": True, "issues": [], "warnings": []})
+        detail["issues"].extend(found)
+        detail["valid"] = False
+        results["valid"] = False
+    return results
+
+# ─── Watch Mode ──────────────────────────────────────────────────
+
+def _snapshot(vault):
+    """Return {date_str: (mtime_ns, size)} for every vault file."""
+    snap = {}
+    for f in vault.glob("*.json"):
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            continue
+        snap[f.stem] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+def _emit(out, record):
+    record["at"] = datetime.now().isoformat(timespec="seconds")
+    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    out.flush()
+
+def watch_vault(vault_dir=None, interval=1.0, reuse_window=None, out=None):
+    """
+    Poll the vault and revalidate only the days whose mtime/size changed, writing
+    one NDJSON record per result. The lexicon and reuse index stay loaded between
+    polls. With a reuse window, days within the window of an edit are rechecked too.
+    Runs until interrupted.
+    """
+    out = out or sys.stdout
+    vault = Path(vault_dir) if vault_dir else VAULT_DIR
+    get_lexicon()
+    reuse = None
+    if reuse_window is not None:
+        from reuse_index import open_index
+        reuse = open_index(vault)
+
+    snapshot = _snapshot(vault)
+    _emit(out, {"event": "ready", "vault": str(vault), "days": len(snapshot)})
+
+    while True:
+        time.sleep(interval)
+        current = _snapshot(vault)
+        changed = {d for d, fp in current.items() if snapshot.get(d) != fp}
+        removed = {d for d in snapshot if d not in current}
+        snapshot = current
+        if not changed and not removed:
+            continue
+
+        recheck = set(changed)
+        if reuse:
+            for date_str in changed | removed:
+                reuse.update_day(vault / f"{date_str}.json")
+            reuse.save()
+            for date_str in changed | removed:
+                try:
+                    ordinal = datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+                except ValueError:
+                    continue
+                for offset in range(-reuse_window, reuse_window + 1):
+                    neighbour = datetime.fromordinal(ordinal + offset).strftime("%Y-%m-%d")
+                    if neighbour in current:
+                        recheck.add(neighbour)
+
+        for date_str in sorted(removed):
+            _emit(out, {"event": "removed", "date": date_str})
+        for date_str in sorted(recheck):
+            started = time.perf_counter()
+            results = validate_day(date_str, vault)
+            if reuse and not results.get("error"):
+                apply_reuse_checks(results, date_str, reuse, reuse_window)
+            _emit(out, {
+                "event": "validated",
+                "date": date_str,
+                "changed": date_str in changed,
+                "ms": round((time.perf_counter() - started) * 1000, 1),
+                **results,
+            })
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Validate MISCAST puzzles")
@@ -130,24 +424,54 @@ def main():
     parser.add_argument("--vault-dir", help="Override vault directory path")
     parser.add_argument("--all", action="store_true", help="Validate all vault files")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for --all (default: CPU count)")
+    parser.add_argument("--bundle", help="Read days from a packed vault bundle (see vault_bundle.py)")
+    parser.add_argument("--reuse-window", type=int, default=None, metavar="N",
+                        help="Check homophone pair/theme reuse: same-day pair reuse fails, reuse within N days warns")
+    parser.add_argument("--watch", action="store_true", help="Poll the vault and revalidate changed days (NDJSON output)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between --watch polls (default: 1)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't update the --all result cache")
+    parser.add_argument("--cache-file", help=f"Override the --all result cache path (default: {RESULT_CACHE_FILE})")
     args = parser.parse_args()
 
     vault = Path(args.vault_dir) if args.vault_dir else VAULT_DIR
+    bundle = None
+    if args.bundle:
+        from vault_bundle import open_bundle
+        bundle, problem = open_bundle(args.bundle, vault)
+        if problem:
+            if not any(vault.glob("*.json")):
+                print(f"❌ {problem}")
+                sys.exit(1)
+            print(f"⚠️  {problem} — reading {vault} instead", file=sys.stderr)
+
+    if args.watch:
+        try:
+            watch_vault(vault, interval=args.interval, reuse_window=args.reuse_window)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    reuse = None
+    if args.reuse_window is not None:
+        from reuse_index import open_index
+        reuse = open_index(vault)
 
     if args.all:
-        files = sorted(vault.glob("*.json"))
         all_valid = True
-        for f in files:
-            date_str = f.stem
-            results = validate_day(date_str, vault)
+        for date_str, results in validate_vault(vault, jobs=args.jobs, use_cache=not args.no_cache,
+                                                 bundle=bundle, cache_file=args.cache_file):
+            if reuse:
+                apply_reuse_checks(results, date_str, reuse, args.reuse_window)
             status = "✅" if results["valid"] else "❌"
             print(f"{status} {date_str}", end="")
             if not results["valid"]:
                 all_valid = False
-                for diff, detail in results["details"].items():
-                    if not detail["valid"]:
-                        for issue in detail["issues"]:
-                            print(f"\n   {diff}: {issue}", end="")
+            for diff, detail in results["details"].items():
+                for issue in detail["issues"]:
+                    print(f"\n   {diff}: {issue}", end="")
+                for warning in detail.get("warnings", []):
+                    print(f"\n   ⚠️  {diff}: {warning}", end="")
             print()
         sys.exit(0 if all_valid else 1)
     else:
@@ -157,7 +481,9 @@ def main():
             tomorrow = datetime.now() + timedelta(days=1)
             date_str = tomorrow.strftime("%Y-%m-%d")
 
-        results = validate_day(date_str, vault)
+        results = validate_day(date_str, vault, bundle=bundle)
+        if reuse and not results.get("error"):
+            apply_reuse_checks(results, date_str, reuse, args.reuse_window)
 
         if args.json:
             print(json.dumps(results, indent=2))
@@ -173,6 +499,8 @@ def main():
                     if detail["issues"]:
                         print(f": {'; '.join(detail['issues'])}", end="")
                     print()
+                    for warning in detail.get("warnings", []):
+                        print(f"     ⚠️  {warning}")
 
         sys.exit(0 if results["valid"] else 1)
 
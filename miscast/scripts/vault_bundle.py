@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+MISCAST Vault Bundle
+Packs the per-day vault JSON files into a single memory-mappable bundle.
+
+The per-day files in vault/ stay the editable source of truth; the bundle is
+a build artifact that lets readers fetch any day without opening thousands of
+small files. The header records a fingerprint of the vault files it was built
+from (name, mtime and size of each, hashed), so open_bundle() can tell when a
+vault file has been edited, added or removed since, and readers fall back to
+the JSON files instead of serving a stale bundle.
+
+Layout (little-endian):
+  header   MAGIC(4s) FORMAT_VERSION(H) reserved(H) first_day_ordinal(I) day_count(I)
+           source_fingerprint(32s)
+  index    day_count x (offset(I), length(I)) -- one slot per calendar day,
+           starting at first_day_ordinal; length 0 = no puzzle that day
+  payloads minified UTF-8 JSON for each day, back to back
+
+Lookup is O(1): the slot for a date is (date.toordinal() - first_day_ordinal).
+
+Usage:
+  python vault_bundle.py build [--vault-dir /path/to/vault] [--out /path/to/vault.bundle]
+  python vault_bundle.py get YYYY-MM-DD [--bundle /path/to/vault.bundle]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from datetime import date
+from pathlib import Path
+
+VAULT_DIR = Path(__file__).parent.parent / "vault"
+BUNDLE_PATH = Path(__file__).parent.parent / "vault.bundle"
+
+MAGIC = b"MCVB"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHHII32s")
+PREFIX = struct.Struct("<4sH")  # magic + version, readable whatever the version
+ENTRY = struct.Struct("<II")
+
+
+class BundleError(Exception):
+    pass
+
+
+def vault_fingerprint(vault_dir=None):
+    """SHA-256 over the name, mtime and size of every vault/*.json file (a stat each, no reads)."""
+    vault = Path(vault_dir) if vault_dir else VAULT_DIR
+    digest = hashlib.sha256()
+    for f in sorted(vault.glob("*.json")):
+        st = f.stat()
+        digest.update(f"{f.name}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8"))
+    return digest.digest()
+
+
+def build_bundle(vault_dir=None, out_path=None):
+    """Compact every vault day into one bundle file. Returns the number of days packed."""
+    vault = Path(vault_dir) if vault_dir else VAULT_DIR
+    out = Path(out_path) if out_path else BUNDLE_PATH
+
+    # Taken before reading, so a file edited mid-build makes the bundle look stale, never fresh
+    fingerprint = vault_fingerprint(vault)
+    days = {}
+    for f in sorted(vault.glob("*.json")):
+        try:
+            ordinal = date.fromisoformat(f.stem).toordinal()
+        except ValueError:
+            raise BundleError(f"Not a vault day file (expected YYYY-MM-DD.json): {f.name}")
+        try:
+            data = json.loads(f.read_bytes())
+        except json.JSONDecodeError as e:
+            raise BundleError(f"Invalid JSON in {f.name}: {e}")
+        days[ordinal] = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    first = min(days) if days else 0
+    count = (max(days) - first + 1) if days else 0
+
+    index = bytearray(ENTRY.size * count)
+    payloads = bytearray()
+    offset = HEADER.size + len(index)
+    for ordinal, payload in days.items():
+        ENTRY.pack_into(index, (ordinal - first) * ENTRY.size, offset + len(payloads), len(payload))
+        payloads += payload
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_suffix(out.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, first, count, fingerprint))
+        f.write(index)
+        f.write(payloads)
+    os.replace(tmp, out)
+    return len(days)
+
+
+class VaultBundle:
+    """Read-only, memory-mapped view of a vault bundle."""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else BUNDLE_PATH
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise BundleError(f"Empty bundle file: {self.path}")
+
+        if len(self._mm) < PREFIX.size:
+            self.close()
+            raise BundleError(f"Truncated bundle header: {self.path}")
+        magic, version = PREFIX.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise BundleError(f"Not a MISCAST vault bundle: {self.path}")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise BundleError(f"Unsupported bundle version {version} (expected {FORMAT_VERSION}); rebuild it")
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise BundleError(f"Truncated bundle header: {self.path}")
+        _, _, _, self.first_ordinal, self.day_count, self.fingerprint = HEADER.unpack_from(self._mm, 0)
+        if len(self._mm) < HEADER.size + self.day_count * ENTRY.size:
+            self.close()
+            raise BundleError(f"Truncated bundle entry table: {self.path}")
+
+    def is_stale(self, vault_dir=None):
+        """
+        True if the vault's JSON files changed since the bundle was built. A
+        missing or empty vault directory (a bundle deployed on its own) can't
+        be compared, and counts as fresh.
+        """
+        vault = Path(vault_dir) if vault_dir else VAULT_DIR
+        if not vault.is_dir() or not any(vault.glob("*.json")):
+            return False
+        return vault_fingerprint(vault) != self.fingerprint
+
+    def raw(self, date_str):
+        """Return the JSON bytes for a date, or None if the bundle has no puzzle for it."""
+        try:
+            slot = date.fromisoformat(date_str).toordinal() - self.first_ordinal
+        except ValueError:
+            return None
+        if not 0 <= slot < self.day_count:
+            return None
+        offset, length = ENTRY.unpack_from(self._mm, HEADER.size + slot * ENTRY.size)
+        if not length:
+            return None
+        return self._mm[offset:offset + length]
+
+    def load(self, date_str):
+        """Return the parsed puzzle day for a date, or None."""
+        raw = self.raw(date_str)
+        return json.loads(raw) if raw is not None else None
+
+    def dates(self):
+        """Yield every date string with a puzzle, in order."""
+        for slot in range(self.day_count):
+            _, length = ENTRY.unpack_from(self._mm, HEADER.size + slot * ENTRY.size)
+            if length:
+                yield date.fromordinal(self.first_ordinal + slot).isoformat()
+
+    def __contains__(self, date_str):
+        return self.raw(date_str) is not None
+
+    def close(self):
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_bundle(path=None, vault_dir=None):
+    """
+    Open a bundle for reading in place of the vault JSON files.
+    Returns (bundle, None), or (None, reason) if the bundle can't be read or is
+    older than the vault; callers then read the JSON files instead.
+    """
+    try:
+        bundle = VaultBundle(path)
+    except (BundleError, OSError) as e:
+        return None, f"Cannot open bundle: {e}"
+    if bundle.is_stale(vault_dir):
+        bundle.close()
+        return None, f"Bundle {bundle.path} is older than the vault files; rebuild it (python vault_bundle.py build)"
+    return bundle, None
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Build or read the packed MISCAST vault bundle")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Pack vault/*.json into a bundle")
+    build.add_argument("--vault-dir", help="Override vault directory path")
+    build.add_argument("--out", help=f"Bundle output path (default: {BUNDLE_PATH})")
+
+    get = sub.add_parser("get", help="Print one day from a bundle")
+    get.add_argument("date", help="Date to read (YYYY-MM-DD)")
+    get.add_argument("--bundle", help=f"Bundle path (default: {BUNDLE_PATH})")
+    get.add_argument("--vault-dir", help="Vault to check the bundle's freshness against")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "build":
+            count = build_bundle(args.vault_dir, args.out)
+            print(f"✅ Packed {count} day(s) into {args.out or BUNDLE_PATH}")
+            sys.exit(0)
+
+        with VaultBundle(args.bundle) as bundle:
+            if bundle.is_stale(args.vault_dir):
+                print(f"⚠️  {bundle.path} is older than the vault files; rebuild it", file=sys.stderr)
+            data = bundle.load(args.date)
+    except (BundleError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if data is None:
+        print(f"❌ {args.date}: not in bundle")
+        sys.exit(1)
+    print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
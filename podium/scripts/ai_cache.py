@@ -0,0 +1,134 @@
+"""
+Content-addressed on-disk cache for AI responses.
+
+Each response is stored under the SHA-256 of its full request (model, system
+prompt, prompt, temperature, max_tokens), so a byte-identical request replays
+instantly and at no cost. Entries older than max_age_days are ignored and
+pruned, and the oldest entries are evicted once the cache exceeds max_bytes.
+
+A cache directory can also be checked in as an offline fixture store: with
+offline=True a miss raises instead of calling the model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+log = logging.getLogger("podium.ai_cache")
+
+DEFAULT_DIR = Path(__file__).parent / ".cache" / "ai"
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+class CacheMiss(Exception):
+    pass
+
+
+def request_key(
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Hash of everything that determines the model's output distribution."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "system_prompt": system_prompt,
+            "prompt": prompt,
+            "temperature": round(float(temperature), 6),
+            "max_tokens": int(max_tokens),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_age_days: Optional[float] = DEFAULT_MAX_AGE_DAYS,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        offline: bool = False,
+    ):
+        self.directory = Path(directory) if directory else DEFAULT_DIR
+        self.max_age = max_age_days * 86400 if max_age_days else None
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None (raises CacheMiss when offline)."""
+        path = self._path(key)
+        try:
+            if self.max_age and time.time() - path.stat().st_mtime > self.max_age:
+                raise FileNotFoundError(path)
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)["response"]
+        except (OSError, json.JSONDecodeError, KeyError):
+            if self.offline:
+                raise CacheMiss(f"Offline and no cached AI response for {key[:12]}")
+            return None
+
+    def put(self, key: str, response: str, meta: Optional[dict] = None) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"created": time.time(), **(meta or {}), "response": response}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def discard(self, key: str) -> None:
+        """Drop an entry, e.g. a response that failed validation, so reruns don't replay it."""
+        if self.offline:
+            return
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def prune(self) -> int:
+        """Evict expired entries, then the oldest ones until under max_bytes. Returns evicted count."""
+        if self.offline or not self.directory.exists():
+            return 0
+        with self._lock:
+            now = time.time()
+            entries = []
+            evicted = 0
+            for path in self.directory.glob("*/*.json"):
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                if self.max_age and now - st.st_mtime > self.max_age:
+                    path.unlink(missing_ok=True)
+                    evicted += 1
+                else:
+                    entries.append((st.st_mtime, st.st_size, path))
+
+            if self.max_bytes:
+                total = sum(size for _, size, _ in entries)
+                for _, size, path in sorted(entries):
+                    if total <= self.max_bytes:
+                        break
+                    path.unlink(missing_ok=True)
+                    total -= size
+                    evicted += 1
+
+        if evicted:
+            log.info(f"AI cache: evicted {evicted} entr{'y' if evicted == 1 else 'ies'}")
+        return evicted
@@ -0,0 +1,182 @@
+"""
+Coalesced, non-blocking alerts for the PODIUM cron scripts.
+
+Scripts add() failures to an AlertDispatcher as they happen; nothing is sent
+until flush() (or close(), at exit), which renders every buffered failure
+into one message and hands it to a background thread through a bounded
+queue. A bad week is one openclaw call off the main thread, not seven
+blocking ones.
+
+The sink is swappable: OpenclawSink by default, or FileSink when
+PODIUM_ALERT_FILE is set, which appends messages to a local file for tests
+and dry runs.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import subprocess
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+log = logging.getLogger("podium.alerts")
+
+ALERT_FILE_ENV = "PODIUM_ALERT_FILE"
+QUEUE_SIZE = 8
+MAX_DATES = 20       # dates listed in one message
+MAX_ISSUES = 10      # issues listed per date
+MAX_ISSUE_CHARS = 500
+
+
+class OpenclawSink:
+    """Send via `openclaw system event` (same pattern as other scripts)."""
+
+    name = "openclaw"
+
+    def __init__(self, timeout: float = 10):
+        self.timeout = timeout
+
+    def __call__(self, message: str) -> None:
+        subprocess.run(
+            ["openclaw", "system", "event", "--text", message, "--mode", "now"],
+            timeout=self.timeout, check=True, capture_output=True,
+        )
+
+
+class FileSink:
+    """Append each message to a file, separated by a blank line."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.name = str(self.path)
+
+    def __call__(self, message: str) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(message.rstrip("\n") + "\n\n")
+
+
+def default_sink() -> Callable[[str], None]:
+    path = os.environ.get(ALERT_FILE_ENV)
+    return FileSink(path) if path else OpenclawSink()
+
+
+def rerun_command(script: str, dates: list[date], flags: str = "") -> str:
+    """Shell command rerunning script for dates: one --date/--until range if contiguous, else a loop."""
+    run = f"PYTHONPATH=. python3 ../podium/scripts/{script}"
+    flags = f" {flags}" if flags else ""
+    if len(dates) == 1:
+        return f"cd donecast/backend && {run} --date {dates[0]}{flags}"
+    if (dates[-1] - dates[0]).days + 1 == len(dates):
+        return f"cd donecast/backend && {run} --date {dates[0]} --until {dates[-1]}{flags}"
+    return f"cd donecast/backend && for d in {' '.join(map(str, dates))}; do {run} --date $d{flags}; done"
+
+
+class AlertDispatcher:
+    """
+    Buffers (key, issues) failures for a run and sends them as one message.
+
+    Keys are usually puzzle dates; failures that aren't about a date (e.g. a
+    candidate pool fill) use a string label instead, and the headline then
+    doesn't quote a date range. subject is the headline ("PODIUM puzzle
+    validation FAILED"); fix, given the failed keys, returns the closing line
+    (usually the command to run). With enabled=False, add() is a no-op (--no-alert).
+    """
+
+    def __init__(
+        self,
+        subject: str,
+        fix: Optional[Callable[[list[date]], str]] = None,
+        sink: Optional[Callable[[str], None]] = None,
+        enabled: bool = True,
+        queue_size: int = QUEUE_SIZE,
+    ):
+        self.subject = subject
+        self.fix = fix
+        self.sink = sink or default_sink()
+        self.enabled = enabled
+        self._failures: dict[Union[date, str], list[str]] = {}
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self.sent = 0
+
+    def add(self, key: Union[date, str], *issues: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            bucket = self._failures.setdefault(key, [])
+            bucket.extend(i for i in issues if i not in bucket)
+
+    @property
+    def pending(self) -> int:
+        """Keys buffered and not yet flushed."""
+        return len(self._failures)
+
+    def render(self, failures: dict[Union[date, str], list[str]]) -> str:
+        keys = sorted(failures, key=str)
+        if all(isinstance(k, date) for k in keys):
+            lines = [f"⚠️ {self.subject} for {len(keys)} date(s): {keys[0]}"
+                     + (f" → {keys[-1]}" if len(keys) > 1 else "")]
+        else:
+            lines = [f"⚠️ {self.subject}"]
+        for key in keys[:MAX_DATES]:
+            issues = failures[key]
+            lines.append("")
+            lines.append(f"{key}:")
+            lines.extend(f"• {i[:MAX_ISSUE_CHARS]}" for i in issues[:MAX_ISSUES])
+            if len(issues) > MAX_ISSUES:
+                lines.append(f"• …and {len(issues) - MAX_ISSUES} more")
+        if len(keys) > MAX_DATES:
+            lines.append("")
+            lines.append(f"…and {len(keys) - MAX_DATES} more")
+        if self.fix:
+            lines.append("")
+            lines.append(self.fix(keys))
+        return "\n".join(lines)
+
+    def flush(self) -> None:
+        """Queue one message for everything buffered so far. Never blocks; drops the message if the queue is full."""
+        with self._lock:
+            failures, self._failures = self._failures, {}
+        if not failures:
+            return
+        message = self.render(failures)
+        self._start()
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            log.warning(f"Alert queue full; dropped alert covering {len(failures)} failure(s)")
+
+    def close(self, timeout: float = 15) -> None:
+        """Flush and wait up to timeout seconds for queued messages to go out."""
+        self.flush()
+        if self._worker is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            log.warning(f"Alert sink still busy after {timeout:.0f}s; giving up")
+
+    def _start(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="podium-alerts", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            message = self._queue.get()
+            if message is None:
+                return
+            try:
+                self.sink(message)
+                self.sent += 1
+                log.info(f"Alert sent via {getattr(self.sink, 'name', type(self.sink).__name__)}")
+            except Exception as e:
+                log.warning(f"Could not send alert: {e}")
@@ -0,0 +1,176 @@
+"""
+Staging pool of pre-generated, validated PODIUM puzzles.
+
+generate_puzzle.py --fill-pool N tops podium_candidate up to N candidates, well
+ahead of demand. The daily job (--promote) then moves one candidate into
+podium_puzzle for the target date in a single short transaction, so
+publishing never waits on the AI; generation failures only shrink the pool.
+
+The table is created on first use. The SQL is plain enough for both
+PostgreSQL and SQLite.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from puzzle_rules import check_puzzle
+
+log = logging.getLogger("podium.pool")
+
+RECENCY_WINDOW_DAYS = 30  # a promoted category must not appear within this many days of the target
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS podium_candidate (
+        candidate_key VARCHAR(64) PRIMARY KEY,
+        question TEXT NOT NULL,
+        direction TEXT NOT NULL,
+        category TEXT NOT NULL,
+        emoji TEXT,
+        fun_fact TEXT,
+        items_json TEXT NOT NULL,
+        model TEXT,
+        created_at TIMESTAMP NOT NULL
+    )
+"""
+
+
+def ensure_pool_table(conn) -> None:
+    from sqlalchemy import text
+    conn.execute(text(CREATE_TABLE_SQL))
+
+
+def candidate_key(data: dict) -> str:
+    """Content hash, so the same puzzle can't be staged twice."""
+    payload = json.dumps(
+        {k: data.get(k) for k in ("question", "direction", "category", "items")},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _category_key(category: Optional[str]) -> str:
+    return (category or "").strip().lower()
+
+
+def pool_size(conn) -> int:
+    from sqlalchemy import text
+    return conn.execute(text("SELECT COUNT(*) FROM podium_candidate")).scalar() or 0
+
+
+def pool_categories(conn) -> list[str]:
+    """Categories of every staged candidate, oldest first."""
+    from sqlalchemy import text
+    result = conn.execute(text("SELECT category FROM podium_candidate ORDER BY created_at, candidate_key"))
+    return [row[0] for row in result if row[0]]
+
+
+def pool_texts(conn) -> list[tuple[str, str, str]]:
+    """(candidate_key, category, question) for every staged candidate."""
+    from sqlalchemy import text
+    result = conn.execute(text("SELECT candidate_key, category, question FROM podium_candidate"))
+    return [tuple(row) for row in result]
+
+
+def add_candidate(conn, data: dict, model: Optional[str] = None) -> bool:
+    """Stage a validated puzzle. Returns False if an identical candidate is already staged."""
+    from sqlalchemy import text
+    key = candidate_key(data)
+    exists = conn.execute(text(
+        "SELECT 1 FROM podium_candidate WHERE candidate_key = :k"
+    ), {"k": key}).fetchone()
+    if exists:
+        return False
+    conn.execute(text("""
+        INSERT INTO podium_candidate
+            (candidate_key, question, direction, category, emoji, fun_fact, items_json, model, created_at)
+        VALUES
+            (:candidate_key, :question, :direction, :category, :emoji, :fun_fact, :items_json, :model, :created_at)
+    """), {
+        "candidate_key": key,
+        "question": data["question"],
+        "direction": data["direction"],
+        "category": data["category"],
+        "emoji": data.get("emoji", "🎙️"),
+        "fun_fact": data.get("fun_fact"),
+        "items_json": json.dumps(data["items"]),
+        "model": model,
+        "created_at": datetime.now(timezone.utc).replace(tzinfo=None),
+    })
+    return True
+
+
+def categories_near(conn, target_date: date, window_days: int = RECENCY_WINDOW_DAYS) -> set[str]:
+    """Normalized categories of published puzzles within window_days either side of target_date."""
+    from sqlalchemy import text
+    result = conn.execute(text(
+        "SELECT category FROM podium_puzzle WHERE puzzle_date BETWEEN :a AND :b"
+    ), {"a": target_date - timedelta(days=window_days), "b": target_date + timedelta(days=window_days)})
+    return {_category_key(row[0]) for row in result if row[0]}
+
+
+def take_candidate(
+    conn,
+    target_date: date,
+    window_days: int = RECENCY_WINDOW_DAYS,
+    conflicts: Optional[Callable[[dict], list[str]]] = None,
+) -> Optional[dict]:
+    """
+    Remove and return the oldest candidate eligible for target_date, or None.
+
+    Eligible = passes puzzle_rules, its category isn't used within window_days
+    of target_date, and conflicts(data), if given, returns no issues (see
+    generate_puzzle.CategoryLedger.conflicts: near-duplicates, entity cooldown
+    and fact contradictions against the puzzles published since the candidate
+    was staged). Candidates that no longer pass the rules are dropped. Call
+    inside the transaction that inserts the returned puzzle (see
+    generate_puzzle.promote_from_pool), so a failed insert puts it back; the
+    DELETE is checked, so two concurrent promoters can't take the same candidate.
+    """
+    from sqlalchemy import text
+
+    avoid = categories_near(conn, target_date, window_days)
+    rows = conn.execute(text("""
+        SELECT candidate_key, question, direction, category, emoji, fun_fact, items_json
+        FROM podium_candidate ORDER BY created_at, candidate_key
+    """)).fetchall()
+
+    for key, question, direction, category, emoji, fun_fact, items_json in rows:
+        if _category_key(category) in avoid:
+            continue
+        try:
+            items = json.loads(items_json)
+        except (TypeError, json.JSONDecodeError):
+            items = None
+        data = {
+            "question": question,
+            "direction": direction,
+            "category": category,
+            "emoji": emoji,
+            "fun_fact": fun_fact,
+            "items": items,
+        }
+        issues = check_puzzle(data)
+        if issues:
+            log.warning(f"Dropping candidate {key[:12]} ({category!r}): {'; '.join(issues)}")
+            conn.execute(text("DELETE FROM podium_candidate WHERE candidate_key = :k"), {"k": key})
+            continue
+        if conflicts is not None:
+            found = conflicts(data)
+            if found:
+                log.info(f"Skipping candidate {key[:12]} ({category!r}) for {target_date}: {'; '.join(found)}")
+                continue
+
+        taken = conn.execute(text(
+            "DELETE FROM podium_candidate WHERE candidate_key = :k"
+        ), {"k": key})
+        if taken.rowcount != 1:
+            continue  # taken by someone else meanwhile
+        log.info(f"Took candidate {key[:12]} ({category!r}) for {target_date}")
+        return data
+
+    return None
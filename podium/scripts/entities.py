@@ -0,0 +1,200 @@
+"""
+Entity index of the items ranked across all PODIUM puzzles.
+
+Item names are folded to an entity key: Unicode-normalized, lower-case,
+trailing parentheticals and a leading "The" dropped, "&" read as "and",
+punctuation removed ("The Daily (NYT)" -> "daily", "Conan O'Brien Needs a
+Friend" -> "conan obrien needs a friend"). Keys listed in entity_aliases.txt
+then collapse to their canonical entity.
+
+The index maps entity -> every (date, sort_value, category, name) use, with
+dates kept sorted, so "was this entity used within N days of D?" is a dict
+lookup plus a bisect. build_entity_index() fills it from the DB in one
+streaming pass over podium_puzzle.
+
+Usage:
+  python entities.py NAME [NAME ...]   # show each name's entity key
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import re
+import sys
+import threading
+import unicodedata
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Optional
+
+ALIASES_FILE = Path(__file__).parent / "entity_aliases.txt"
+DEFAULT_COOLDOWN_DAYS = 14
+
+_PARENTHETICAL = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]\s*$")
+_APOSTROPHES = re.compile(r"['’`]")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def fold(name: str) -> str:
+    """Case/punctuation-folded form of an item name."""
+    text = unicodedata.normalize("NFKD", name or "")
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower().strip()
+    while _PARENTHETICAL.search(text):
+        stripped = _PARENTHETICAL.sub("", text)
+        if not stripped:
+            break
+        text = stripped
+    text = _APOSTROPHES.sub("", text.replace("&", " and "))
+    text = _NON_WORD.sub(" ", text).strip()
+    if text.startswith("the ") and len(text) > 4:
+        text = text[4:]
+    return text
+
+
+def load_aliases(path: Optional[Path] = None) -> dict[str, str]:
+    """Parse entity_aliases.txt into {folded alias: folded canonical}."""
+    path = Path(path) if path else ALIASES_FILE
+    aliases: dict[str, str] = {}
+    if not path.exists():
+        return aliases
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        names = [fold(n) for n in line.split("|") if n.strip()]
+        for alias in names[1:]:
+            aliases[alias] = names[0]
+    return aliases
+
+
+_ALIASES: Optional[dict[str, str]] = None
+
+
+def entity_key(name: str) -> str:
+    """The entity an item name refers to."""
+    global _ALIASES
+    if _ALIASES is None:
+        _ALIASES = load_aliases()
+    key = fold(name)
+    return _ALIASES.get(key, key)
+
+
+@dataclass(frozen=True)
+class EntityUse:
+    puzzle_date: date
+    sort_value: object
+    category: Optional[str]
+    name: str
+
+
+class EntityIndex:
+    def __init__(self):
+        self._uses: dict[str, list[EntityUse]] = {}
+        self._dates: dict[str, list[date]] = {}  # parallel to _uses, for bisect
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._uses)
+
+    def __contains__(self, name: str) -> bool:
+        return entity_key(name) in self._uses
+
+    def add_puzzle(self, puzzle_date: date, items: Iterable[dict], category: Optional[str] = None) -> None:
+        with self._lock:
+            for item in items:
+                if not isinstance(item, dict) or not isinstance(item.get("name"), str):
+                    continue
+                key = entity_key(item["name"])
+                if not key:
+                    continue
+                dates = self._dates.setdefault(key, [])
+                pos = bisect.bisect_right(dates, puzzle_date)
+                dates.insert(pos, puzzle_date)
+                self._uses.setdefault(key, []).insert(
+                    pos, EntityUse(puzzle_date, item.get("sort_value"), category, item["name"])
+                )
+
+    def uses(self, name: str) -> list[EntityUse]:
+        """Every recorded use of name's entity, oldest first."""
+        return list(self._uses.get(entity_key(name), ()))
+
+    def previous_use(self, name: str, target_date: date) -> Optional[EntityUse]:
+        """The latest use of name's entity strictly before target_date, if any."""
+        key = entity_key(name)
+        dates = self._dates.get(key)
+        if not dates:
+            return None
+        before = bisect.bisect_left(dates, target_date)   # dates[before - 1] < target_date
+        return self._uses[key][before - 1] if before else None
+
+    def nearest_use(self, name: str, target_date: date) -> Optional[EntityUse]:
+        """The use of name's entity closest in time to target_date, on either side (ignoring target_date's own)."""
+        key = entity_key(name)
+        dates = self._dates.get(key)
+        if not dates:
+            return None
+        uses = self._uses[key]
+        before = bisect.bisect_left(dates, target_date)   # dates[before - 1] < target_date
+        after = bisect.bisect_right(dates, target_date)   # dates[after] > target_date
+        candidates = [uses[i] for i in (before - 1, after) if 0 <= i < len(dates)]
+        return min(candidates, key=lambda u: abs((u.puzzle_date - target_date).days), default=None)
+
+    def cooldown_issues(
+        self,
+        items: Iterable[dict],
+        target_date: date,
+        cooldown_days: int = DEFAULT_COOLDOWN_DAYS,
+        both_sides: bool = True,
+    ) -> list[str]:
+        """
+        Issues for items whose entity appears in another puzzle within
+        cooldown_days of target_date. Checking both sides is what placing a new
+        puzzle needs: later dates may already be stored (horizons, --force,
+        --promote), and the new puzzle would put them in breach. With
+        both_sides=False only earlier puzzles count, which reports each
+        too-close pair once, on the later date (the validator's view).
+        """
+        if cooldown_days <= 0:
+            return []
+        issues = []
+        for i, item in enumerate(items):
+            name = item.get("name") if isinstance(item, dict) else None
+            if not isinstance(name, str):
+                continue
+            use = self.nearest_use(name, target_date) if both_sides else self.previous_use(name, target_date)
+            if use and abs((target_date - use.puzzle_date).days) < cooldown_days:
+                issues.append(
+                    f"Item {i} {name!r} is also used on {use.puzzle_date} "
+                    f"({use.category!r}); entities need {cooldown_days} days between uses"
+                )
+        return issues
+
+
+def build_entity_index(conn) -> EntityIndex:
+    """Index every podium_puzzle row in one streaming pass."""
+    from sqlalchemy import text
+    index = EntityIndex()
+    result = conn.execution_options(stream_results=True).execute(text(
+        "SELECT puzzle_date, category, items_json FROM podium_puzzle"
+    ))
+    for puzzle_date, category, items_json in result:
+        try:
+            items = json.loads(items_json or "[]")
+        except json.JSONDecodeError:
+            continue
+        if isinstance(puzzle_date, str):
+            puzzle_date = date.fromisoformat(puzzle_date[:10])
+        elif hasattr(puzzle_date, "date"):
+            puzzle_date = puzzle_date.date()
+        index.add_puzzle(puzzle_date, items if isinstance(items, list) else [], category)
+    return index
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__.strip().splitlines()[-1].strip())
+        sys.exit(1)
+    for arg in sys.argv[1:]:
+        print(f"{arg!r} -> {entity_key(arg)!r}")
@@ -0,0 +1,206 @@
+"""
+Fact ledger: (entity, dimension) -> known sort_value, for cross-checking generated puzzles.
+
+A puzzle's dimension comes from its question ("OLDEST to NEWEST" -> launch_year,
+"by year founded" -> founded_year, "retail price" -> price, ...). Questions that
+match no known dimension, such as production-step orderings, are not recorded
+or checked. Entities are keyed as in entities.py, so "Crime Junkie" launching in
+2017 in one puzzle and 2019 in another is a contradiction.
+
+The ledger is bootstrapped from the hand-verified PUZZLES in seed_puzzles.py,
+which take precedence, and then from every puzzle in the DB, in one pass. A
+lookup is a dict access. Years are compared by whole year (2009.1 tie-breakers
+count as 2009); amounts within a per-dimension relative tolerance.
+
+Usage:
+  PYTHONPATH=. python3 ../podium/scripts/facts.py              # list conflicting facts in seeds + DB
+  PYTHONPATH=. python3 ../podium/scripts/facts.py "Crime Junkie"
+  python3 facts.py --db sqlite:///podium.db                     # no backend needed
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import sys
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional
+
+from entities import entity_key
+
+# (dimension, kind, relative tolerance for amounts, question patterns), first match wins
+DIMENSIONS = [
+    ("birth_year", "year", 0, [r"birth year", r"\byoungest\b", r"\bborn\b"]),
+    ("premiere_year", "year", 0, [r"\bpremiere"]),
+    ("founded_year", "year", 0, [r"\bfounded\b"]),
+    ("established_year", "year", 0, [r"\bestablished\b"]),
+    ("release_year", "year", 0, [r"\breleased\b", r"release year"]),
+    ("event_year", "year", 0, [r"chronological", r"\boccurred\b"]),
+    ("launch_year", "year", 0, [r"oldest to newest", r"first episode", r"launch year", r"\blaunched\b"]),
+    ("episode_length", "amount", 0.25, [r"episode length", r"\bminutes\b"]),
+    ("episode_count", "amount", 0.5, [r"episode count", r"number of episodes"]),  # grows over time
+    ("price", "amount", 0.25, [r"\bprice\b", r"cheapest", r"expensive"]),
+    ("deal_value", "amount", 0.25, [r"\bdeals?\b", r"acquisition price"]),
+    ("listener_count", "amount", 0.5, [r"\blisteners\b"]),
+    ("show_count", "amount", 0.5, [r"number of (owned )?shows"]),
+    ("cpm", "amount", 0.25, [r"\bcpm\b"]),
+]
+_COMPILED = [(name, kind, tol, [re.compile(p) for p in pats]) for name, kind, tol, pats in DIMENSIONS]
+_KINDS = {name: (kind, tol) for name, kind, tol, _ in DIMENSIONS}
+
+
+def dimension_of(puzzle: dict) -> Optional[str]:
+    """The dimension a puzzle ranks on, from its question and direction, or None if unknown."""
+    text = f"{puzzle.get('question') or ''} {puzzle.get('direction') or ''}".lower().replace("→", "to")
+    for name, _, _, patterns in _COMPILED:
+        if any(p.search(text) for p in patterns):
+            return name
+    return None
+
+
+def agree(dimension: str, a, b) -> bool:
+    kind, tolerance = _KINDS[dimension]
+    if kind == "year":
+        return math.floor(a) == math.floor(b)
+    scale = max(abs(a), abs(b))
+    return scale == 0 or abs(a - b) / scale <= tolerance
+
+
+@dataclass(frozen=True)
+class Fact:
+    value: float
+    name: str
+    source: str                       # "seed #N" or the puzzle date
+    puzzle_date: Optional[date] = None
+
+
+class FactLedger:
+    def __init__(self):
+        self._facts: dict[tuple[str, str], list[Fact]] = {}
+
+    def __len__(self) -> int:
+        return len(self._facts)
+
+    def add_puzzle(self, puzzle: dict, source: str, puzzle_date: Optional[date] = None) -> None:
+        dimension = dimension_of(puzzle)
+        items = puzzle.get("items")
+        if dimension is None or not isinstance(items, list):
+            return
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            name, value = item.get("name"), item.get("sort_value")
+            if not isinstance(name, str) or not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            self._facts.setdefault((entity_key(name), dimension), []).append(
+                Fact(value, name, source, puzzle_date)
+            )
+
+    def known(self, name: str, dimension: str, exclude_date: Optional[date] = None) -> Optional[Fact]:
+        """The reference fact: the earliest recorded one (seeds are loaded first), ignoring exclude_date."""
+        for fact in self._facts.get((entity_key(name), dimension), ()):
+            if exclude_date is None or fact.puzzle_date != exclude_date:
+                return fact
+        return None
+
+    def facts_for(self, name: str) -> dict[str, list[Fact]]:
+        key = entity_key(name)
+        return {dim: facts for (entity, dim), facts in self._facts.items() if entity == key}
+
+    def contradictions(self, puzzle: dict, exclude_date: Optional[date] = None) -> list[str]:
+        """Issues for items whose sort_value disagrees with the ledger on the puzzle's dimension."""
+        dimension = dimension_of(puzzle)
+        items = puzzle.get("items")
+        if dimension is None or not isinstance(items, list):
+            return []
+        issues = []
+        for i, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            name, value = item.get("name"), item.get("sort_value")
+            if not isinstance(name, str) or not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            fact = self.known(name, dimension, exclude_date)
+            if fact and not agree(dimension, value, fact.value):
+                issues.append(
+                    f"Item {i} {name!r} has {dimension} {value}, but {fact.name!r} is recorded "
+                    f"as {fact.value} ({fact.source}); double-check it or pick another item"
+                )
+        return issues
+
+    def conflicts(self) -> list[str]:
+        """Facts recorded with disagreeing values, e.g. seeds that contradict each other."""
+        out = []
+        for (entity, dimension), facts in sorted(self._facts.items()):
+            ref = facts[0]
+            for fact in facts[1:]:
+                if not agree(dimension, fact.value, ref.value):
+                    out.append(
+                        f"{ref.name!r} {dimension}: {ref.value} ({ref.source}) vs {fact.value} ({fact.source})"
+                    )
+        return out
+
+
+def build_fact_ledger(conn=None, seeds: Optional[Iterable[dict]] = None) -> FactLedger:
+    """Seeds first (default: seed_puzzles.PUZZLES), then every podium_puzzle row in one streaming pass."""
+    ledger = FactLedger()
+    if seeds is None:
+        from seed_puzzles import PUZZLES as seeds
+    for puzzle in seeds:
+        ledger.add_puzzle(puzzle, f"seed #{puzzle.get('puzzle_number', '?')}")
+
+    if conn is not None:
+        from sqlalchemy import text
+        result = conn.execution_options(stream_results=True).execute(text(
+            "SELECT puzzle_date, question, direction, items_json FROM podium_puzzle ORDER BY puzzle_date"
+        ))
+        for puzzle_date, question, direction, items_json in result:
+            try:
+                items = json.loads(items_json or "[]")
+            except json.JSONDecodeError:
+                continue
+            if isinstance(puzzle_date, str):
+                puzzle_date = date.fromisoformat(puzzle_date[:10])
+            elif hasattr(puzzle_date, "date"):
+                puzzle_date = puzzle_date.date()
+            ledger.add_puzzle(
+                {"question": question, "direction": direction, "items": items},
+                puzzle_date.isoformat(), puzzle_date,
+            )
+    return ledger
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    from puzzle_store import DB_URL_ENV, PuzzleStore
+
+    parser = argparse.ArgumentParser(description="List conflicting PODIUM facts, or the facts for NAMEs")
+    parser.add_argument("names", nargs="*", metavar="NAME", help="Item names to look up")
+    parser.add_argument(
+        "--db", default=os.environ.get(DB_URL_ENV),
+        help=f"Database URL, e.g. sqlite:///podium.db (default: ${DB_URL_ENV}, else the DoneCast backend's)"
+    )
+    args = parser.parse_args()
+
+    with PuzzleStore.open(args.db).connect() as conn:
+        ledger = build_fact_ledger(conn)
+    if args.names:
+        for name in args.names:
+            print(f"{name} -> {entity_key(name)!r}")
+            for dimension, facts in ledger.facts_for(name).items():
+                for fact in facts:
+                    print(f"   {dimension:<18} {fact.value:<10} {fact.source}")
+        sys.exit(0)
+
+    conflicts = ledger.conflicts()
+    print(f"{len(ledger)} (entity, dimension) facts")
+    if conflicts:
+        print(f"❌ {len(conflicts)} conflicting fact(s):")
+        for c in conflicts:
+            print(f"   {c}")
+        sys.exit(1)
+    print("✅ No conflicting facts")
@@ -9,6 +9,12 @@ Usage:
   PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py --date 2026-03-01
   PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py --dry-run
   PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py --force  # overwrite existing
+  PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py --days 7 --concurrency 4  # refill a week
+  PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py --date 2026-03-01 --until 2026-03-31
+  PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py --hedge-after 45 --hedge-model gemini-2.5-pro
+  PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py --fill-pool 14   # stage candidates ahead of time
+  PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py --promote        # publish tomorrow from the pool
+  python3 generate_puzzle.py --db sqlite:///podium.db --offline --ai-cache-dir fixtures/  # no backend
 
 This script is called by the PODIUM Daily Puzzle Generation cron at 4 AM PT.
 The validation cron at 5 AM PT checks the output via validate_puzzle.py.
@@ -27,9 +33,12 @@ import logging
 import os
 import random
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 # Allow running from donecast/backend or podium/scripts
 _BACKEND_PATH = None
@@ -44,9 +53,11 @@ for _candidate in [
         sys.path.insert(0, _abs)
         break
 
-if not _BACKEND_PATH:
-    print("ERROR: Cannot find DoneCast backend. Run from donecast/backend/ with PYTHONPATH=.", file=sys.stderr)
-    sys.exit(1)
+from alerts import AlertDispatcher, rerun_command
+from entities import DEFAULT_COOLDOWN_DAYS, build_entity_index
+from facts import build_fact_ledger
+from puzzle_rules import ItemCheck, ValidationError, check_puzzle
+from puzzle_store import DB_URL_ENV, HorizonState, PuzzleStore, as_date
 
 logging.basicConfig(
     level=logging.INFO,
@@ -116,171 +127,395 @@ Use IDs "a" through "e" exactly. Items must be in CORRECT ORDER (sort_value asce
 
 
 # ─── Validation ──────────────────────────────────────────────────────────────
+# The rules live in puzzle_rules.py, shared with validate_puzzle.py and seed_puzzles.py.
 
-class ValidationError(Exception):
-    pass
+def validate_puzzle(data: dict, target_date: date) -> None:
+    """Raises ValidationError listing every rule the puzzle data breaks."""
+    issues = check_puzzle(data)
+    if issues:
+        raise ValidationError(issues)
+    log.info("Validation passed ✅")
 
 
-def validate_puzzle(data: dict, target_date: date) -> None:
-    """Raises ValidationError if the puzzle data is invalid."""
+# ─── AI Generation ────────────────────────────────────────────────────────────
 
-    required_fields = ["question", "direction", "category", "emoji", "fun_fact", "items"]
-    for field in required_fields:
-        if field not in data:
-            raise ValidationError(f"Missing required field: {field!r}")
+# Response cache (ai_cache.ResponseCache); configured by main(), None = disabled
+AI_CACHE = None
 
-    if not isinstance(data["items"], list):
-        raise ValidationError("items must be a list")
 
-    if len(data["items"]) != 5:
-        raise ValidationError(f"items must have exactly 5 elements, got {len(data['items'])}")
+def _ai_request(
+    prompt: str,
+    model: Optional[str] = None,
+    attempt: int = 0,
+    temperature_offset: float = 0.0,
+) -> dict:
+    """The full set of generate() parameters for a call — also the AI cache key material."""
+    return {
+        "model": model or os.getenv("PODIUM_AI_MODEL") or os.getenv("DEFAULT_AI_MODEL") or "gemini-2.5-flash",
+        "prompt": prompt,
+        # Slightly increase temp on retries for variety; hedged requests may add an offset
+        "temperature": round(0.8 + (attempt * 0.1) + temperature_offset, 2),
+        "max_tokens": 1500,
+        "system_prompt": SYSTEM_PROMPT,
+    }
 
-    expected_ids = ["a", "b", "c", "d", "e"]
-    for i, item in enumerate(data["items"]):
-        for field in ("id", "name", "sort_value", "display_value"):
-            if field not in item:
-                raise ValidationError(f"Item {i} missing field {field!r}")
 
-        if item["id"] != expected_ids[i]:
-            raise ValidationError(f"Item {i} has id {item['id']!r}, expected {expected_ids[i]!r}")
+def _ai_cache_key(request: dict) -> str:
+    from ai_cache import request_key
+    return request_key(**request)
 
-        if not isinstance(item["name"], str) or not item["name"].strip():
-            raise ValidationError(f"Item {i} has invalid name")
 
-        if not isinstance(item["sort_value"], (int, float)):
-            raise ValidationError(f"Item {i} sort_value must be numeric, got {type(item['sort_value'])}")
+def call_ai(
+    prompt: str,
+    model: Optional[str] = None,
+    attempt: int = 0,
+    temperature_offset: float = 0.0,
+    on_chunk: Optional[Callable[[str], None]] = None,
+) -> str:
+    """
+    Call the DoneCast Gemini client (or replay a cached response) and return the raw text.
 
-        if not isinstance(item["display_value"], str) or not item["display_value"].strip():
-            raise ValidationError(f"Item {i} has invalid display_value")
+    With on_chunk, the response is streamed when the client offers generate_stream()
+    and each chunk is passed to on_chunk as it arrives; if on_chunk raises, the
+    stream is closed and the exception propagates (nothing is cached). Without
+    streaming support, on_chunk sees the whole response at once.
+    """
+    request = _ai_request(prompt, model, attempt, temperature_offset)
+    key = _ai_cache_key(request) if AI_CACHE else None
+    if key:
+        cached = AI_CACHE.get(key)
+        if cached is not None:
+            log.info(f"AI cache hit (attempt {attempt + 1}, model={request['model']}, key={key[:12]})")
+            if on_chunk:
+                on_chunk(cached)
+            return cached
+
+    from api.services.ai_content import client_gemini
+
+    kwargs = {
+        "model": request["model"],
+        "temperature": request["temperature"],
+        "max_tokens": request["max_tokens"],
+        "system_instruction": request["system_prompt"],
+    }
+    generate_stream = getattr(client_gemini, "generate_stream", None)
+    if on_chunk and generate_stream:
+        log.info(f"Streaming AI (attempt {attempt + 1}, model={request['model']})...")
+        chunks = []
+        stream = generate_stream(prompt, **kwargs)
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                on_chunk(chunk)
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+        response = "".join(chunks)
+    else:
+        log.info(f"Calling AI (attempt {attempt + 1}, model={request['model']})...")
+        response = client_gemini.generate(prompt, **kwargs)
+        if on_chunk:
+            on_chunk(response)
+    if key:
+        AI_CACHE.put(key, response, {"model": request["model"], "temperature": request["temperature"]})
+    return response
 
-    # sort_values must be strictly increasing
-    sort_vals = [item["sort_value"] for item in data["items"]]
-    for i in range(len(sort_vals) - 1):
-        if sort_vals[i] >= sort_vals[i + 1]:
-            raise ValidationError(
-                f"sort_values must be strictly increasing: "
-                f"item[{i}]={sort_vals[i]} >= item[{i+1}]={sort_vals[i+1]}"
-            )
 
-    # Names must be unique
-    names = [item["name"] for item in data["items"]]
-    if len(set(names)) != len(names):
-        raise ValidationError("Duplicate item names")
+def forget_ai_response(
+    prompt: str,
+    model: Optional[str] = None,
+    attempt: int = 0,
+    temperature_offset: float = 0.0,
+) -> None:
+    """Drop a cached response that turned out to be unusable, so a rerun asks the model again."""
+    if AI_CACHE:
+        AI_CACHE.discard(_ai_cache_key(_ai_request(prompt, model, attempt, temperature_offset)))
 
-    # Strings can't be empty
-    for field in ("question", "direction", "category", "fun_fact"):
-        if not data[field].strip():
-            raise ValidationError(f"{field!r} must not be empty")
 
-    # Question sanity check
-    if len(data["question"]) < 20:
-        raise ValidationError(f"question seems too short: {data['question']!r}")
+def puzzle_stream() -> "JSONObjectStream":
+    """A streaming parser that runs ItemCheck on each item as soon as it is complete."""
+    from json_stream import JSONObjectStream
+    return JSONObjectStream(array_key="items", on_item=ItemCheck())
 
-    if len(data["fun_fact"]) < 50:
-        raise ValidationError(f"fun_fact seems too short: {data['fun_fact']!r}")
 
-    log.info("Validation passed ✅")
+def extract_json(raw: str) -> dict:
+    """Extract and parse the first JSON object from an AI response (ignores markdown fences/prose)."""
+    from json_stream import JSONObjectStream
+    stream = JSONObjectStream()
+    stream.feed(raw)
+    return stream.result()
 
 
-# ─── AI Generation ────────────────────────────────────────────────────────────
+# ─── DB Operations ────────────────────────────────────────────────────────────
 
-def call_ai(prompt: str, model: Optional[str] = None, attempt: int = 0) -> str:
-    """Call the DoneCast Gemini client and return the raw text response."""
-    from api.services.ai_content.client_gemini import generate
+def open_similarity_index(conn):
+    """Load the cached SimilarityIndex and sync it with every puzzle in the DB (only changes are hashed)."""
+    from sqlalchemy import text
+    from similarity import SimilarityIndex
 
-    model_name = model or os.getenv("PODIUM_AI_MODEL") or os.getenv("DEFAULT_AI_MODEL") or "gemini-2.5-flash"
+    index = SimilarityIndex.load()
+    result = conn.execute(text("SELECT puzzle_date, category, question FROM podium_puzzle"))
+    changed = index.sync((as_date(row[0]).isoformat(), row[1], row[2]) for row in result)
+    if changed or index.dirty:
+        log.info(f"Similarity index: {changed} puzzle(s) (re)indexed, {len(index)} total")
+        index.save()
+    return index
 
-    log.info(f"Calling AI (attempt {attempt + 1}, model={model_name})...")
-    response = generate(
-        prompt,
-        model=model_name,
-        temperature=0.8 + (attempt * 0.1),  # Slightly increase temp on retries for variety
-        max_tokens=1500,
-        system_instruction=SYSTEM_PROMPT,
-    )
-    return response
 
+# ─── Core Generate Loop ───────────────────────────────────────────────────────
 
-def extract_json(raw: str) -> dict:
-    """Extract and parse JSON from an AI response (strips markdown fences if present)."""
-    # Strip markdown code fences
-    text = raw.strip()
-    if text.startswith("```"):
-        lines = text.split("\n")
-        # Remove first and last fence lines
-        lines = [l for l in lines if not l.startswith("```")]
-        text = "\n".join(lines).strip()
+MAX_ATTEMPTS = 4
+DEFAULT_CONCURRENCY = 4
+DEFAULT_ENTITY_COOLDOWN = DEFAULT_COOLDOWN_DAYS  # days between two puzzles featuring the same item
+DEFAULT_DEADLINE_S = 50 * 60  # the validation cron runs an hour after generation starts
+DEFAULT_HEDGE_TEMPERATURE_OFFSET = -0.3
 
-    # Find JSON object boundaries
-    start = text.find("{")
-    end = text.rfind("}") + 1
-    if start == -1 or end == 0:
-        raise ValueError(f"No JSON object found in response. Got: {text[:200]!r}")
 
-    json_str = text[start:end]
-    return json.loads(json_str)
+@dataclass
+class RetryPolicy:
+    """
+    How generate_puzzle_data() schedules its AI attempts (see scheduler.py).
 
+    deadline_at is a time.monotonic() instant shared by every date in a run;
+    when unset, generate_horizon() derives it from deadline_s. With hedge_after
+    set, a round whose primary request is still pending after that many seconds
+    also sends a hedged request: to hedge_model if given, otherwise to the same
+    model at temperature + hedge_temperature_offset.
+    """
+    max_rounds: int = MAX_ATTEMPTS
+    deadline_s: Optional[float] = DEFAULT_DEADLINE_S
+    deadline_at: Optional[float] = None
+    hedge_after: Optional[float] = None
+    hedge_model: Optional[str] = None
+    hedge_temperature_offset: float = DEFAULT_HEDGE_TEMPERATURE_OFFSET
+    attempt_log: Optional[str] = None  # NDJSON file that per-attempt records are appended to
+
+    def variants(self, model: Optional[str]) -> list:
+        from scheduler import Variant
+        variants = [Variant("primary", model=model)]
+        if self.hedge_after is not None:
+            if self.hedge_model:
+                variants.append(Variant(f"hedge:{self.hedge_model}", model=self.hedge_model))
+            else:
+                variants.append(Variant(
+                    f"hedge:temp{self.hedge_temperature_offset:+.1f}",
+                    model=model,
+                    temperature_offset=self.hedge_temperature_offset,
+                ))
+        return variants
+
+
+_ATTEMPT_LOG_LOCK = threading.Lock()
+
+
+def _record_attempts(target_date: date, records: list, policy: RetryPolicy) -> None:
+    """Log a one-line summary of every attempt and append them to policy.attempt_log."""
+    if not records:
+        return
+    summary = ", ".join(
+        f"r{r.round + 1}/{r.variant} {r.outcome}"
+        + (f" {r.latency_s:.1f}s" if r.latency_s is not None else "")
+        for r in records
+    )
+    log.info(f"[{target_date}] Attempts: {summary}")
+    if not policy.attempt_log:
+        return
+    with _ATTEMPT_LOG_LOCK, open(policy.attempt_log, "a", encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps({"puzzle_date": target_date.isoformat(), **r.as_dict()}) + "\n")
 
-# ─── DB Operations ────────────────────────────────────────────────────────────
 
-def get_recent_categories(conn, limit: int = 30) -> list[str]:
-    """Fetch recent puzzle categories from the DB to avoid repetition."""
-    from sqlalchemy import text
-    try:
-        result = conn.execute(text(
-            "SELECT category FROM podium_puzzle ORDER BY puzzle_date DESC LIMIT :n"
-        ), {"n": limit})
-        return [row[0] for row in result if row[0]]
-    except Exception as e:
-        log.warning(f"Could not fetch recent categories: {e}")
-        return []
+class CategoryLedger:
+    """
+    Recent DB categories plus categories claimed by puzzles generated in this run.
+    Shared by concurrent workers so two dates in one batch can't land on the same category.
+    With a SimilarityIndex, claimed puzzles are added to it too, so near-duplicates
+    are caught both against history and within the batch. Their index keys are
+    the dates, prefixed by key_prefix when the dates are only placeholders.
+    With an EntityIndex, items must respect entity_cooldown days between uses;
+    that needs real dates, so it is skipped when key_prefix is set. With a
+    FactLedger, sort_values contradicting known facts are rejected (or only
+    logged, with fact_check="warn").
+    """
 
+    def __init__(
+        self,
+        recent_categories: list[str],
+        similarity=None,
+        key_prefix: str = "",
+        entities=None,
+        entity_cooldown: int = DEFAULT_ENTITY_COOLDOWN,
+        facts=None,
+        fact_check: str = "reject",
+    ):
+        self._recent = list(recent_categories)
+        self._claimed: dict[str, tuple[str, date]] = {}
+        self._lock = threading.RLock()  # re-entered by check_and_claim -> claim
+        self.similarity = similarity
+        self.key_prefix = key_prefix
+        self.entities = None if key_prefix else entities
+        self.entity_cooldown = entity_cooldown
+        self.facts = facts if fact_check != "off" else None
+        self.fact_check = fact_check
+
+    def snapshot(self) -> list[str]:
+        """Categories to avoid: recent DB ones, then those claimed in this batch."""
+        with self._lock:
+            return self._recent + [category for category, _ in self._claimed.values()]
+
+    def conflicts(self, data: dict, target_date: date) -> list[str]:
+        """
+        Issues for a category/question too close to an earlier puzzle, or items
+        within their entity cooldown of a puzzle on either side of target_date
+        (target_date's own puzzle is ignored).
+        """
+        issues = []
+        if self.similarity is not None:
+            issues += self.similarity.near_duplicates(data, exclude=self.key_prefix + target_date.isoformat())
+        if self.entities is not None:
+            issues += self.entities.cooldown_issues(data["items"], target_date, self.entity_cooldown, both_sides=True)
+        if self.facts is not None:
+            contradictions = self.facts.contradictions(data, exclude_date=None if self.key_prefix else target_date)
+            if self.fact_check == "warn":
+                for issue in contradictions:
+                    log.warning(f"[{target_date}] Fact check: {issue}")
+            else:
+                issues += contradictions
+        return issues
+
+    def claim(self, data: dict, target_date: date) -> Optional[date]:
+        """Claim data's category for target_date. Returns the date already holding it, or None."""
+        category = data["category"]
+        key = category.strip().lower()
+        with self._lock:
+            holder = self._claimed.get(key)
+            if holder and holder[1] != target_date:
+                return holder[1]
+            self._claimed[key] = (category, target_date)
+        if self.similarity is not None:
+            self.similarity.add(self.key_prefix + target_date.isoformat(), category, data["question"])
+        if self.entities is not None:
+            self.entities.add_puzzle(target_date, data["items"], category)
+        if self.facts is not None:
+            self.facts.add_puzzle(data, f"{self.key_prefix}{target_date.isoformat()} (this run)", target_date)
+        return None
+
+    def check_and_claim(self, data: dict, target_date: date) -> list[str]:
+        """
+        conflicts() then claim() as one step under the ledger lock, so two dates
+        can't both pass the checks against an index neither has been added to yet.
+        Returns the issues (nothing is claimed), or [] once data is claimed.
+        """
+        with self._lock:
+            issues = self.conflicts(data, target_date)
+            if issues:
+                return issues
+            holder = self.claim(data, target_date)
+            if holder:
+                return [
+                    f"category {data['category']!r} is already used by the {holder} puzzle; "
+                    f"pick a different one"
+                ]
+            return []
+
+
+def generate_puzzle_data(
+    target_date: date,
+    puzzle_number: int,
+    ledger: CategoryLedger,
+    model: Optional[str] = None,
+    policy: Optional[RetryPolicy] = None,
+) -> dict:
+    """
+    Generate and validate one puzzle with AI, retrying with self-correcting prompts.
 
-def get_next_puzzle_number(conn) -> int:
-    """Return the next puzzle number (max + 1, or 1 if no puzzles exist)."""
-    from sqlalchemy import text
-    try:
-        result = conn.execute(text("SELECT MAX(puzzle_number) FROM podium_puzzle"))
-        val = result.scalar()
-        return (val or 0) + 1
-    except Exception as e:
-        log.warning(f"Could not get max puzzle_number: {e}")
-        return 1
+    Attempts are scheduled by HedgedScheduler under the policy's deadline and
+    hedging settings; the first response that passes validation wins.
+    Returns the puzzle data dict. Raises RuntimeError (DeadlineExceeded is one)
+    once the rounds or the deadline run out.
+    """
+    from scheduler import HedgedScheduler, Rejected
+
+    policy = policy or RetryPolicy()
+    feedback = ""
+    winner_lock = threading.Lock()
+    # Set once an attempt wins or the scheduler gives up (deadline/rounds); after
+    # that, attempts still running on their daemon threads must not claim.
+    finished = False
+
+    def attempt(round_no: int, variant) -> dict:
+        nonlocal feedback, finished
+        label = f"Attempt {round_no + 1} ({variant.name})"
+        # Rebuilt each attempt so it sees categories claimed by other in-flight dates
+        prompt = build_prompt(target_date, puzzle_number, ledger.snapshot()) + feedback
+        call = (prompt, variant.model, round_no, variant.temperature_offset)
+        parser = puzzle_stream()
+        try:
+            # Items are checked as they stream in; the first bad one aborts the call
+            raw = call_ai(*call, on_chunk=parser.feed)
+            log.debug(f"Raw AI response (first 500 chars): {raw[:500]}")
 
+            data = parser.result()
+            validate_puzzle(data, target_date)
 
-def puzzle_exists(conn, target_date: date) -> bool:
-    """Check if a puzzle already exists for the given date."""
-    from sqlalchemy import text
-    result = conn.execute(text(
-        "SELECT id FROM podium_puzzle WHERE puzzle_date = :d"
-    ), {"d": target_date})
-    return result.fetchone() is not None
+            with winner_lock:
+                if finished:
+                    raise Rejected("another attempt already won or the run gave up", outcome="abandoned")
+                issues = ledger.check_and_claim(data, target_date)
+                if issues:
+                    raise ValidationError(issues)
+                finished = True
 
+            log.info(
+                f"[{target_date}] Generated: category={data['category']!r}, "
+                f"direction={data['direction']!r}, "
+                f"items={[item['name'] for item in data['items']]}"
+            )
+            return data
 
-def insert_puzzle(conn, target_date: date, puzzle_number: int, data: dict) -> None:
-    """Insert the generated puzzle into the database."""
-    from sqlalchemy import text
-    conn.execute(text("""
-        INSERT INTO podium_puzzle
-            (puzzle_date, puzzle_number, question, direction, category, emoji, fun_fact, items_json)
-        VALUES
-            (:puzzle_date, :puzzle_number, :question, :direction, :category, :emoji, :fun_fact, :items_json)
-    """), {
-        "puzzle_date": target_date,
-        "puzzle_number": puzzle_number,
-        "question": data["question"],
-        "direction": data["direction"],
-        "category": data.get("category"),
-        "emoji": data.get("emoji", "🎙️"),
-        "fun_fact": data.get("fun_fact"),
-        "items_json": json.dumps(data["items"]),
-    })
-    log.info(f"Inserted puzzle #{puzzle_number} for {target_date}")
+        except Rejected:
+            raise
 
+        except json.JSONDecodeError as e:
+            forget_ai_response(*call)
+            error = f"JSON parse error: {e}. Response: {e.doc[:300]!r}"
+            log.warning(f"[{target_date}] {label} failed (JSON): {error}")
+            raise Rejected(error, outcome="json")
 
-# ─── Core Generate Loop ───────────────────────────────────────────────────────
+        except ValidationError as e:
+            forget_ai_response(*call)
+            where = "" if parser.complete else f" mid-stream after {parser.items_seen} item(s)"
+            log.warning(f"[{target_date}] {label} failed (validation{where}): {len(e.issues)} issue(s)")
+            for issue in e.issues:
+                log.warning(f"   - {issue}")
+            # Inject every error into the next attempt's prompt so they're all fixed at once
+            listed = "\n".join(f"- {issue}" for issue in e.issues)
+            feedback = (
+                f"\n\nIMPORTANT: Your previous attempt had these errors:\n{listed}\n"
+                f"Fix all of them in your new response."
+            )
+            raise Rejected(f"Validation failed: {e}")
 
-MAX_ATTEMPTS = 4
+        except Exception as e:
+            forget_ai_response(*call)
+            log.error(f"[{target_date}] {label} failed (unexpected): {e}", exc_info=True)
+            raise
+
+    scheduler = HedgedScheduler(
+        max_rounds=policy.max_rounds,
+        deadline_s=policy.deadline_s if policy.deadline_at is None else None,
+        deadline_at=policy.deadline_at,
+        hedge_after=policy.hedge_after,
+        variants=policy.variants(model),
+        label=str(target_date),
+    )
+    try:
+        return scheduler.run(attempt)
+    finally:
+        with winner_lock:
+            finished = True
+        _record_attempts(target_date, scheduler.records, policy)
 
 
 def generate_and_save(
@@ -288,92 +523,270 @@ def generate_and_save(
     dry_run: bool = False,
     force: bool = False,
     model: Optional[str] = None,
+    policy: Optional[RetryPolicy] = None,
+    entity_cooldown: int = DEFAULT_ENTITY_COOLDOWN,
+    fact_check: str = "reject",
+    store: Optional[PuzzleStore] = None,
 ) -> dict:
     """
     Main generation loop. Generates a puzzle with AI, validates it, and saves to DB.
     Returns the final puzzle data dict on success.
-    Raises RuntimeError on total failure after MAX_ATTEMPTS.
+    Raises RuntimeError on total failure (rounds or deadline exhausted).
     """
-    from api.core.database import engine
-    from sqlalchemy import text as sql_text
-
-    with engine.begin() as conn:
-        # Check if puzzle already exists
-        if not force and puzzle_exists(conn, target_date):
-            log.info(f"Puzzle for {target_date} already exists. Use --force to overwrite.")
-            return {}
-
-        recent_categories = get_recent_categories(conn)
-        puzzle_number = get_next_puzzle_number(conn)
+    results, failures = generate_horizon(
+        [target_date], dry_run=dry_run, force=force, model=model, concurrency=1, policy=policy,
+        entity_cooldown=entity_cooldown, fact_check=fact_check, store=store,
+    )
+    if failures:
+        raise RuntimeError(failures[target_date])
+    return results.get(target_date, {})
+
+
+def _generate_many(
+    numbers: dict[date, int],
+    ledger: CategoryLedger,
+    model: Optional[str],
+    concurrency: int,
+    policy: RetryPolicy,
+) -> tuple[dict[date, dict], dict[date, str]]:
+    """Run generate_puzzle_data for each (date, number) on a thread pool. Returns (results, errors)."""
+    log.info(f"Generating {len(numbers)} PODIUM puzzle(s) with concurrency {min(concurrency, len(numbers))}")
+    results: dict[date, dict] = {}
+    failures: dict[date, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(numbers)))) as pool:
+        futures = {
+            pool.submit(generate_puzzle_data, d, n, ledger, model, policy): d
+            for d, n in numbers.items()
+        }
+        for future in as_completed(futures):
+            d = futures[future]
+            try:
+                results[d] = future.result()
+            except Exception as e:
+                failures[d] = str(e)
+                log.error(f"❌ [{d}] {e}")
+    return results, failures
+
+
+def _allocate_numbers(dates: list[date], state: HorizonState, force: bool) -> dict[date, int]:
+    """Puzzle numbers for dates (sorted): existing ones kept with force, others skipped; new dates max + 1, ..."""
+    numbers: dict[date, int] = {}
+    next_number = state.next_number
+    for d in dates:
+        if d in state.existing:
+            if force:
+                numbers[d] = state.existing[d]
+        else:
+            numbers[d] = next_number
+            next_number += 1
+    return numbers
+
+
+def generate_horizon(
+    dates: list[date],
+    dry_run: bool = False,
+    force: bool = False,
+    model: Optional[str] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    policy: Optional[RetryPolicy] = None,
+    entity_cooldown: int = DEFAULT_ENTITY_COOLDOWN,
+    fact_check: str = "reject",
+    store: Optional[PuzzleStore] = None,
+) -> tuple[dict[date, dict], dict[date, str]]:
+    """
+    Generate puzzles for many dates concurrently and save them in one transaction.
+
+    Puzzle numbers are allocated when saving, to the successful dates only and in
+    date order (max + 1, max + 2, ...), so they don't depend on which worker
+    finishes first and a failed date leaves no gap; --force keeps a date's
+    existing number. The numbers in the prompts are provisional.
+    Returns (results by date, errors by date for failed dates).
+    Dates that already exist (without force) are skipped and absent from both.
+    The policy's deadline covers the whole run, not each date.
+    """
+    policy = policy or RetryPolicy()
+    if policy.deadline_at is None and policy.deadline_s is not None:
+        policy = replace(policy, deadline_at=time.monotonic() + policy.deadline_s)
+
+    store = store or PuzzleStore.open()
+    dates = sorted(set(dates))
+    with store.connect() as conn:
+        state = store.horizon_state(conn, dates[0], dates[-1])
+        similarity = open_similarity_index(conn)
+        entities = build_entity_index(conn) if entity_cooldown > 0 else None
+        facts = build_fact_ledger(conn) if fact_check != "off" else None
+
+    recent_categories = state.recent_categories
+    for d in dates:
+        if d in state.existing and not force:
+            log.info(f"Puzzle for {d} already exists. Use --force to overwrite.")
+    numbers = _allocate_numbers(dates, state, force)  # provisional, for the prompts
+
+    if not numbers:
+        return {}, {}
 
-    log.info(f"Generating PODIUM puzzle #{puzzle_number} for {target_date}")
     log.info(f"Avoiding recent categories: {recent_categories[-10:]}")
+    ledger = CategoryLedger(
+        recent_categories, similarity,
+        entities=entities, entity_cooldown=entity_cooldown,
+        facts=facts, fact_check=fact_check,
+    )
+    results, failures = _generate_many(numbers, ledger, model, concurrency, policy)
+
+    if dry_run:
+        final = _allocate_numbers(sorted(results), state, force)
+        for d in sorted(results):
+            log.info(f"[DRY RUN] Would insert puzzle #{final[d]} for {d}:")
+            log.info(json.dumps(results[d], indent=2, ensure_ascii=False))
+        return results, failures
+
+    if results:
+        # Number and save every successful date in one transaction; --force updates existing rows in place
+        with store.begin() as conn:
+            final = _allocate_numbers(sorted(results), store.horizon_state(conn, dates[0], dates[-1]), force)
+            saved = store.save_puzzles(
+                conn, [(d, final[d], results[d]) for d in sorted(final)], overwrite=force,
+            )
+        if saved < len(results):
+            log.warning(f"{len(results) - saved} date(s) were filled by someone else meanwhile; kept theirs")
 
-    prompt = build_prompt(target_date, puzzle_number, recent_categories)
+        similarity.save()  # already holds the new puzzles, added as they were claimed
+        for d in sorted(final):
+            log.info(f"✅ PODIUM puzzle #{final[d]} for {d} generated and saved.")
 
-    last_error = None
-    for attempt in range(MAX_ATTEMPTS):
-        if attempt > 0:
-            wait = 2 ** attempt  # exponential backoff: 2, 4, 8 seconds
-            log.info(f"Retrying in {wait}s... (attempt {attempt + 1}/{MAX_ATTEMPTS})")
-            time.sleep(wait)
+    return results, failures
 
-        try:
-            raw = call_ai(prompt, model=model, attempt=attempt)
-            log.debug(f"Raw AI response (first 500 chars): {raw[:500]}")
 
-            data = extract_json(raw)
-            validate_puzzle(data, target_date)
+# ─── Candidate Pool ───────────────────────────────────────────────────────────
 
-            log.info(
-                f"Generated: category={data['category']!r}, "
-                f"direction={data['direction']!r}, "
-                f"items={[item['name'] for item in data['items']]}"
-            )
+class PoolEmpty(RuntimeError):
+    pass
 
-            if dry_run:
-                log.info("[DRY RUN] Would insert:")
-                log.info(json.dumps(data, indent=2, ensure_ascii=False))
-                return data
 
-            # Save to DB
-            with engine.begin() as conn:
-                if force and puzzle_exists(conn, target_date):
-                    conn.execute(sql_text(
-                        "DELETE FROM podium_puzzle WHERE puzzle_date = :d"
-                    ), {"d": target_date})
-                    log.info(f"Deleted existing puzzle for {target_date} (--force)")
+def fill_pool(
+    target_size: int,
+    model: Optional[str] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    policy: Optional[RetryPolicy] = None,
+    dry_run: bool = False,
+    fact_check: str = "reject",
+    store: Optional[PuzzleStore] = None,
+) -> tuple[int, dict[date, str]]:
+    """
+    Generate candidates until podium_candidate holds target_size of them.
+    Returns (candidates added, errors by placeholder date for failed generations).
 
-                insert_puzzle(conn, target_date, puzzle_number, data)
+    Candidates have no date yet; each is generated for the date it would
+    roughly be published on (tomorrow + current pool size + k), which only
+    feeds the prompt and keeps the CategoryLedger claims distinct.
+    """
+    from candidate_pool import add_candidate, ensure_pool_table, pool_categories, pool_size, pool_texts
+
+    policy = policy or RetryPolicy()
+    if policy.deadline_at is None and policy.deadline_s is not None:
+        policy = replace(policy, deadline_at=time.monotonic() + policy.deadline_s)
+
+    store = store or PuzzleStore.open()
+    with store.begin() as conn:
+        ensure_pool_table(conn)
+        size = pool_size(conn)
+        staged = pool_categories(conn)
+        tomorrow = date.today() + timedelta(days=1)
+        state = store.horizon_state(conn, tomorrow, tomorrow)
+        recent_categories, next_number = state.recent_categories, state.next_number
+        similarity = open_similarity_index(conn)
+        # Staged candidates count as history here, but aren't persisted in the index
+        for key, category, question in pool_texts(conn):
+            similarity.add(f"pool:{key[:12]}", category, question)
+        facts = build_fact_ledger(conn) if fact_check != "off" else None
+
+    needed = target_size - size
+    log.info(f"Candidate pool: {size} staged, target {target_size}")
+    if needed <= 0:
+        return 0, {}
+
+    first = date.today() + timedelta(days=1 + size)
+    numbers = {first + timedelta(days=k): next_number + size + k for k in range(needed)}
+    ledger = CategoryLedger(
+        recent_categories + staged, similarity, key_prefix="new:", facts=facts, fact_check=fact_check,
+    )
+    results, failures = _generate_many(numbers, ledger, model, concurrency, policy)
 
-            log.info(f"✅ PODIUM puzzle #{puzzle_number} for {target_date} generated and saved.")
-            return data
+    if dry_run:
+        for d in sorted(results):
+            log.info(f"[DRY RUN] Would stage candidate {results[d]['category']!r}")
+        return len(results), failures
 
-        except json.JSONDecodeError as e:
-            last_error = f"JSON parse error: {e}. Response: {raw[:300]!r}"
-            log.warning(f"Attempt {attempt + 1} failed (JSON): {last_error}")
+    added = 0
+    with store.begin() as conn:
+        for d in sorted(results):
+            added += add_candidate(conn, results[d], model)
+    log.info(f"✅ Staged {added} candidate(s); pool now {size + added}/{target_size}")
+    return added, failures
 
-        except ValidationError as e:
-            last_error = f"Validation failed: {e}"
-            log.warning(f"Attempt {attempt + 1} failed (validation): {e}")
-            # Inject the error into the next attempt's prompt for correction
-            prompt = build_prompt(target_date, puzzle_number, recent_categories) + (
-                f"\n\nIMPORTANT: Your previous attempt had this error: {e}\n"
-                f"Fix this in your new response."
-            )
 
-        except Exception as e:
-            last_error = f"Unexpected error: {e}"
-            log.error(f"Attempt {attempt + 1} failed (unexpected): {e}", exc_info=True)
+def promote_from_pool(
+    target_date: date,
+    force: bool = False,
+    entity_cooldown: int = DEFAULT_ENTITY_COOLDOWN,
+    fact_check: str = "reject",
+    store: Optional[PuzzleStore] = None,
+) -> dict:
+    """
+    Publish a staged candidate as target_date's puzzle in one transaction.
+    Returns the puzzle data, {} if the date already has a puzzle (without force),
+    and raises PoolEmpty if no candidate fits the category-recency window and
+    passes the same CategoryLedger checks as a freshly generated puzzle.
+    """
+    from candidate_pool import ensure_pool_table, pool_size, take_candidate
+
+    store = store or PuzzleStore.open()
+    with store.begin() as conn:
+        ensure_pool_table(conn)
+        state = store.horizon_state(conn, target_date, target_date)
+        if target_date in state.existing:
+            if not force:
+                log.info(f"Puzzle for {target_date} already exists. Use --force to overwrite.")
+                return {}
+            puzzle_number = state.existing[target_date]
+        else:
+            puzzle_number = state.next_number
+
+        # Candidates were checked when staged, but puzzles may have been published since
+        ledger = CategoryLedger(
+            state.recent_categories, open_similarity_index(conn),
+            entities=build_entity_index(conn) if entity_cooldown > 0 else None,
+            entity_cooldown=entity_cooldown,
+            facts=build_fact_ledger(conn) if fact_check != "off" else None,
+            fact_check=fact_check,
+        )
+        data = take_candidate(conn, target_date, conflicts=lambda d: ledger.conflicts(d, target_date))
+        if data is None:
+            raise PoolEmpty(f"No eligible candidate in the pool for {target_date}")
+        if not store.save_puzzles(conn, [(target_date, puzzle_number, data)], overwrite=force):
+            raise RuntimeError(f"Puzzle for {target_date} was inserted by someone else meanwhile")
+        remaining = pool_size(conn)
 
-    raise RuntimeError(
-        f"Failed to generate valid puzzle after {MAX_ATTEMPTS} attempts. "
-        f"Last error: {last_error}"
-    )
+    log.info(f"✅ PODIUM puzzle #{puzzle_number} for {target_date} promoted from the pool ({remaining} left)")
+    return data
 
 
 # ─── CLI ─────────────────────────────────────────────────────────────────────
 
+# Failures are buffered and sent as one alert when the run ends
+ALERTS = AlertDispatcher(
+    "PODIUM puzzle generation FAILED",
+    fix=lambda dates: f"Run manually: `{rerun_command('generate_puzzle.py', dates, '--verbose')}`",
+)
+# Pool fills aren't about a date: keyed by their --fill-pool flag, so the hint refills the pool
+POOL_ALERTS = AlertDispatcher(
+    "PODIUM candidate pool fill FAILED",
+    fix=lambda runs: "Run manually: `cd donecast/backend && "
+                     + "; ".join(f"PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py {r} --verbose" for r in runs)
+                     + "`",
+)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Generate tomorrow's PODIUM puzzle using AI",
@@ -383,6 +796,30 @@ def main() -> int:
         "--date", default=None,
         help="Target date YYYY-MM-DD (default: tomorrow)"
     )
+    parser.add_argument(
+        "--days", type=int, default=1,
+        help="Generate N consecutive dates starting at --date (default: 1)"
+    )
+    parser.add_argument(
+        "--until", default=None,
+        help="Generate every date from --date through this date YYYY-MM-DD (inclusive)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"Max puzzles generated in parallel for --days/--until (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--fill-pool", type=int, default=None, metavar="N",
+        help="Generate candidates until the staging pool holds N (no puzzle is published)"
+    )
+    parser.add_argument(
+        "--promote", action="store_true",
+        help="Publish the target date (one date, no --dry-run) from the candidate pool; generate on the spot if none fits"
+    )
+    parser.add_argument(
+        "--no-fallback", action="store_true",
+        help="With --promote, fail instead of generating when the pool has no eligible candidate"
+    )
     parser.add_argument(
         "--dry-run", action="store_true",
         help="Generate but don't save to DB"
@@ -395,15 +832,85 @@ def main() -> int:
         "--model", default=None,
         help="Override AI model name"
     )
+    parser.add_argument(
+        "--deadline", type=float, default=DEFAULT_DEADLINE_S,
+        help=f"Give up on any date still unsolved after this many seconds (default: {DEFAULT_DEADLINE_S})"
+    )
+    parser.add_argument(
+        "--hedge-after", type=float, default=None,
+        help="Send a hedged request if the current one hasn't answered after this many seconds"
+    )
+    parser.add_argument(
+        "--hedge-model", default=None,
+        help="Model for hedged requests (default: same model, temperature "
+             f"{DEFAULT_HEDGE_TEMPERATURE_OFFSET:+.1f})"
+    )
+    parser.add_argument(
+        "--attempt-log", default=None,
+        help="Append per-attempt latency/outcome records (NDJSON) to this file"
+    )
+    parser.add_argument(
+        "--entity-cooldown", type=int, default=DEFAULT_ENTITY_COOLDOWN, metavar="DAYS",
+        help=f"Min days between puzzles featuring the same item (default: {DEFAULT_ENTITY_COOLDOWN}, 0 = off)"
+    )
+    parser.add_argument(
+        "--fact-check", choices=["reject", "warn", "off"], default="reject",
+        help="What to do when a sort_value contradicts the fact ledger (default: reject)"
+    )
+    parser.add_argument(
+        "--db", default=os.environ.get(DB_URL_ENV),
+        help=f"Database URL, e.g. sqlite:///podium.db (default: ${DB_URL_ENV}, else the DoneCast backend's)"
+    )
+    parser.add_argument(
+        "--no-ai-cache", action="store_true",
+        help="Always call the model; don't read or write the AI response cache"
+    )
+    parser.add_argument(
+        "--ai-cache-dir", default=None,
+        help="AI response cache directory (default: scripts/.cache/ai)"
+    )
+    parser.add_argument(
+        "--offline", action="store_true",
+        help="Only replay cached AI responses (e.g. a fixture dir); fail on a cache miss"
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true",
         help="Show debug logging"
     )
     args = parser.parse_args()
+    if args.promote:
+        # promote_from_pool publishes one date for real; reject combinations it would silently ignore
+        if args.fill_pool is not None:
+            parser.error("--promote and --fill-pool are separate jobs; run them one at a time")
+        if args.until or args.days > 1:
+            parser.error("--promote publishes a single date; drop --days/--until")
+        if args.dry_run:
+            parser.error("--promote has no dry-run mode (taking a candidate removes it from the pool)")
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if not _BACKEND_PATH and not args.db:
+        log.error("Cannot find DoneCast backend. Run from donecast/backend/ with PYTHONPATH=., or pass --db")
+        return 1
+    args.store = PuzzleStore.open(args.db)
+
+    global AI_CACHE
+    if not args.no_ai_cache:
+        from ai_cache import ResponseCache
+        AI_CACHE = ResponseCache(args.ai_cache_dir, offline=args.offline)
+        AI_CACHE.prune()
+
+    args.policy = RetryPolicy(
+        deadline_s=args.deadline if args.deadline > 0 else None,
+        hedge_after=args.hedge_after,
+        hedge_model=args.hedge_model,
+        attempt_log=args.attempt_log,
+    )
+
+    if args.fill_pool is not None:
+        return _run_fill_pool(args)
+
     # Resolve target date
     if args.date:
         try:
@@ -414,10 +921,43 @@ def main() -> int:
     else:
         target_date = date.today() + timedelta(days=1)
 
+    if args.until or args.days > 1:
+        if args.until:
+            try:
+                last_date = date.fromisoformat(args.until)
+            except ValueError:
+                log.error(f"Invalid --until date: {args.until!r}. Use YYYY-MM-DD.")
+                return 1
+        else:
+            last_date = target_date + timedelta(days=args.days - 1)
+        if last_date < target_date:
+            log.error(f"--until {last_date} is before --date {target_date}")
+            return 1
+        return _run_horizon(target_date, last_date, args)
+
     log.info(f"PODIUM puzzle generator — target date: {target_date}")
     if args.dry_run:
         log.info("DRY RUN mode — nothing will be saved")
 
+    if args.promote:
+        try:
+            promoted = promote_from_pool(
+                target_date, force=args.force, entity_cooldown=args.entity_cooldown,
+                fact_check=args.fact_check, store=args.store,
+            )
+            return 0 if promoted else 2
+        except PoolEmpty as e:
+            if args.no_fallback:
+                log.error(f"❌ {e}")
+                ALERTS.add(target_date, str(e))
+                return 1
+            log.warning(f"{e} — generating instead")
+        except Exception as e:
+            log.error(f"❌ Promotion failed: {e}", exc_info=True)
+            if args.no_fallback:
+                ALERTS.add(target_date, str(e))
+                return 1
+
     start = time.time()
     try:
         result = generate_and_save(
@@ -425,6 +965,10 @@ def main() -> int:
             dry_run=args.dry_run,
             force=args.force,
             model=args.model,
+            policy=args.policy,
+            entity_cooldown=args.entity_cooldown,
+            fact_check=args.fact_check,
+            store=args.store,
         )
         elapsed = time.time() - start
 
@@ -438,33 +982,81 @@ def main() -> int:
 
     except RuntimeError as e:
         log.error(f"❌ Generation failed: {e}")
-        _alert_on_failure(target_date, str(e))
+        ALERTS.add(target_date, str(e))
         return 1
 
     except Exception as e:
         log.error(f"❌ Unexpected failure: {e}", exc_info=True)
-        _alert_on_failure(target_date, str(e))
+        ALERTS.add(target_date, str(e))
         return 1
 
 
-def _alert_on_failure(target_date: date, error: str) -> None:
-    """Send a Slack alert when generation fails. Non-fatal — swallows exceptions."""
+def _run_horizon(first_date: date, last_date: date, args: argparse.Namespace) -> int:
+    """Generate every date in [first_date, last_date]. Exit code as for a single date."""
+    dates = [first_date + timedelta(days=i) for i in range((last_date - first_date).days + 1)]
+    log.info(f"PODIUM puzzle generator — {len(dates)} date(s): {first_date} → {last_date}")
+    if args.dry_run:
+        log.info("DRY RUN mode — nothing will be saved")
+
+    start = time.time()
     try:
-        import subprocess
-        msg = (
-            f"⚠️ PODIUM puzzle generation FAILED for {target_date}\n"
-            f"Error: {error[:500]}\n"
-            f"Run manually: `cd donecast/backend && PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py --date {target_date} --verbose`"
+        results, failures = generate_horizon(
+            dates,
+            dry_run=args.dry_run,
+            force=args.force,
+            model=args.model,
+            concurrency=args.concurrency,
+            policy=args.policy,
+            entity_cooldown=args.entity_cooldown,
+            fact_check=args.fact_check,
+            store=args.store,
         )
-        # Use openclaw to notify (same pattern as other scripts)
-        subprocess.run(
-            ["openclaw", "system", "event", "--text", msg, "--mode", "now"],
-            timeout=10, check=False, capture_output=True,
+    except Exception as e:
+        log.error(f"❌ Unexpected failure: {e}", exc_info=True)
+        ALERTS.add(first_date, str(e))
+        return 1
+
+    log.info(
+        f"Done in {time.time() - start:.1f}s — generated {len(results)}, "
+        f"failed {len(failures)}, skipped {len(dates) - len(results) - len(failures)}"
+    )
+    for d, error in sorted(failures.items()):
+        ALERTS.add(d, error)
+    if failures:
+        return 1
+    return 0 if results else 2
+
+
+def _run_fill_pool(args: argparse.Namespace) -> int:
+    """Top up the candidate pool. Exit 0 = topped up, 1 = some generations failed, 2 = already full."""
+    start = time.time()
+    try:
+        added, failures = fill_pool(
+            args.fill_pool,
+            model=args.model,
+            concurrency=args.concurrency,
+            policy=args.policy,
+            dry_run=args.dry_run,
+            fact_check=args.fact_check,
+            store=args.store,
         )
-        log.info("Alert sent via openclaw")
-    except Exception as alert_err:
-        log.warning(f"Could not send alert: {alert_err}")
+    except Exception as e:
+        log.error(f"❌ Pool fill failed: {e}", exc_info=True)
+        POOL_ALERTS.add(f"--fill-pool {args.fill_pool}", str(e))
+        return 1
+
+    log.info(f"Done in {time.time() - start:.1f}s — staged {added}, failed {len(failures)}")
+    if failures:
+        POOL_ALERTS.add(f"--fill-pool {args.fill_pool}", f"{len(failures)} generation(s) failed; "
+                                                          f"last error: {list(failures.values())[-1]}")
+        return 1
+    return 0 if added else 2
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    try:
+        exit_code = main()
+    finally:
+        ALERTS.close()  # one coalesced alert for every failure in the run
+        POOL_ALERTS.close()
+    sys.exit(exit_code)
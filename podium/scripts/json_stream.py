@@ -0,0 +1,165 @@
+"""
+Incremental scanner for a JSON object arriving in chunks (e.g. a streamed AI response).
+
+Text before the first "{" (markdown fences, preambles) is skipped, and so is
+anything after the matching "}". Elements of one top-level array (e.g. "items")
+are parsed and handed to a callback as soon as each one closes, so a caller can
+reject a bad response mid-stream instead of waiting for the full text.
+
+iter_json_array() does the same for files: it yields the elements of a
+top-level JSON array while reading it in fixed-size chunks, so a file of any
+size is parsed in bounded memory.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import IO, Any, Callable, Iterator, Optional
+
+_OPEN = "{["
+_CLOSE = "}]"
+
+
+class JSONObjectStream:
+    def __init__(
+        self,
+        array_key: Optional[str] = None,
+        on_item: Optional[Callable[[int, Any], None]] = None,
+    ):
+        self.array_key = array_key
+        self.on_item = on_item
+        self.items_seen = 0
+        self.complete = False
+        self._preamble = ""
+        self._text = ""       # from the first "{" onwards
+        self._pos = 0         # next index of _text to scan
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_string: Optional[str] = None
+        self._key: Optional[str] = None
+        self._array_depth: Optional[int] = None  # depth inside the watched array
+        self._item_start = -1
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk. Exceptions raised by on_item propagate to the caller."""
+        if self.complete or not chunk:
+            return
+        if not self._text:
+            start = chunk.find("{")
+            if start == -1:
+                self._preamble = (self._preamble + chunk)[-200:]
+                return
+            chunk = chunk[start:]
+        self._text += chunk
+        self._scan()
+
+    def _scan(self) -> None:
+        text = self._text
+        i = self._pos
+        n = len(text)
+        while i < n:
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = json.loads(text[self._string_start:i + 1])
+            elif c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c == ":" and self._depth == 1:
+                self._key = self._last_string
+            elif c in _OPEN:
+                if self._array_depth is not None and self._depth == self._array_depth:
+                    self._item_start = i
+                if c == "[" and self._depth == 1 and self.array_key is not None and self._key == self.array_key:
+                    self._array_depth = 2
+                self._depth += 1
+            elif c in _CLOSE:
+                self._depth -= 1
+                if self._array_depth is not None:
+                    if self._depth == self._array_depth and self._item_start >= 0:
+                        item = json.loads(text[self._item_start:i + 1])
+                        self._item_start = -1
+                        index = self.items_seen
+                        self.items_seen += 1
+                        if self.on_item:
+                            self.on_item(index, item)
+                    elif self._depth < self._array_depth:
+                        self._array_depth = None
+                if self._depth == 0:
+                    self.complete = True
+                    self._text = text[:i + 1]
+                    self._pos = i + 1
+                    return
+            i += 1
+        self._pos = i
+
+    def result(self) -> dict:
+        """Parse the complete object. Raises ValueError if none started, JSONDecodeError if cut short."""
+        if not self._text:
+            raise ValueError(f"No JSON object found in response. Got: {self._preamble[:200]!r}")
+        if not self.complete:
+            raise json.JSONDecodeError("Unterminated JSON object", self._text, len(self._text))
+        return json.loads(self._text)
+
+
+_WHITESPACE = " \t\r\n"
+
+
+def iter_json_array(fp: IO[str], chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Yield each element of the JSON array in fp. Raises JSONDecodeError on malformed input."""
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_whitespace() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf) or not fill():
+                return
+
+    skip_whitespace()
+    if buf[pos:pos + 1] != "[":
+        raise json.JSONDecodeError("Expected a JSON array", buf, pos)
+    pos += 1
+    first = True
+    while True:
+        skip_whitespace()
+        if buf[pos:pos + 1] == "]":
+            return
+        if not first:
+            if buf[pos:pos + 1] != ",":
+                raise json.JSONDecodeError("Expected ',' or ']'", buf, pos)
+            pos += 1
+            skip_whitespace()
+        first = False
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof or not fill():
+                    raise
+                continue
+            if end == len(buf) and not eof and fill():
+                continue  # a number at the buffer's edge may continue in the next chunk
+            break
+        pos = end
+        yield value
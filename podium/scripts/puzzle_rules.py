@@ -0,0 +1,176 @@
+"""
+PODIUM puzzle rules, shared by generate_puzzle.py, validate_puzzle.py and seed_puzzles.py.
+
+A puzzle is a dict with question, direction, category, emoji, fun_fact and
+items (a list of {id, name, sort_value, display_value}, in correct order).
+Every rule runs on every puzzle and returns a list of issue strings, so one
+pass reports all problems at once (empty list = valid).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Union
+
+REQUIRED_FIELDS = ["question", "direction", "category", "emoji", "fun_fact", "items"]
+TEXT_FIELDS = ["question", "direction", "category", "emoji", "fun_fact"]
+ITEM_FIELDS = ["id", "name", "sort_value", "display_value"]
+EXPECTED_IDS = ["a", "b", "c", "d", "e"]
+MIN_QUESTION_CHARS = 20
+MIN_FUN_FACT_CHARS = 50
+
+
+class ValidationError(Exception):
+    """A puzzle broke one or more rules. `issues` holds every violation."""
+
+    def __init__(self, issues: Union[str, list[str]]):
+        self.issues = [issues] if isinstance(issues, str) else list(issues)
+        super().__init__("; ".join(self.issues))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _items(puzzle: dict) -> list:
+    items = puzzle.get("items")
+    return items if isinstance(items, list) else []
+
+
+# ─── Rules ───────────────────────────────────────────────────────────────────
+
+def check_required_fields(puzzle: dict) -> list[str]:
+    return [f"Missing required field: {field!r}" for field in REQUIRED_FIELDS if puzzle.get(field) is None]
+
+
+def check_text_fields(puzzle: dict) -> list[str]:
+    issues = []
+    for field in TEXT_FIELDS:
+        value = puzzle.get(field)
+        if value is None:
+            continue  # reported by check_required_fields
+        if not isinstance(value, str) or not value.strip():
+            issues.append(f"{field!r} must be a non-empty string")
+    return issues
+
+
+def check_lengths(puzzle: dict) -> list[str]:
+    issues = []
+    question, fun_fact = puzzle.get("question"), puzzle.get("fun_fact")
+    if isinstance(question, str) and question.strip() and len(question) < MIN_QUESTION_CHARS:
+        issues.append(f"question seems too short: {question!r}")
+    if isinstance(fun_fact, str) and fun_fact.strip() and len(fun_fact) < MIN_FUN_FACT_CHARS:
+        issues.append(f"fun_fact seems too short: {fun_fact!r}")
+    return issues
+
+
+def check_item_count(puzzle: dict) -> list[str]:
+    items = puzzle.get("items")
+    if items is None:
+        return []
+    if not isinstance(items, list):
+        return ["items must be a list"]
+    if len(items) != len(EXPECTED_IDS):
+        return [f"items must have exactly {len(EXPECTED_IDS)} elements, got {len(items)}"]
+    return []
+
+
+def item_issues(i: int, item: Any) -> list[str]:
+    """Problems with a single item, judged on its own."""
+    if not isinstance(item, dict):
+        return [f"Item {i} must be an object"]
+    issues = [f"Item {i} missing field {field!r}" for field in ITEM_FIELDS if field not in item]
+
+    expected = EXPECTED_IDS[i] if i < len(EXPECTED_IDS) else None
+    if "id" in item and item["id"] != expected:
+        issues.append(f"Item {i} has id {item['id']!r}, expected {expected!r}")
+    if "name" in item and (not isinstance(item["name"], str) or not item["name"].strip()):
+        issues.append(f"Item {i} has invalid name")
+    if "sort_value" in item and not _is_number(item["sort_value"]):
+        issues.append(f"Item {i} sort_value must be numeric, got {type(item['sort_value']).__name__}")
+    if "display_value" in item and (
+        not isinstance(item["display_value"], str) or not item["display_value"].strip()
+    ):
+        issues.append(f"Item {i} has invalid display_value")
+    return issues
+
+
+def check_items(puzzle: dict) -> list[str]:
+    issues = []
+    for i, item in enumerate(_items(puzzle)):
+        issues.extend(item_issues(i, item))
+    return issues
+
+
+def order_issue(i: int, prev: Any, item: Any) -> Optional[str]:
+    """sort_values must strictly increase; items without a numeric one are skipped."""
+    if not isinstance(prev, dict) or not isinstance(item, dict):
+        return None
+    a, b = prev.get("sort_value"), item.get("sort_value")
+    if _is_number(a) and _is_number(b) and a >= b:
+        return f"sort_values must be strictly increasing: item[{i-1}]={a} >= item[{i}]={b}"
+    return None
+
+
+def check_sort_order(puzzle: dict) -> list[str]:
+    items = _items(puzzle)
+    return [issue for i in range(1, len(items)) if (issue := order_issue(i, items[i - 1], items[i]))]
+
+
+def check_unique_names(puzzle: dict) -> list[str]:
+    seen, dupes = set(), []
+    for item in _items(puzzle):
+        name = item.get("name") if isinstance(item, dict) else None
+        if not isinstance(name, str):
+            continue
+        if name in seen and name not in dupes:
+            dupes.append(name)
+        seen.add(name)
+    return [f"Duplicate item name: {name!r}" for name in dupes]
+
+
+PUZZLE_RULES = [
+    check_required_fields,
+    check_text_fields,
+    check_lengths,
+    check_item_count,
+    check_items,
+    check_sort_order,
+    check_unique_names,
+]
+
+
+def check_puzzle(puzzle: dict) -> list[str]:
+    """Run every rule. Returns all issues (empty = valid)."""
+    if not isinstance(puzzle, dict):
+        return ["Puzzle must be a JSON object"]
+    issues = []
+    for rule in PUZZLE_RULES:
+        issues.extend(rule(puzzle))
+    return issues
+
+
+class ItemCheck:
+    """
+    The per-item rules, applied one item at a time as items stream in. Raises
+    ValidationError with the first offending item's issues so a bad response
+    can be cut off early; check_puzzle() still runs on the complete puzzle.
+    """
+
+    def __init__(self):
+        self._prev = None
+        self._names: set[str] = set()
+
+    def __call__(self, i: int, item: Any) -> None:
+        if i >= len(EXPECTED_IDS):
+            raise ValidationError(f"items must have exactly {len(EXPECTED_IDS)} elements, got more")
+        issues = item_issues(i, item)
+        if i > 0 and (issue := order_issue(i, self._prev, item)):
+            issues.append(issue)
+        name = item.get("name") if isinstance(item, dict) else None
+        if isinstance(name, str):
+            if name in self._names:
+                issues.append(f"Duplicate item name: {name!r}")
+            self._names.add(name)
+        if issues:
+            raise ValidationError(issues)
+        self._prev = item
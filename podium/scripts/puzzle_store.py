@@ -0,0 +1,228 @@
+"""
+PODIUM puzzle persistence, shared by generate_puzzle.py, validate_puzzle.py
+and seed_puzzles.py.
+
+PuzzleStore wraps a SQLAlchemy engine: the DoneCast backend's by default, or
+any database URL given with --db / PODIUM_DB_URL. A sqlite:/// URL gets the
+podium tables created on first use, so the scripts run (and can be
+benchmarked) against a local file with no DoneCast checkout:
+
+  PODIUM_DB_URL=sqlite:///podium.db python3 seed_puzzles.py --all
+  PODIUM_DB_URL=sqlite:///podium.db python3 validate_puzzle.py --days 30
+
+Reads are batched (horizon_state is one round-trip for everything the
+generator needs up front) and writes are a single executemany of
+INSERT ... ON CONFLICT (puzzle_date), which PostgreSQL and SQLite both
+support: DO NOTHING to keep existing puzzles, DO UPDATE to overwrite them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+DB_URL_ENV = "PODIUM_DB_URL"
+RECENT_CATEGORIES = 30
+
+PUZZLE_COLUMNS = (
+    "puzzle_date", "puzzle_number", "question", "direction", "category", "emoji", "fun_fact", "items_json",
+)
+
+# Mirrors backend/migrations/142_podium_game.py (see SPEC.md), for standalone SQLite databases
+SQLITE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS podium_puzzle (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        puzzle_date DATE UNIQUE NOT NULL,
+        puzzle_number INTEGER NOT NULL,
+        question TEXT NOT NULL,
+        direction TEXT NOT NULL,
+        emoji TEXT DEFAULT '🎙️',
+        category TEXT,
+        fun_fact TEXT,
+        items_json TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS podium_score (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT,
+        puzzle_date DATE NOT NULL,
+        score INTEGER NOT NULL,
+        time_ms INTEGER NOT NULL,
+        user_ranking_json TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (user_id, puzzle_date)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS podium_stat (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT UNIQUE,
+        games_played INTEGER DEFAULT 0,
+        total_score INTEGER DEFAULT 0,
+        perfect_scores INTEGER DEFAULT 0,
+        current_streak INTEGER DEFAULT 0,
+        max_streak INTEGER DEFAULT 0,
+        best_time_ms INTEGER,
+        last_played_date DATE,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+]
+
+_INSERT_SQL = f"""
+    INSERT INTO podium_puzzle ({", ".join(PUZZLE_COLUMNS)})
+    VALUES ({", ".join(":" + c for c in PUZZLE_COLUMNS)})
+    ON CONFLICT (puzzle_date) DO
+"""
+_UPDATE_SET = ", ".join(f"{c} = excluded.{c}" for c in PUZZLE_COLUMNS if c != "puzzle_date")
+
+
+def as_date(value) -> date:
+    """A DB puzzle_date (date, datetime or ISO string, depending on the driver) as a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def puzzle_row(puzzle_date: date, puzzle_number: int, data: dict) -> dict:
+    """Bind parameters for one podium_puzzle row from a puzzle dict."""
+    return {
+        "puzzle_date": puzzle_date,
+        "puzzle_number": puzzle_number,
+        "question": data["question"],
+        "direction": data["direction"],
+        "category": data.get("category"),
+        "emoji": data.get("emoji", "🎙️"),
+        "fun_fact": data.get("fun_fact"),
+        "items_json": json.dumps(data["items"]),
+    }
+
+
+@dataclass
+class HorizonState:
+    existing: dict[date, int]      # puzzle_date -> puzzle_number within the requested range
+    recent_categories: list[str]   # newest first
+    next_number: int               # max(puzzle_number) + 1
+
+
+class PuzzleStore:
+    def __init__(self, engine):
+        self.engine = engine
+
+    @classmethod
+    def open(cls, url: Optional[str] = None) -> "PuzzleStore":
+        """Store for url (default: $PODIUM_DB_URL), else the DoneCast backend's engine."""
+        url = url or os.environ.get(DB_URL_ENV)
+        if not url:
+            from api.core.database import engine
+            return cls(engine)
+        from sqlalchemy import create_engine
+        store = cls(create_engine(url))
+        if store.is_sqlite:
+            store.ensure_schema()
+        return store
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self.engine.dialect.name == "sqlite"
+
+    def begin(self):
+        """Connection in a transaction (commits on exit), as engine.begin()."""
+        return self.engine.begin()
+
+    def connect(self):
+        return self.engine.connect()
+
+    def ensure_schema(self) -> None:
+        from sqlalchemy import text
+        with self.engine.begin() as conn:
+            for statement in SQLITE_SCHEMA:
+                conn.execute(text(statement))
+
+    # ─── Reads ───────────────────────────────────────────────────────────────
+
+    def horizon_state(
+        self, conn, first: date, last: date, recent: int = RECENT_CATEGORIES,
+    ) -> HorizonState:
+        """Existing puzzle numbers in [first, last], recent categories and the next number, in one query."""
+        from sqlalchemy import text
+        result = conn.execute(text("""
+            SELECT 'existing', puzzle_date, puzzle_number, NULL FROM podium_puzzle
+                WHERE puzzle_date BETWEEN :a AND :b
+            UNION ALL
+            SELECT 'max', NULL, MAX(puzzle_number), NULL FROM podium_puzzle
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'recent', puzzle_date, NULL, category FROM podium_puzzle
+                ORDER BY puzzle_date DESC LIMIT :n
+            ) recent
+        """), {"a": first, "b": last, "n": recent})
+
+        state = HorizonState(existing={}, recent_categories=[], next_number=1)
+        recent_rows = []
+        for kind, puzzle_date, number, category in result:
+            if kind == "existing":
+                state.existing[as_date(puzzle_date)] = number
+            elif kind == "max":
+                state.next_number = (number or 0) + 1
+            elif category:
+                recent_rows.append((as_date(puzzle_date), category))
+        # UNION ALL doesn't promise the subquery's order survives
+        state.recent_categories = [c for _, c in sorted(recent_rows, key=lambda r: r[0], reverse=True)]
+        return state
+
+    def existing_dates(self, conn, first: date, last: date) -> set[date]:
+        from sqlalchemy import text
+        result = conn.execute(text(
+            "SELECT puzzle_date FROM podium_puzzle WHERE puzzle_date BETWEEN :a AND :b"
+        ), {"a": first, "b": last})
+        return {as_date(row[0]) for row in result}
+
+    def fetch_puzzles(self, conn, first: date, last: date) -> dict[date, dict]:
+        """Puzzles in [first, last] by date, with items_json left as stored (it may be invalid)."""
+        from sqlalchemy import text
+        result = conn.execute(text(
+            f"SELECT {', '.join(PUZZLE_COLUMNS)} FROM podium_puzzle "
+            "WHERE puzzle_date BETWEEN :a AND :b ORDER BY puzzle_date"
+        ), {"a": first, "b": last})
+        return {as_date(row[0]): dict(zip(PUZZLE_COLUMNS, row)) for row in result}
+
+    # ─── Writes ──────────────────────────────────────────────────────────────
+
+    def save_puzzles(
+        self,
+        conn,
+        puzzles: Iterable[tuple[date, int, dict]],
+        overwrite: bool = False,
+    ) -> int:
+        """
+        Write (puzzle_date, puzzle_number, data) rows with one executemany.
+
+        Without overwrite, dates that already have a puzzle are left alone and
+        the number actually inserted is returned; with overwrite, existing rows
+        are updated in place and every row counts.
+        """
+        from sqlalchemy import text
+        rows = [puzzle_row(d, n, data) for d, n, data in puzzles]
+        if not rows:
+            return 0
+        if overwrite:
+            conn.execute(text(f"{_INSERT_SQL} UPDATE SET {_UPDATE_SET}"), rows)
+            return len(rows)
+
+        # Driver rowcounts for executemany vary, so count the affected range instead
+        first = min(r["puzzle_date"] for r in rows)
+        last = max(r["puzzle_date"] for r in rows)
+        count_sql = text("SELECT COUNT(*) FROM podium_puzzle WHERE puzzle_date BETWEEN :a AND :b")
+        before = conn.execute(count_sql, {"a": first, "b": last}).scalar() or 0
+        conn.execute(text(f"{_INSERT_SQL} NOTHING"), rows)
+        after = conn.execute(count_sql, {"a": first, "b": last}).scalar() or 0
+        return after - before
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Batch re-scoring of podium_score rows, e.g. after a puzzle's sort_values are corrected.
+
+Submitted rankings become an int8 matrix with one row per submission: column j
+holds the correct position of the item the player put at position j. The
+score, i.e. the number of pairs in the correct relative order (scorePairs in
+game.js), is then one vectorized comparison over the 10 column pairs, so
+millions of rankings score in a single NumPy pass.
+
+The DB side streams. Rows are read in chunks of --chunk-size, using keyset
+pagination on id, and only the scores that changed are written back, with one
+executemany per chunk. Memory stays bounded however many submissions a puzzle
+has. The correct order is the items stably sorted by sort_value, the same
+order the reveal shows; if a correction left items_json out of that order,
+it is rewritten sorted, and a puzzle whose sort_values tie is refused.
+
+Each chunk's changed scores are also applied to the players' podium_stat
+aggregates (total_score, perfect_scores) in the same transaction, as deltas
+(new - old score, perfect gained or lost), so profile stats agree with the
+rescored rows. Afterwards the score_stats tables for the rescored dates are
+refreshed.
+
+Needs NumPy (pip install numpy), which the other PODIUM scripts don't.
+
+Usage:
+  PYTHONPATH=. python3 ../podium/scripts/rescore.py --date 2026-03-01
+  PYTHONPATH=. python3 ../podium/scripts/rescore.py --date 2026-03-01 --days 30 --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import date, timedelta
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Backend path resolution
+for _candidate in [
+    os.path.join(os.path.dirname(__file__), '..', '..', 'donecast', 'backend'),
+    os.path.join(os.path.dirname(__file__), '..', 'backend'),
+    os.getcwd(),
+]:
+    _abs = os.path.abspath(_candidate)
+    if os.path.exists(os.path.join(_abs, 'api', 'core', 'database.py')):
+        sys.path.insert(0, _abs)
+        break
+
+from puzzle_store import DB_URL_ENV, PuzzleStore
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+)
+log = logging.getLogger("podium.rescore")
+
+CHUNK_SIZE = 50_000
+INVALID = -1
+
+
+# ─── Scoring ─────────────────────────────────────────────────────────────────
+
+def _parse_rankings(rankings: Sequence[Optional[str]], rows, position: dict, out: np.ndarray) -> None:
+    """json.loads each of rows into out; anything that isn't a permutation of the ids stays INVALID."""
+    n = out.shape[1]
+    for k in rows:
+        try:
+            order = json.loads(rankings[k])
+            ranks = [position[item_id] for item_id in order] if isinstance(order, list) else []
+        except (TypeError, ValueError, KeyError):
+            continue
+        if len(ranks) == n and len(set(ranks)) == n:
+            out[k] = ranks
+
+
+def rank_matrix(rankings: Sequence[Optional[str]], correct_order: Sequence[str]) -> np.ndarray:
+    """
+    int8 matrix of correct positions, one row per user_ranking_json. Rows that
+    don't parse or aren't a permutation of correct_order are all INVALID.
+
+    With single-character ids (the usual "a".."e"), rankings in the standard
+    '["a", "c", "b", "d", "e"]' shape are decoded without json.loads: spaces are
+    dropped, the bytes are laid out as a matrix, the punctuation columns are
+    checked against a template and the id columns mapped through a lookup table.
+    Anything else falls back to json.loads.
+    """
+    n = len(correct_order)
+    position = {item_id: i for i, item_id in enumerate(correct_order)}
+    out = np.full((len(rankings), n), INVALID, dtype=np.int8)
+    if not all(len(item_id) == 1 and item_id.isascii() and item_id not in '[]", ' for item_id in correct_order):
+        _parse_rankings(rankings, range(len(rankings)), position, out)
+        return out
+
+    lut = np.full(256, INVALID, dtype=np.int8)
+    for item_id, i in position.items():
+        lut[ord(item_id)] = i
+    width = 4 * n + 1  # ["a","b",...]
+    template = np.frombuffer(('["' + '","'.join("?" * n) + '"]').encode(), dtype=np.uint8)
+    id_cols = np.arange(n) * 4 + 2
+    fixed_cols = np.setdiff1d(np.arange(width), id_cols)
+
+    compact = [r.replace(" ", "") if isinstance(r, str) else "" for r in rankings]
+    fits = np.fromiter((len(c) == width for c in compact), dtype=bool, count=len(compact))
+    rows = np.flatnonzero(fits)
+    if len(rows):
+        # "replace" keeps one byte per character, so non-ASCII rows just fail the lookup
+        raw = np.frombuffer("".join(compact[k] for k in rows).encode("ascii", "replace"), dtype=np.uint8)
+        raw = raw.reshape(-1, width)
+        ranks = lut[raw[:, id_cols]]
+        ok = (raw[:, fixed_cols] == template[fixed_cols]).all(axis=1)
+        ok &= (np.sort(ranks, axis=1) == np.arange(n)).all(axis=1)
+        out[rows[ok]] = ranks[ok]
+        fits[rows[~ok]] = False
+    _parse_rankings(rankings, np.flatnonzero(~fits), position, out)
+    return out
+
+
+def score_matrix(ranks: np.ndarray) -> np.ndarray:
+    """Correct pairs per row of a rank matrix, as int8; INVALID where the row is."""
+    i, j = np.triu_indices(ranks.shape[1], 1)
+    scores = (ranks[:, i] < ranks[:, j]).sum(axis=1, dtype=np.int8)
+    scores[(ranks == INVALID).any(axis=1)] = INVALID
+    return scores
+
+
+# ─── DB ──────────────────────────────────────────────────────────────────────
+
+def sort_items(items: list) -> list[dict]:
+    """
+    items stably sorted by sort_value. Raises ValueError for items without a
+    numeric sort_value, or two sharing one, since their order would be ambiguous.
+    """
+    values = [item.get("sort_value") if isinstance(item, dict) else None for item in items]
+    for i, value in enumerate(values):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"item {i} has no numeric sort_value ({value!r})")
+    ordered = sorted(items, key=lambda item: item["sort_value"])
+    for a, b in zip(ordered, ordered[1:]):
+        if a["sort_value"] == b["sort_value"]:
+            raise ValueError(f"items {a.get('id')!r} and {b.get('id')!r} share sort_value {a['sort_value']}")
+    return ordered
+
+
+def correct_order(conn, puzzle_date: date, fix_stored: bool = False) -> Optional[list[str]]:
+    """
+    Item ids in sort_value order for puzzle_date's puzzle, or None if there is
+    none. When items_json isn't already in that order it is rewritten (with
+    fix_stored) so the reveal agrees with the scores. Raises ValueError as
+    sort_items does, or for items_json that isn't a list.
+    """
+    from sqlalchemy import text
+    row = conn.execute(text(
+        "SELECT items_json FROM podium_puzzle WHERE puzzle_date = :d"
+    ), {"d": puzzle_date}).fetchone()
+    if row is None:
+        return None
+    items = json.loads(row[0] or "null")
+    if not isinstance(items, list):
+        raise ValueError("items_json is not a list")
+    ordered = sort_items(items)
+    if ordered != items:
+        verb = "rewriting" if fix_stored else "would rewrite"
+        log.warning(f"{puzzle_date}: items_json is out of sort_value order; {verb} it sorted")
+        if fix_stored:
+            conn.execute(text(
+                "UPDATE podium_puzzle SET items_json = :items WHERE puzzle_date = :d"
+            ), {"items": json.dumps(ordered), "d": puzzle_date})
+    return [item["id"] for item in ordered]
+
+
+def rescore_date(
+    store: PuzzleStore,
+    puzzle_date: date,
+    chunk_size: int = CHUNK_SIZE,
+    dry_run: bool = False,
+) -> dict:
+    """
+    Re-score every submission for puzzle_date, adjusting podium_stat for the
+    players whose score changed. Returns {"scanned", "changed", "invalid", "players"}
+    counts. Raises ValueError (see correct_order) when the puzzle has no
+    unambiguous order.
+    """
+    from sqlalchemy import text
+
+    stats = {"scanned": 0, "changed": 0, "invalid": 0, "players": 0}
+    with store.begin() as conn:
+        order = correct_order(conn, puzzle_date, fix_stored=not dry_run)
+    if order is None:
+        log.warning(f"No puzzle for {puzzle_date}; nothing to rescore")
+        return stats
+    perfect = len(order) * (len(order) - 1) // 2
+
+    last_id = None
+    while True:
+        with store.begin() as conn:
+            rows = conn.execute(text(
+                "SELECT id, user_ranking_json, score, user_id FROM podium_score WHERE puzzle_date = :d"
+                + (" AND id > :last" if last_id is not None else "")
+                + " ORDER BY id LIMIT :n"
+            ), {"d": puzzle_date, "last": last_id, "n": chunk_size}).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            ids = np.array([r[0] for r in rows])
+            old = np.array([INVALID if r[2] is None else r[2] for r in rows], dtype=np.int16)
+            new = score_matrix(rank_matrix([r[1] for r in rows], order)).astype(np.int16)
+
+            valid = new != INVALID
+            changed = valid & (new != old)
+            stats["scanned"] += len(rows)
+            stats["invalid"] += int((~valid).sum())
+            stats["changed"] += int(changed.sum())
+
+            deltas = stat_deltas([rows[k][3] for k in np.flatnonzero(changed)], old[changed], new[changed], perfect)
+            stats["players"] += len(deltas)
+
+            if changed.any() and not dry_run:
+                conn.execute(text("UPDATE podium_score SET score = :score WHERE id = :id"), [
+                    {"id": int(i), "score": int(s)} for i, s in zip(ids[changed], new[changed])
+                ])
+                if deltas:
+                    conn.execute(text(
+                        "UPDATE podium_stat SET total_score = total_score + :score, "
+                        "perfect_scores = perfect_scores + :perfect, updated_at = CURRENT_TIMESTAMP "
+                        "WHERE user_id = :user_id"
+                    ), deltas)
+        if len(rows) < chunk_size:
+            break
+    return stats
+
+
+def stat_deltas(user_ids: Sequence, old: np.ndarray, new: np.ndarray, perfect: int) -> list[dict]:
+    """
+    podium_stat adjustments for changed scores: one {"user_id", "score", "perfect"}
+    per signed-in player. An old score that was INVALID counts as 0.
+    """
+    old = np.where(old == INVALID, 0, old)
+    deltas: dict = {}
+    for user_id, o, n in zip(user_ids, old.tolist(), new.tolist()):
+        if user_id is None:
+            continue  # anonymous play has no podium_stat row
+        d = deltas.setdefault(user_id, {"user_id": user_id, "score": 0, "perfect": 0})
+        d["score"] += n - o
+        d["perfect"] += (n == perfect) - (o == perfect)
+    return [d for d in deltas.values() if d["score"] or d["perfect"]]
+
+
+def refresh_score_tables(store: PuzzleStore, first: date, last: date) -> None:
+    """Rebuild the score_stats distribution rows for [first, last]."""
+    from score_stats import build_tables, ensure_dist_table, save_tables
+    with store.begin() as conn:
+        ensure_dist_table(conn)
+        save_tables(conn, build_tables(conn, first, last))
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────────
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Re-score PODIUM submissions against the stored correct order")
+    parser.add_argument(
+        "--date", required=True,
+        help="First puzzle date to rescore YYYY-MM-DD"
+    )
+    parser.add_argument(
+        "--days", type=int, default=1,
+        help="Number of days from --date (default: 1)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=CHUNK_SIZE,
+        help=f"Submissions read and written per batch (default: {CHUNK_SIZE})"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Report how many scores would change without writing"
+    )
+    parser.add_argument(
+        "--db", default=os.environ.get(DB_URL_ENV),
+        help=f"Database URL, e.g. sqlite:///podium.db (default: ${DB_URL_ENV}, else the DoneCast backend's)"
+    )
+    args = parser.parse_args()
+
+    try:
+        first = date.fromisoformat(args.date)
+    except ValueError:
+        log.error(f"Invalid date: {args.date!r}")
+        return 1
+    last = first + timedelta(days=max(1, args.days) - 1)
+
+    store = PuzzleStore.open(args.db)
+    total_changed = 0
+    refused = 0
+    start = time.time()
+    for k in range((last - first).days + 1):
+        d = first + timedelta(days=k)
+        try:
+            stats = rescore_date(store, d, chunk_size=max(1, args.chunk_size), dry_run=args.dry_run)
+        except ValueError as e:
+            log.error(f"{d}: can't rescore: {e}")
+            refused += 1
+            continue
+        if stats["scanned"]:
+            verb = "would change" if args.dry_run else "changed"
+            log.info(f"{d}: {stats['scanned']} submission(s), {verb} {stats['changed']} "
+                     f"({stats['players']} player stat(s)), unparseable {stats['invalid']}")
+        total_changed += stats["changed"]
+
+    if total_changed and not args.dry_run:
+        refresh_score_tables(store, first, last)
+    summary = f"{total_changed} score(s) {'would change' if args.dry_run else 'updated'}"
+    if refused:
+        log.error(f"❌ Done in {time.time() - start:.1f}s — {summary}, {refused} date(s) refused")
+        return 1
+    log.info(f"✅ Done in {time.time() - start:.1f}s — {summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Hedged, deadline-aware retry scheduler for AI generation attempts.
+
+Each round runs the primary variant. If it hasn't answered within hedge_after
+seconds, the hedge variants (e.g. a second model, or another temperature) are
+launched alongside it. The first response accepted by the attempt function
+wins and the others are abandoned. Rounds are separated by full-jitter
+exponential backoff, and nothing is started or waited on past the overall
+deadline.
+
+Attempts run on daemon threads: a blocking model call can't be interrupted,
+but an abandoned one never holds up the caller or process exit.
+Every attempt's latency and outcome is recorded in `records`.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional
+
+log = logging.getLogger("podium.scheduler")
+
+
+class Rejected(Exception):
+    """Raised by an attempt function when the response arrived but isn't usable."""
+
+    def __init__(self, message: str, outcome: str = "invalid"):
+        super().__init__(message)
+        self.outcome = outcome
+
+
+class DeadlineExceeded(RuntimeError):
+    pass
+
+
+@dataclass
+class Variant:
+    name: str
+    model: Optional[str] = None
+    temperature_offset: float = 0.0
+
+
+@dataclass
+class AttemptRecord:
+    round: int
+    variant: str
+    started_at: float
+    latency_s: Optional[float] = None
+    outcome: str = "pending"  # ok | invalid | json | error | abandoned | timeout
+    error: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+    def finish(self, outcome: str) -> None:
+        """Close out an attempt that is still running (abandoned or timed out)."""
+        self.outcome = outcome
+        if self.latency_s is None:
+            self.latency_s = round(time.time() - self.started_at, 3)
+
+
+def _run_in_daemon(fn: Callable[[], Any]) -> Future:
+    future: Future = Future()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+
+class HedgedScheduler:
+    def __init__(
+        self,
+        max_rounds: int = 4,
+        deadline_s: Optional[float] = None,
+        deadline_at: Optional[float] = None,
+        base_delay: float = 2.0,
+        max_delay: float = 30.0,
+        hedge_after: Optional[float] = None,
+        variants: Optional[list[Variant]] = None,
+        rng: Optional[random.Random] = None,
+        label: str = "",
+    ):
+        self.label = f"[{label}] " if label else ""
+        self.max_rounds = max_rounds
+        if deadline_at is None and deadline_s is not None:
+            deadline_at = time.monotonic() + deadline_s
+        self.deadline_at = deadline_at
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge_after = hedge_after
+        self.variants = variants or [Variant("primary")]
+        self.rng = rng or random.Random()
+        self.records: list[AttemptRecord] = []
+
+    def _remaining(self) -> Optional[float]:
+        return None if self.deadline_at is None else self.deadline_at - time.monotonic()
+
+    def backoff(self, round_no: int) -> float:
+        """Full-jitter exponential backoff: uniform(0, min(max_delay, base * 2**round))."""
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** round_no))
+
+    def run(self, attempt: Callable[[int, Variant], Any]) -> Any:
+        """
+        Call attempt(round, variant) until one returns. Returns that value.
+        Raises DeadlineExceeded or RuntimeError (with the last error) when out of time or rounds.
+        """
+        last_error = None
+        for round_no in range(self.max_rounds):
+            remaining = self._remaining()
+            if remaining is not None and remaining <= 0:
+                break
+            if round_no > 0:
+                wait_s = self.backoff(round_no)
+                if remaining is not None and remaining <= wait_s:
+                    break
+                log.info(f"{self.label}Retrying in {wait_s:.1f}s (round {round_no + 1}/{self.max_rounds})")
+                time.sleep(wait_s)
+
+            in_flight: dict[Future, AttemptRecord] = {}
+
+            def launch(variant: Variant) -> None:
+                record = AttemptRecord(round=round_no, variant=variant.name, started_at=time.time())
+                self.records.append(record)
+                started = time.monotonic()
+
+                def call():
+                    try:
+                        return attempt(round_no, variant)
+                    finally:
+                        record.latency_s = round(time.monotonic() - started, 3)
+
+                in_flight[_run_in_daemon(call)] = record
+
+            launch(self.variants[0])
+            hedges = self.variants[1:] if self.hedge_after is not None else []
+
+            while in_flight:
+                remaining = self._remaining()
+                if remaining is not None and remaining <= 0:
+                    for record in in_flight.values():
+                        record.finish("timeout")
+                    raise DeadlineExceeded(
+                        f"Deadline reached during round {round_no + 1} with {len(in_flight)} request(s) "
+                        f"pending" + (f". Last error: {last_error}" if last_error else "")
+                    )
+
+                timeout = remaining
+                if hedges:
+                    timeout = self.hedge_after if timeout is None else min(timeout, self.hedge_after)
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                if not done:
+                    if hedges:
+                        log.info(f"{self.label}No response after {self.hedge_after}s — hedging with "
+                                 f"{', '.join(v.name for v in hedges)}")
+                        for variant in hedges:
+                            launch(variant)
+                        hedges = []
+                    continue
+
+                for future in done:
+                    record = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Rejected as e:
+                        record.outcome, record.error = e.outcome, str(e)
+                        last_error = str(e)
+                        continue
+                    except Exception as e:
+                        record.outcome, record.error = "error", f"{type(e).__name__}: {e}"
+                        last_error = record.error
+                        continue
+
+                    record.outcome = "ok"
+                    for other in in_flight.values():
+                        other.finish("abandoned")
+                    return result
+
+        remaining = self._remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceeded(f"Deadline reached after {len(self.records)} attempt(s). Last error: {last_error}")
+        raise RuntimeError(f"Failed after {len(self.records)} attempt(s). Last error: {last_error}")
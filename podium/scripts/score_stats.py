@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Score-distribution tables for PODIUM puzzles.
+
+A score is the number of correctly ordered pairs (scorePairs in game.js,
+"Pair-based scoring" in SPEC.md): 0-10 for 5 items. Each puzzle gets two
+distributions, stored in podium_score_dist keyed by puzzle_date:
+
+  exact      how many of the n! possible orderings earn each score, i.e. the
+             random-guess baseline. It depends only on the item count, so it is
+             computed once per count by enumerating every permutation (120 for
+             5 items) and copied to each row.
+  empirical  how many podium_score submissions earned each score, from one
+             GROUP BY over podium_score.
+
+Each is stored as counts plus "beat" fractions (the share of outcomes strictly
+below each score), so "you beat X% of players" and "a random guess beats Y%"
+are a single-row read instead of COUNT queries over podium_score at request
+time. Rerun (e.g. hourly from cron) to refresh the empirical side.
+
+Usage:
+  PYTHONPATH=. python3 ../podium/scripts/score_stats.py                 # refresh every puzzle
+  PYTHONPATH=. python3 ../podium/scripts/score_stats.py --date 2026-03-01 --days 7
+  PYTHONPATH=. python3 ../podium/scripts/score_stats.py --date 2026-03-01 --score 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import permutations
+from typing import Iterable, Optional, Sequence
+
+# Backend path resolution
+for _candidate in [
+    os.path.join(os.path.dirname(__file__), '..', '..', 'donecast', 'backend'),
+    os.path.join(os.path.dirname(__file__), '..', 'backend'),
+    os.getcwd(),
+]:
+    _abs = os.path.abspath(_candidate)
+    if os.path.exists(os.path.join(_abs, 'api', 'core', 'database.py')):
+        sys.path.insert(0, _abs)
+        break
+
+from puzzle_rules import EXPECTED_IDS
+from puzzle_store import DB_URL_ENV, PuzzleStore, as_date
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS podium_score_dist (
+        puzzle_date DATE PRIMARY KEY,
+        n_items INTEGER NOT NULL,
+        exact_json TEXT NOT NULL,
+        random_beat_json TEXT NOT NULL,
+        players INTEGER NOT NULL,
+        counts_json TEXT NOT NULL,
+        beat_json TEXT NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    )
+"""
+
+_DIST_COLUMNS = (
+    "puzzle_date", "n_items", "exact_json", "random_beat_json", "players", "counts_json", "beat_json", "updated_at",
+)
+
+
+# ─── Scoring ─────────────────────────────────────────────────────────────────
+
+def score_pairs(user_order: Sequence, correct_order: Sequence) -> int:
+    """Pairs the player put in the correct relative order (port of scorePairs in game.js)."""
+    position = {item: i for i, item in enumerate(correct_order)}
+    ranks = [position[item] for item in user_order]
+    return sum(
+        1
+        for i in range(len(ranks))
+        for j in range(i + 1, len(ranks))
+        if ranks[i] < ranks[j]
+    )
+
+
+def max_score(n_items: int) -> int:
+    return n_items * (n_items - 1) // 2
+
+
+@lru_cache(maxsize=None)
+def exact_distribution(n_items: int = len(EXPECTED_IDS)) -> tuple[int, ...]:
+    """Number of orderings of n_items at each score 0..max_score, by enumerating all n_items! of them."""
+    counts = [0] * (max_score(n_items) + 1)
+    correct = tuple(range(n_items))
+    for order in permutations(correct):
+        counts[score_pairs(order, correct)] += 1
+    return tuple(counts)
+
+
+def beat_fractions(counts: Sequence[int]) -> list[float]:
+    """For each score, the share of outcomes strictly below it (0.0 when there are none)."""
+    total = sum(counts)
+    below = 0
+    out = []
+    for c in counts:
+        out.append(round(below / total, 6) if total else 0.0)
+        below += c
+    return out
+
+
+# ─── Tables ──────────────────────────────────────────────────────────────────
+
+def ensure_dist_table(conn) -> None:
+    from sqlalchemy import text
+    conn.execute(text(CREATE_TABLE_SQL))
+
+
+def build_tables(conn, first: Optional[date] = None, last: Optional[date] = None) -> list[dict]:
+    """podium_score_dist rows for every puzzle in [first, last] (default: all), from two queries."""
+    from sqlalchemy import text
+
+    where, params = "", {}
+    if first is not None and last is not None:
+        where, params = "WHERE puzzle_date BETWEEN :a AND :b", {"a": first, "b": last}
+
+    puzzles = conn.execute(text(
+        f"SELECT puzzle_date, items_json FROM podium_puzzle {where}"
+    ), params)
+    n_items: dict[date, int] = {}
+    for puzzle_date, items_json in puzzles:
+        try:
+            items = json.loads(items_json or "[]")
+        except json.JSONDecodeError:
+            continue
+        if isinstance(items, list) and len(items) >= 2:
+            n_items[as_date(puzzle_date)] = len(items)
+
+    counts: dict[date, list[int]] = {d: [0] * (max_score(n) + 1) for d, n in n_items.items()}
+    grouped = conn.execute(text(
+        f"SELECT puzzle_date, score, COUNT(*) FROM podium_score {where} GROUP BY puzzle_date, score"
+    ), params)
+    for puzzle_date, score, count in grouped:
+        bucket = counts.get(as_date(puzzle_date))
+        if bucket is not None and score is not None and 0 <= score < len(bucket):
+            bucket[score] += count
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = []
+    for d in sorted(n_items):
+        exact = exact_distribution(n_items[d])
+        rows.append({
+            "puzzle_date": d,
+            "n_items": n_items[d],
+            "exact_json": json.dumps(exact),
+            "random_beat_json": json.dumps(beat_fractions(exact)),
+            "players": sum(counts[d]),
+            "counts_json": json.dumps(counts[d]),
+            "beat_json": json.dumps(beat_fractions(counts[d])),
+            "updated_at": now,
+        })
+    return rows
+
+
+def save_tables(conn, rows: Iterable[dict]) -> int:
+    """Upsert podium_score_dist rows with one executemany. Returns the number written."""
+    from sqlalchemy import text
+    rows = list(rows)
+    if not rows:
+        return 0
+    updates = ", ".join(f"{c} = excluded.{c}" for c in _DIST_COLUMNS if c != "puzzle_date")
+    conn.execute(text(f"""
+        INSERT INTO podium_score_dist ({", ".join(_DIST_COLUMNS)})
+        VALUES ({", ".join(":" + c for c in _DIST_COLUMNS)})
+        ON CONFLICT (puzzle_date) DO UPDATE SET {updates}
+    """), rows)
+    return len(rows)
+
+
+def lookup(conn, puzzle_date: date, score: int) -> Optional[dict]:
+    """
+    {"players", "beat", "random_beat", "random_at_least"} for a score on
+    puzzle_date, or None if the puzzle has no table yet. beat is the share of
+    players who scored strictly less; random_beat is the same against a random
+    guess, and random_at_least the chance a random guess scores score or more.
+    """
+    from sqlalchemy import text
+    row = conn.execute(text(
+        "SELECT players, beat_json, random_beat_json, exact_json FROM podium_score_dist WHERE puzzle_date = :d"
+    ), {"d": puzzle_date}).fetchone()
+    if row is None:
+        return None
+    players, beat_json, random_beat_json, exact_json = row
+    beat, random_beat, exact = json.loads(beat_json), json.loads(random_beat_json), json.loads(exact_json)
+    if not 0 <= score < len(exact):
+        raise ValueError(f"Score {score} out of range 0..{len(exact) - 1}")
+    return {
+        "players": players,
+        "beat": beat[score],
+        "random_beat": random_beat[score],
+        "random_at_least": round(sum(exact[score:]) / sum(exact), 6),
+    }
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────────
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Precompute PODIUM score-distribution tables")
+    parser.add_argument(
+        "--date", default=None,
+        help="First puzzle date YYYY-MM-DD (default: every puzzle)"
+    )
+    parser.add_argument(
+        "--days", type=int, default=1,
+        help="Number of days from --date (default: 1)"
+    )
+    parser.add_argument(
+        "--score", type=int, default=None,
+        help="Print the lookup for this score on --date instead of refreshing"
+    )
+    parser.add_argument(
+        "--db", default=os.environ.get(DB_URL_ENV),
+        help=f"Database URL, e.g. sqlite:///podium.db (default: ${DB_URL_ENV}, else the DoneCast backend's)"
+    )
+    args = parser.parse_args()
+
+    first = last = None
+    if args.date:
+        try:
+            first = date.fromisoformat(args.date)
+        except ValueError:
+            print(f"Error: Invalid date '{args.date}'. Use YYYY-MM-DD format.")
+            return 1
+        last = first + timedelta(days=max(1, args.days) - 1)
+
+    store = PuzzleStore.open(args.db)
+
+    if args.score is not None:
+        if first is None:
+            print("Error: --score needs --date")
+            return 1
+        with store.connect() as conn:
+            ensure_dist_table(conn)
+            result = lookup(conn, first, args.score)
+        if result is None:
+            print(f"❌ No score table for {first}; run without --score first")
+            return 1
+        print(f"{first}, score {args.score}: beat {result['beat']:.1%} of {result['players']} player(s); "
+              f"a random guess beats {result['random_beat']:.1%} and scores ≥{args.score} "
+              f"{result['random_at_least']:.1%} of the time")
+        return 0
+
+    with store.begin() as conn:
+        ensure_dist_table(conn)
+        rows = build_tables(conn, first, last)
+        written = save_tables(conn, rows)
+    players = sum(r["players"] for r in rows)
+    print(f"✅ Score tables for {written} puzzle(s) ({players} submission(s))"
+          + (f", {first} → {last}" if first else ""))
+    print(f"   Random-guess distribution (5 items): {list(exact_distribution())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
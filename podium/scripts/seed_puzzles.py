@@ -5,18 +5,30 @@ Seed launch-buffer PODIUM puzzles into the database.
 Seeds 7 hand-crafted puzzles as a launch buffer. After launch, daily puzzles
 are generated automatically by generate_puzzle.py (cron at 4 AM PT).
 
+Curated puzzles can also be imported from files with --file: a .json file
+holding one array of puzzle objects, or a .ndjson/.jsonl file with one object
+per line. Files are streamed, so size doesn't matter. A puzzle may carry its
+own "puzzle_date" and "puzzle_number"; otherwise it takes the next day from
+--start-date and the next number after the current max.
+
 Usage:
   cd /path/to/donecast/backend
   PYTHONPATH=. python3 ../podium/scripts/seed_puzzles.py
   PYTHONPATH=. python3 ../podium/scripts/seed_puzzles.py --start-date 2026-03-01
   PYTHONPATH=. python3 ../podium/scripts/seed_puzzles.py --dry-run
+  python3 seed_puzzles.py --db sqlite:///podium.db --all   # local SQLite, no backend needed
+  PYTHONPATH=. python3 ../podium/scripts/seed_puzzles.py --file curated.ndjson --start-date 2026-06-01
 
 Options:
   --start-date YYYY-MM-DD   First puzzle date (default: today)
   --dry-run                 Print what would be inserted without writing
   --all                     Seed all 30 puzzles (for content testing)
+  --file PATH               Seed puzzles from a JSON/NDJSON file instead (repeatable)
+  --chunk-size N            Rows per batched INSERT (default: 500)
+  --db URL                  Database URL (default: $PODIUM_DB_URL, else the DoneCast backend's)
 
-The script is IDEMPOTENT — skips any date that already exists.
+The script is IDEMPOTENT — skips any date that already exists (INSERT ... ON
+CONFLICT (puzzle_date) DO NOTHING, one executemany per chunk).
 Items are stored in CORRECT ORDER in the DB. Shuffling happens at serve time.
 """
 
@@ -25,6 +37,9 @@ import sys
 import json
 import argparse
 from datetime import date, timedelta
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, Iterator
 
 # Allow running from either donecast/backend or podium/scripts
 for path in [
@@ -36,8 +51,11 @@ for path in [
         sys.path.insert(0, os.path.abspath(path))
         break
 
-from sqlalchemy import text
-from api.core.database import engine
+from json_stream import iter_json_array
+from puzzle_rules import check_puzzle
+from puzzle_store import DB_URL_ENV, PuzzleStore
+
+CHUNK_SIZE = 500
 
 # ─── Puzzle Data ─────────────────────────────────────────────────────────────
 # Items are in CORRECT ORDER (sort_value ascending = first to last in direction)
@@ -291,7 +309,7 @@ PUZZLES = [
         "emoji": "🔬",
         "fun_fact": "Radiolab pioneered the 'audio documentary' style of podcasting — blending interviews, sound design, and storytelling to explore complex ideas in ways radio had never quite managed.",
         "items": [
-            {"id": "a", "name": "Radiolab", "sort_value": 2002, "display_value": "2002"},
+            {"id": "a", "name": "Radiolab", "sort_value": 2007, "display_value": "2007"},
             {"id": "b", "name": "Stuff You Should Know", "sort_value": 2008, "display_value": "2008"},
             {"id": "c", "name": "Freakonomics Radio", "sort_value": 2010, "display_value": "2010"},
             {"id": "d", "name": "Science Vs", "sort_value": 2015, "display_value": "2015"},
@@ -498,55 +516,116 @@ PUZZLES = [
 
 # ─── Seeding Logic ───────────────────────────────────────────────────────────
 
-def seed(start_date: date, dry_run: bool = False, puzzles: list = None):
-    """Insert puzzles starting from start_date, one per day."""
+def load_puzzle_file(path) -> Iterator[dict]:
+    """Stream puzzles from a .json array or a .ndjson/.jsonl file. Raises ValueError on malformed JSON."""
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        if path.suffix.lower() in (".ndjson", ".jsonl"):
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line_no}: invalid JSON: {e}") from None
+        else:
+            try:
+                yield from iter_json_array(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}: invalid JSON: {e}") from None
+
+
+def _label(puzzle, puzzle_date) -> str:
+    number = puzzle.get("puzzle_number") if isinstance(puzzle, dict) else None
+    return f"Puzzle #{number} ({puzzle_date})" if number is not None else f"Puzzle for {puzzle_date}"
+
+
+def _save_chunk(store: PuzzleStore, rows: list, dry_run: bool) -> int:
+    """
+    Insert one chunk of (puzzle_date, puzzle_number or None, puzzle) with a single
+    executemany. Returns how many were new.
+
+    Dates that already have a puzzle (or repeat within the chunk) are dropped
+    first, so only rows actually inserted take a new puzzle number.
+    """
+    first = min(r[0] for r in rows)
+    last = max(r[0] for r in rows)
+    with store.begin() as conn:
+        state = store.horizon_state(conn, first, last)
+        taken = set(state.existing)
+        fresh = []
+        for puzzle_date, number, puzzle in rows:
+            if puzzle_date in taken:
+                continue
+            taken.add(puzzle_date)
+            if number is None:
+                number, state.next_number = state.next_number, state.next_number + 1
+            fresh.append((puzzle_date, number, puzzle))
+        if dry_run:
+            print(f"  [DRY RUN] {first} → {last}: would insert {len(fresh)}, skip {len(rows) - len(fresh)}")
+            return len(fresh)
+        inserted = store.save_puzzles(conn, fresh)
+    print(f"  ✅ {first} → {last}: inserted {inserted}, skipped {len(rows) - inserted} (already exist)")
+    return inserted
+
+
+def seed(
+    start_date: date,
+    dry_run: bool = False,
+    puzzles: Iterable[dict] = None,
+    store: PuzzleStore = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[int, int, int]:
+    """
+    Insert puzzles one per day from start_date (or on their own puzzle_date),
+    chunk_size rows per batched INSERT. Returns (inserted, skipped, invalid).
+    Invalid puzzles don't use up a day, and only inserted ones take a puzzle number.
+    """
     if puzzles is None:
         puzzles = PUZZLES[:7]  # Default: 7-day launch buffer
+    store = store or PuzzleStore.open()
 
     inserted = 0
     skipped = 0
+    invalid = 0
+    day = 0
+    rows = []
 
-    with engine.begin() as conn:
-        for i, puzzle in enumerate(puzzles):
-            puzzle_date = start_date + timedelta(days=i)
-
-            # Check if already exists
-            result = conn.execute(text(
-                "SELECT id FROM podium_puzzle WHERE puzzle_date = :d"
-            ), {"d": puzzle_date})
-            existing = result.fetchone()
+    for puzzle in puzzles:
+        puzzle_date = start_date + timedelta(days=day)
+        if not isinstance(puzzle, dict):
+            issues = ["Not a JSON object"]
+        else:
+            issues = check_puzzle(puzzle)
+            if puzzle.get("puzzle_date") is not None:
+                try:
+                    puzzle_date = date.fromisoformat(str(puzzle["puzzle_date"]))
+                except ValueError:
+                    issues.append(f"Invalid puzzle_date: {puzzle['puzzle_date']!r}")
+        if issues:
+            print(f"  ❌ {_label(puzzle, puzzle_date)} is invalid — skipping:")
+            for issue in issues:
+                print(f"       - {issue}")
+            invalid += 1
+            continue
 
-            if existing:
-                print(f"  ⏭️  Puzzle #{puzzle['puzzle_number']} ({puzzle_date}) already exists — skipping")
-                skipped += 1
-                continue
+        day += 1
+        rows.append((puzzle_date, puzzle.get("puzzle_number"), puzzle))
 
-            items_json = json.dumps(puzzle["items"])
+        if len(rows) >= chunk_size:
+            new = _save_chunk(store, rows, dry_run)
+            inserted += new
+            skipped += len(rows) - new
+            rows = []
 
-            if dry_run:
-                print(f"  [DRY RUN] Would insert puzzle #{puzzle['puzzle_number']} for {puzzle_date}: {puzzle['question'][:60]}...")
-                inserted += 1
-                continue
+    if rows:
+        new = _save_chunk(store, rows, dry_run)
+        inserted += new
+        skipped += len(rows) - new
 
-            conn.execute(text("""
-                INSERT INTO podium_puzzle
-                    (puzzle_date, puzzle_number, question, direction, category, emoji, fun_fact, items_json)
-                VALUES
-                    (:puzzle_date, :puzzle_number, :question, :direction, :category, :emoji, :fun_fact, :items_json)
-            """), {
-                "puzzle_date": puzzle_date,
-                "puzzle_number": puzzle["puzzle_number"],
-                "question": puzzle["question"],
-                "direction": puzzle["direction"],
-                "category": puzzle.get("category"),
-                "emoji": puzzle.get("emoji", "🎙️"),
-                "fun_fact": puzzle.get("fun_fact"),
-                "items_json": items_json,
-            })
-            print(f"  ✅ Inserted puzzle #{puzzle['puzzle_number']} for {puzzle_date}: {puzzle['question'][:60]}...")
-            inserted += 1
-
-    print(f"\nDone! Inserted: {inserted}, Skipped: {skipped}")
+    print(f"\nDone! Inserted: {inserted}, Skipped: {skipped}, Invalid: {invalid}")
+    return inserted, skipped, invalid
 
 
 def main():
@@ -566,6 +645,24 @@ def main():
         action="store_true",
         help="Seed all 30 puzzles (default: first 7 only, as launch buffer)"
     )
+    parser.add_argument(
+        "--file",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="Seed puzzles from a .json array or .ndjson/.jsonl file instead (repeatable)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CHUNK_SIZE,
+        help=f"Rows per batched INSERT (default: {CHUNK_SIZE})"
+    )
+    parser.add_argument(
+        "--db",
+        default=os.environ.get(DB_URL_ENV),
+        help=f"Database URL, e.g. sqlite:///podium.db (default: ${DB_URL_ENV}, else the DoneCast backend's)"
+    )
     args = parser.parse_args()
 
     if args.start_date:
@@ -577,11 +674,23 @@ def main():
     else:
         start = date.today()
 
+    store = PuzzleStore.open(args.db)
+    if args.file:
+        print(f"Seeding PODIUM puzzles from {', '.join(args.file)} starting {start}"
+              f"{'  [DRY RUN]' if args.dry_run else ''}...\n")
+        try:
+            seed(start, dry_run=args.dry_run, puzzles=chain.from_iterable(map(load_puzzle_file, args.file)),
+                 store=store, chunk_size=max(1, args.chunk_size))
+        except (OSError, ValueError) as e:
+            print(f"\nError: {e}\nChunks before this point are saved; fix the file and rerun (already-seeded dates are skipped).")
+            sys.exit(1)
+        return
+
     puzzles_to_seed = PUZZLES if args.all else PUZZLES[:7]
     print(f"Seeding {len(puzzles_to_seed)} PODIUM puzzles starting {start}"
           f"{'  [DRY RUN]' if args.dry_run else ''}"
           f"{'  [ALL 30]' if args.all else '  [launch buffer — 7 days]'}...\n")
-    seed(start, dry_run=args.dry_run, puzzles=puzzles_to_seed)
+    seed(start, dry_run=args.dry_run, puzzles=puzzles_to_seed, store=store, chunk_size=max(1, args.chunk_size))
 
 
 if __name__ == "__main__":
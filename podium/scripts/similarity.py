@@ -0,0 +1,245 @@
+"""
+Near-duplicate index for PODIUM categories and questions.
+
+Texts are normalized (lower-case, template words like "rank these podcasts"
+and "oldest to newest" dropped, plural "s" stripped) and shingled into
+character trigrams plus whole words. Each shingle set gets a MinHash
+signature; LSH banding finds candidate matches in a few dict lookups, and
+the estimated Jaccard similarity of the signatures decides. So
+"Launch Years" and "Podcast Launch Dates" match, but "True Crime" and
+"Comedy" don't.
+
+The index is keyed by puzzle date and persisted under scripts/.cache/. On
+load it is synced against (date, category, question) rows from the DB, so
+only new or changed puzzles are hashed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+log = logging.getLogger("podium.similarity")
+
+DEFAULT_PATH = Path(__file__).parent / ".cache" / "similarity-index.json"
+INDEX_VERSION = 1
+
+NUM_PERM = 64
+BANDS = 32  # 2 rows per band: pairs at Jaccard 0.5 share a band with p > 0.9999
+ROWS = NUM_PERM // BANDS
+NGRAM = 3
+
+THRESHOLDS = {"category": 0.5, "question": 0.6}
+
+# Words every puzzle uses: they say nothing about the topic
+STOPWORDS = frozenset("""
+    a an and as at by for from in into of on or the their these this to with
+    rank ranked put order list sort
+    podcast podcasts podcasting podcaster podcasters show shows
+    oldest newest earliest latest first last old new
+    shortest longest smallest largest lowest highest fewest most least
+    cheapest expensive youngest biggest approximate approx average typical
+    chronological year years
+""".split())
+
+_MERSENNE = (1 << 61) - 1
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def _perms() -> list[tuple[int, int]]:
+    """Fixed (a, b) pairs for h(x) = (a*x + b) mod p, derived from a constant seed."""
+    out = []
+    for i in range(NUM_PERM):
+        digest = hashlib.sha256(f"podium-minhash-{i}".encode()).digest()
+        a, b = struct.unpack("<QQ", digest[:16])
+        out.append((a % (_MERSENNE - 1) + 1, b % _MERSENNE))
+    return out
+
+
+_PERMS = _perms()
+
+
+def normalize(text: str) -> list[str]:
+    words = []
+    for word in _NON_WORD.split((text or "").lower()):
+        if not word or word in STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        if word not in STOPWORDS:
+            words.append(word)
+    return words
+
+
+def shingles(text: str) -> set[str]:
+    out = set()
+    for word in normalize(text):
+        out.add(f"w:{word}")
+        padded = f" {word} "
+        for i in range(len(padded) - NGRAM + 1):
+            out.add(padded[i:i + NGRAM])
+    return out
+
+
+def _hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def signature(text: str) -> Optional[list[int]]:
+    """MinHash signature of text's shingles, or None if nothing is left after normalizing."""
+    hashes = [_hash(s) for s in shingles(text)]
+    if not hashes:
+        return None
+    return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMS]
+
+
+def estimate(sig_a: list[int], sig_b: list[int]) -> float:
+    """Estimated Jaccard similarity: the fraction of matching MinHash slots."""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def _bands(sig: list[int]) -> list[tuple[int, ...]]:
+    return [tuple(sig[i * ROWS:(i + 1) * ROWS]) for i in range(BANDS)]
+
+
+def _fingerprint(category: Optional[str], question: Optional[str]) -> str:
+    return hashlib.sha1(f"{category or ''}\x00{question or ''}".encode("utf-8")).hexdigest()[:16]
+
+
+class SimilarityIndex:
+    FIELDS = ("category", "question")
+
+    def __init__(self, thresholds: Optional[dict[str, float]] = None):
+        self.thresholds = {**THRESHOLDS, **(thresholds or {})}
+        # key -> {"fp": fingerprint, "category": text, "question": text, "sig": {field: signature}}
+        self._entries: dict[str, dict] = {}
+        self._buckets: dict[tuple, set[str]] = {}
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _unbucket(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if not entry:
+            return
+        for field, sig in entry["sig"].items():
+            if sig is None:
+                continue
+            for band, values in enumerate(_bands(sig)):
+                bucket = self._buckets.get((field, band, values))
+                if bucket:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._buckets[(field, band, values)]
+
+    def _insert(self, key: str, entry: dict) -> None:
+        self._unbucket(key)
+        self._entries[key] = entry
+        for field, sig in entry["sig"].items():
+            if sig is None:
+                continue
+            for band, values in enumerate(_bands(sig)):
+                self._buckets.setdefault((field, band, values), set()).add(key)
+
+    def add(self, key: str, category: Optional[str], question: Optional[str]) -> None:
+        """Index (or re-index) one puzzle under key (normally its ISO date)."""
+        fp = _fingerprint(category, question)
+        with self._lock:
+            if self._entries.get(key, {}).get("fp") == fp:
+                return
+            self._insert(key, {
+                "fp": fp,
+                "category": category,
+                "question": question,
+                "sig": {"category": signature(category), "question": signature(question)},
+            })
+            self.dirty = True
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._unbucket(key)
+                self.dirty = True
+
+    def sync(self, rows: Iterable[tuple]) -> int:
+        """Bring the index in line with (key, category, question) rows. Returns entries (re)hashed."""
+        seen = set()
+        changed = 0
+        for key, category, question in rows:
+            key = str(key)[:10]
+            seen.add(key)
+            if self._entries.get(key, {}).get("fp") != _fingerprint(category, question):
+                self.add(key, category, question)
+                changed += 1
+        for key in set(self._entries) - seen:
+            self.remove(key)
+        return changed
+
+    def matches(self, field: str, text: str, exclude: Optional[str] = None) -> list[tuple[str, str, float]]:
+        """Indexed (key, text, similarity) at or above the field's threshold, most similar first."""
+        sig = signature(text)
+        if sig is None:
+            return []
+        threshold = self.thresholds[field]
+        with self._lock:
+            candidates = set()
+            for band, values in enumerate(_bands(sig)):
+                candidates |= self._buckets.get((field, band, values), set())
+            candidates.discard(exclude)
+            found = []
+            for key in candidates:
+                entry = self._entries[key]
+                score = estimate(sig, entry["sig"][field])
+                if score >= threshold:
+                    found.append((key, entry[field], score))
+        return sorted(found, key=lambda m: -m[2])
+
+    def near_duplicates(self, data: dict, exclude: Optional[str] = None) -> list[str]:
+        """Issue strings for a puzzle whose category or question is too close to an indexed one."""
+        issues = []
+        for field in self.FIELDS:
+            hits = self.matches(field, data.get(field) or "", exclude)
+            if hits:
+                key, text, score = hits[0]
+                issues.append(
+                    f"{field} {data[field]!r} is too similar to {text!r} ({key}, similarity {score:.2f}); "
+                    f"pick a clearly different one"
+                )
+        return issues
+
+    # ─── Persistence ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, thresholds: Optional[dict[str, float]] = None) -> "SimilarityIndex":
+        index = cls(thresholds)
+        path = Path(path) if path else DEFAULT_PATH
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return index
+        if payload.get("version") != INDEX_VERSION or payload.get("num_perm") != NUM_PERM:
+            return index
+        for key, entry in payload.get("entries", {}).items():
+            index._insert(key, entry)
+        return index
+
+    def save(self, path: Optional[Path] = None) -> None:
+        path = Path(path) if path else DEFAULT_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with self._lock:
+            payload = {"version": INDEX_VERSION, "num_perm": NUM_PERM, "entries": self._entries}
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, path)
+            self.dirty = False
@@ -7,7 +7,8 @@ Usage:
   cd /path/to/donecast/backend
   PYTHONPATH=. python3 ../podium/scripts/validate_puzzle.py
   PYTHONPATH=. python3 ../podium/scripts/validate_puzzle.py --date 2026-03-01
-  PYTHONPATH=. python3 ../podium/scripts/validate_puzzle.py --days 7  # check next N days
+  PYTHONPATH=. python3 ../podium/scripts/validate_puzzle.py --days 90  # next N days in one query, with runway
+  python3 validate_puzzle.py --db sqlite:///podium.db --days 30         # no backend needed
 
 Called by the PODIUM Puzzle Validation cron at 5 AM PT.
 Exit codes: 0 = valid, 1 = missing or invalid (triggers alert).
@@ -19,7 +20,6 @@ import argparse
 import json
 import logging
 import os
-import subprocess
 import sys
 from datetime import date, timedelta
 from typing import Optional
@@ -35,6 +35,12 @@ for _candidate in [
         sys.path.insert(0, _abs)
         break
 
+from alerts import AlertDispatcher, rerun_command
+from entities import DEFAULT_COOLDOWN_DAYS, EntityIndex, build_entity_index
+from facts import FactLedger, build_fact_ledger
+from puzzle_rules import check_puzzle
+from puzzle_store import DB_URL_ENV, PuzzleStore
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s',
@@ -42,128 +48,156 @@ logging.basicConfig(
 )
 log = logging.getLogger("podium.validate")
 
+MISSING = "No puzzle in DB for {}"
 
-def validate_db_puzzle(target_date: date) -> tuple[bool, list[str]]:
-    """
-    Fetch and validate a puzzle from the DB for the given date.
-    Returns (is_valid, list_of_issues).
-    """
-    from api.core.database import engine
-    from sqlalchemy import text
-
-    issues = []
+# Failures are buffered and sent as one alert when the run ends (--no-alert disables)
+ALERTS = AlertDispatcher(
+    "PODIUM puzzle validation FAILED",
+    fix=lambda dates: f"Fix: `{rerun_command('generate_puzzle.py', dates, '--force')}`",
+)
 
-    with engine.connect() as conn:
-        result = conn.execute(text(
-            "SELECT puzzle_number, question, direction, category, emoji, fun_fact, items_json "
-            "FROM podium_puzzle WHERE puzzle_date = :d"
-        ), {"d": target_date})
-        row = result.fetchone()
 
+def validate_row(
+    target_date: date,
+    row: Optional[dict],
+    entities: Optional[EntityIndex] = None,
+    entity_cooldown: int = DEFAULT_COOLDOWN_DAYS,
+    facts: Optional[FactLedger] = None,
+    warnings: Optional[list[str]] = None,
+) -> list[str]:
+    """
+    Issues with a podium_puzzle row (as returned by PuzzleStore.fetch_puzzles), or
+    with its absence. With an EntityIndex, items reused within entity_cooldown days
+    of an earlier puzzle, and with a FactLedger, sort_values contradicting other
+    puzzles' facts are appended to `warnings` when a list is passed: both are
+    generation rules, and a stored puzzle doesn't stop being playable because of
+    them.
+    """
     if not row:
-        return False, [f"No puzzle in DB for {target_date}"]
-
-    puzzle_number, question, direction, category, emoji, fun_fact, items_json = row
+        return [MISSING.format(target_date)]
 
-    # Required text fields
-    for name, val in [("question", question), ("direction", direction), ("emoji", emoji)]:
-        if not val or not val.strip():
-            issues.append(f"{name!r} is empty")
-
-    if not fun_fact or not fun_fact.strip():
-        issues.append("fun_fact is empty")
+    question, direction, category = row["question"], row["direction"], row["category"]
+    emoji, fun_fact, items_json = row["emoji"], row["fun_fact"], row["items_json"]
 
+    items, items_problem = None, None
     if not items_json or not items_json.strip():
-        issues.append("items_json is empty")
-        return False, issues
-
-    # Parse items
-    try:
-        items = json.loads(items_json)
-    except json.JSONDecodeError as e:
-        issues.append(f"items_json is invalid JSON: {e}")
-        return False, issues
-
-    if not isinstance(items, list):
-        issues.append("items_json must be a JSON array")
-        return False, issues
-
-    if len(items) != 5:
-        issues.append(f"items must have exactly 5 elements, got {len(items)}")
-
-    expected_ids = ["a", "b", "c", "d", "e"]
-    for i, item in enumerate(items[:5]):
-        for field in ("id", "name", "sort_value", "display_value"):
-            if field not in item:
-                issues.append(f"Item {i} missing {field!r}")
-
-        if i < len(expected_ids) and item.get("id") != expected_ids[i]:
-            issues.append(f"Item {i} has id {item.get('id')!r}, expected {expected_ids[i]!r}")
-
-        if not item.get("name", "").strip():
-            issues.append(f"Item {i} has empty name")
-
-    # Check strict ordering
-    if len(items) >= 2:
-        for i in range(len(items) - 1):
-            sv_a = items[i].get("sort_value", 0)
-            sv_b = items[i + 1].get("sort_value", 0)
-            if sv_a >= sv_b:
-                issues.append(
-                    f"sort_values not strictly increasing: "
-                    f"item[{i}]={sv_a} >= item[{i+1}]={sv_b}"
-                )
-
-    # Unique names
-    names = [item.get("name", "") for item in items]
-    if len(set(names)) != len(names):
-        issues.append("Duplicate item names")
-
-    is_valid = len(issues) == 0
-    return is_valid, issues
-
-
-def check_date(target_date: date, alert_on_failure: bool = True) -> bool:
+        items_problem = "items_json is empty"
+    else:
+        try:
+            items = json.loads(items_json)
+        except json.JSONDecodeError as e:
+            items_problem = f"items_json is invalid JSON: {e}"
+
+    # Same rules as generate_puzzle.py and seed_puzzles.py, all reported at once
+    issues = check_puzzle({
+        "question": question,
+        "direction": direction,
+        "category": category,
+        "emoji": emoji,
+        "fun_fact": fun_fact,
+        "items": items,
+    })
+    if items_problem:
+        issues = [items_problem if i == "Missing required field: 'items'" else i for i in issues]
+    if entities is not None and warnings is not None and isinstance(items, list):
+        warnings.extend(entities.cooldown_issues(items, target_date, entity_cooldown, both_sides=False))
+    if facts is not None and warnings is not None:
+        warnings.extend(facts.contradictions(
+            {"question": question, "direction": direction, "items": items}, exclude_date=target_date,
+        ))
+    return issues
+
+
+def validate_db_puzzle(
+    target_date: date,
+    entities: Optional[EntityIndex] = None,
+    entity_cooldown: int = DEFAULT_COOLDOWN_DAYS,
+    facts: Optional[FactLedger] = None,
+    store: Optional[PuzzleStore] = None,
+) -> tuple[bool, list[str]]:
+    """
+    Fetch and validate a puzzle from the DB for the given date.
+    Returns (is_valid, list_of_issues).
+    """
+    issues = validate_horizon(target_date, 1, entities, entity_cooldown, facts, store)[target_date]
+    return len(issues) == 0, issues
+
+
+def validate_horizon(
+    start_date: date,
+    days: int,
+    entities: Optional[EntityIndex] = None,
+    entity_cooldown: int = DEFAULT_COOLDOWN_DAYS,
+    facts: Optional[FactLedger] = None,
+    store: Optional[PuzzleStore] = None,
+    warnings: Optional[dict[date, list[str]]] = None,
+) -> dict[date, list[str]]:
+    """
+    Issues for every date in [start_date, start_date + days), in date order.
+    The whole range is one BETWEEN query; dates with no row are the calendar
+    dates it didn't return. Warnings go into `warnings` by date when a dict is passed.
+    """
+    last_date = start_date + timedelta(days=days - 1)
+    store = store or PuzzleStore.open()
+    with store.connect() as conn:
+        rows = store.fetch_puzzles(conn, start_date, last_date)
+
+    calendar = [start_date + timedelta(days=i) for i in range(days)]
+    if warnings is None:
+        return {d: validate_row(d, rows.get(d), entities, entity_cooldown, facts) for d in calendar}
+    return {
+        d: validate_row(d, rows.get(d), entities, entity_cooldown, facts, warnings.setdefault(d, []))
+        for d in calendar
+    }
+
+
+def runway(results: dict[date, list[str]]) -> int:
+    """Consecutive valid days from the start of results, i.e. days until the first missing or bad puzzle."""
+    days = 0
+    for d in sorted(results):
+        if results[d]:
+            break
+        days += 1
+    return days
+
+
+def report_date(
+    target_date: date, issues: list[str], alert_on_failure: bool = True, warnings: tuple = (),
+) -> bool:
+    """Log one date's result and warnings (and alert on failure). Returns True if valid."""
+    for warning in warnings:
+        log.warning(f"⚠️  {target_date}: {warning}")
+    if not issues:
+        log.info(f"✅ {target_date}: puzzle is valid")
+        return True
+    log.error(f"❌ {target_date}: {len(issues)} issue(s):")
+    for issue in issues:
+        log.error(f"   - {issue}")
+    if alert_on_failure:
+        ALERTS.add(target_date, *issues)
+    return False
+
+
+def check_date(
+    target_date: date,
+    alert_on_failure: bool = True,
+    entities: Optional[EntityIndex] = None,
+    entity_cooldown: int = DEFAULT_COOLDOWN_DAYS,
+    facts: Optional[FactLedger] = None,
+    store: Optional[PuzzleStore] = None,
+) -> bool:
     """Validate a single date. Returns True if valid."""
     log.info(f"Checking PODIUM puzzle for {target_date}...")
 
     try:
-        is_valid, issues = validate_db_puzzle(target_date)
+        is_valid, issues = validate_db_puzzle(target_date, entities, entity_cooldown, facts, store)
     except Exception as e:
         log.error(f"DB error checking {target_date}: {e}", exc_info=True)
         if alert_on_failure:
-            _send_alert(target_date, [f"DB error: {e}"])
+            ALERTS.add(target_date, f"DB error: {e}")
         return False
 
-    if is_valid:
-        log.info(f"✅ {target_date}: puzzle is valid")
-        return True
-    else:
-        log.error(f"❌ {target_date}: {len(issues)} issue(s):")
-        for issue in issues:
-            log.error(f"   - {issue}")
-        if alert_on_failure:
-            _send_alert(target_date, issues)
-        return False
-
-
-def _send_alert(target_date: date, issues: list[str]) -> None:
-    """Send an openclaw alert when validation fails."""
-    try:
-        issues_str = "\n".join(f"• {i}" for i in issues[:10])
-        msg = (
-            f"⚠️ PODIUM puzzle validation FAILED for {target_date}\n\n"
-            f"Issues:\n{issues_str}\n\n"
-            f"Fix: `cd donecast/backend && PYTHONPATH=. python3 ../podium/scripts/generate_puzzle.py "
-            f"--date {target_date} --force`"
-        )
-        subprocess.run(
-            ["openclaw", "system", "event", "--text", msg, "--mode", "now"],
-            timeout=10, check=False, capture_output=True,
-        )
-        log.info("Alert sent via openclaw")
-    except Exception as e:
-        log.warning(f"Could not send alert: {e}")
+    return report_date(target_date, issues, alert_on_failure)
 
 
 def main() -> int:
@@ -178,6 +212,19 @@ def main() -> int:
         "--days", type=int, default=1,
         help="Number of days to check starting from --date (default: 1)"
     )
+    parser.add_argument(
+        "--entity-cooldown", type=int, default=DEFAULT_COOLDOWN_DAYS, metavar="DAYS",
+        help=f"Warn about items reused within this many days of an earlier puzzle "
+             f"(default: {DEFAULT_COOLDOWN_DAYS}, 0 = off)"
+    )
+    parser.add_argument(
+        "--no-fact-check", action="store_true",
+        help="Don't cross-check sort_values against the fact ledger"
+    )
+    parser.add_argument(
+        "--db", default=os.environ.get(DB_URL_ENV),
+        help=f"Database URL, e.g. sqlite:///podium.db (default: ${DB_URL_ENV}, else the DoneCast backend's)"
+    )
     parser.add_argument(
         "--no-alert", action="store_true",
         help="Skip openclaw alert on failure"
@@ -200,19 +247,55 @@ def main() -> int:
     else:
         start_date = date.today() + timedelta(days=1)
 
-    all_valid = True
-    for i in range(args.days):
-        target = start_date + timedelta(days=i)
-        ok = check_date(target, alert_on_failure=not args.no_alert)
-        if not ok:
-            all_valid = False
+    if args.days < 1:
+        log.error(f"--days must be at least 1 (got {args.days})")
+        return 1
+    last_date = start_date + timedelta(days=args.days - 1)
+    log.info(f"Checking PODIUM puzzles for {start_date} → {last_date} ({args.days} day(s))...")
 
-    if all_valid:
-        log.info(f"All {args.days} day(s) validated ✅")
-        return 0
-    else:
+    store = PuzzleStore.open(args.db)
+    entities = facts = None
+    try:
+        if args.entity_cooldown > 0 or not args.no_fact_check:
+            with store.connect() as conn:
+                if args.entity_cooldown > 0:
+                    entities = build_entity_index(conn)
+                if not args.no_fact_check:
+                    facts = build_fact_ledger(conn)
+        warnings: dict[date, list[str]] = {}
+        results = validate_horizon(start_date, args.days, entities, args.entity_cooldown, facts, store, warnings)
+    except Exception as e:
+        log.error(f"DB error checking {start_date} → {last_date}: {e}", exc_info=True)
+        if not args.no_alert:
+            ALERTS.add(start_date, f"DB error: {e}")
         return 1
 
+    valid = [
+        report_date(d, issues, alert_on_failure=not args.no_alert, warnings=warnings.get(d, ()))
+        for d, issues in results.items()
+    ]
+    missing = sum(1 for d, issues in results.items() if issues == [MISSING.format(d)])
+
+    days_left = runway(results)
+    if days_left == args.days:
+        runway_note = f"at least {days_left} day(s) of runway remaining (through {last_date})"
+    elif days_left:
+        runway_note = f"{days_left} day(s) of runway remaining (through {start_date + timedelta(days=days_left - 1)})"
+    else:
+        runway_note = f"no runway: {start_date} has no valid puzzle"
+
+    if all(valid):
+        log.info(f"All {args.days} day(s) validated ✅ — {runway_note}")
+        return 0
+    log.error(
+        f"{valid.count(False)} of {args.days} day(s) failed ({missing} missing) — {runway_note}"
+    )
+    return 1
+
 
 if __name__ == "__main__":
-    sys.exit(main())
+    try:
+        exit_code = main()
+    finally:
+        ALERTS.close()  # one coalesced alert for every failing date
+    sys.exit(exit_code)